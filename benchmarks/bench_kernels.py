@@ -0,0 +1,42 @@
+'''Benchmark del kernel eta_iter: Python puro vs compilado (numba).
+
+Uso:
+    python benchmarks/bench_kernels.py [N]
+
+Evalua el kernel N veces (por defecto 200000) con datos aleatorios y reporta el tiempo
+por llamada de cada backend y la aceleracion. Si numba no esta instalado solo se reporta
+la version en Python puro.
+'''
+
+import sys
+import time
+import numpy as np
+from steeldesign.modules import kernels
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+rng = np.random.default_rng(0)
+
+# acero SA304 1/4 Hard, tensiones y anchos aleatorios
+FY, E0, offset, n = 344.8, 186200.0, 0.002, 4.58
+FF = rng.uniform(50.0, 2000.0, N).tolist()
+
+cases = {
+    'eta_iter B-5': (kernels.eta_iter, lambda f: [f(x, FY, E0, offset, n, 0.0, 5) for x in FF]),
+    'eta_iter B-4': (kernels.eta_iter, lambda f: [f(x, FY, E0, offset, n, 0.0, 4) for x in FF]),
+}
+
+def timeit(func, run):
+    run(func) # compilacion / calentamiento
+    t0 = time.perf_counter()
+    run(func)
+    return (time.perf_counter() - t0)/N*1e9
+
+print('Backend JIT:', 'numba' if kernels.JIT else 'no disponible (Python puro)')
+print('{:<20}{:>14}{:>14}{:>10}'.format('kernel', 'python [ns]', 'jit [ns]', 'x'))
+for name, (kernel, run) in cases.items():
+    tPy = timeit(kernels.py_func(kernel), run)
+    if kernels.JIT:
+        tJit = timeit(kernel, run)
+        print('{:<20}{:>14.0f}{:>14.0f}{:>10.1f}'.format(name, tPy, tJit, tPy/tJit))
+    else:
+        print('{:<20}{:>14.0f}{:>14}{:>10}'.format(name, tPy, '-', '-'))
@@ -26,8 +26,8 @@ analysis = sd.ASCE_8_02(m)
 fiPn, midC = analysis.s3_4()
 
 print('fiPn =', round(fiPn,2),'| Pn =', round(midC['Fn_FBy']*midC['Ae'],2))
-print('Esbeltez de', m.profile.elements[1]['name'],'=', round(m.profile.elements[1]['sec 3.4-fiPn']['esbeltez'],2))
-print('Esbeltez de', m.profile.elements[2]['name'],'=', round(m.profile.elements[2]['sec 3.4-fiPn']['esbeltez'],2))
+print('Esbeltez de', m.profile.elements[1]['name'],'=', round(analysis.results['sec 3.4-fiPn'][1]['esbeltez'],2))
+print('Esbeltez de', m.profile.elements[2]['name'],'=', round(analysis.results['sec 3.4-fiPn'][2]['esbeltez'],2))
 
 # Valores de referencia:    fiPn = 19.53 | Pn = 22.98
 # Valores de steeldesign:   fiPn = 19.78 | Pn = 23.27
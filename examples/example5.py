@@ -25,9 +25,9 @@ analysis = sd.ASCE_8_02(m)
 fiPn, midC = analysis.s3_4()
 
 print('fiPn =', round(fiPn,2),'| Pn =', round(midC['Fn']*midC['Ae'],2))
-print('Esbeltez de', m.profile.elements[1]['name'],'=', m.profile.elements[1]['sec 3.4-fiPn']['esbeltez'])
-print('Esbeltez de', m.profile.elements[2]['name'],'=', round(m.profile.elements[2]['sec 3.4-fiPn']['esbeltez'],3))
-print('Esbeltez de', m.profile.elements[3]['name'],'=', round(m.profile.elements[3]['sec 3.4-fiPn']['esbeltez'],3))
+print('Esbeltez de', m.profile.elements[1]['name'],'=', analysis.results['sec 3.4-fiPn'][1]['esbeltez'])
+print('Esbeltez de', m.profile.elements[2]['name'],'=', round(analysis.results['sec 3.4-fiPn'][2]['esbeltez'],3))
+print('Esbeltez de', m.profile.elements[3]['name'],'=', round(analysis.results['sec 3.4-fiPn'][3]['esbeltez'],3))
 
 # Valores de referencia:    fiPn = 62.93 | Pn = 74.04
 # Valores de steeldesign:   fiPn = 62.5 | Pn = 73.53
@@ -1,2 +1,3 @@
 from .modules.design import ASCE_8_02, member, designParameters
-from .modules.properties import *
\ No newline at end of file
+from .modules.properties import *
+from .modules import batch, config, loadTables, interaction, demand, momentGradient, fsm, serviceability, fiber
\ No newline at end of file
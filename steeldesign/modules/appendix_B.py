@@ -1,7 +1,19 @@
 '''Ecuaciones del Apéndice B de ASCE - 8 - 02
 
+    B_1, B_2 y eta se compilan con numba si esta disponible (ver jit) y se usan tanto desde Python como
+    dentro de los kernels compilados (kernels.eta_iter).
+
+    Variables
+    ---------
+        EQ_CODES : dict
+            Codigo entero de cada ecuacion del factor de plasticidad {'B-3': 3, 'B-4': 4, 'B-5': 5}
 '''
 
+from .jit import njit
+
+EQ_CODES = {'B-3': 3, 'B-4': 4, 'B-5': 5}
+
+@njit(cache=True)
 def B_1(FY, E0, offset, n, s):
     '''Modulo elasticidad secante segun Eq B-1
 
@@ -36,6 +48,7 @@ def B_1(FY, E0, offset, n, s):
     Es = E0 / (1 + offset*E0* ( s**(n-1)/(FY**n)) )
     return Es
 
+@njit(cache=True)
 def B_2(FY, E0, offset, n, s):
     '''Modulo elasticidad tangente segun Eq B-2
 
@@ -68,42 +81,39 @@ def B_2(FY, E0, offset, n, s):
 
     '''
     Et = E0*FY/(FY+offset*n*E0* (s/FY)**(n-1))
-    return Et   
+    return Et
 
-
-def B_1(FY, E0, offset, n, s):
-    '''Modulo elasticidad secante segun Eq B-1
+@njit(cache=True)
+def eta(FY, E0, offset, n, s, eq):
+    '''Factor de plasticidad segun Eq B-3, B-4 o B-5
 
     Parameters
     ----------
-    E0 : float
-        Modulo elasticidad inicial
-    FY : float
-        Tension de fluencia con una deformacion permanente de offset
-    offset : float
-        Valor de deformacion permanente a la que se obtuvo FY
-    n : float
-        Exponente de Ramberg-Osgood
-    s : float
-        Tension a la que se debe determinar Es
+    FY, E0, offset, n, s : float
+        Ver B_1
+    eq : int
+        Codigo de la ecuacion (ver EQ_CODES)
+        3 : B-3 sqrt(Et/E0)
+        4 : B-4 Es/E0
+        5 : B-5 Et/E0
 
     Returns
     ----------
     float
-        Modulo secante Es para la tension s
-
-    Raises
-    ------
-    none
+        Factor de plasticidad para la tension s
 
     Tests
     -----
-    >>> round( B_1(344.8, 186200,  0.002, 4.58, 159.3), 2)
-    174334.98
+    >>> round( eta(344.8, 186200.0, 0.002, 4.58, 159.3, EQ_CODES['B-5']), 4)
+    0.7624
 
     '''
-    Es = E0 / (1 + offset*E0* ( s**(n-1)/(FY**n)) )
-    return Es
+    if eq == 4:
+        return B_1(FY, E0, offset, n, s)/E0
+    Et = B_2(FY, E0, offset, n, s)
+    if eq == 3:
+        return (Et/E0)**0.5
+    return Et/E0
 
 def TableA12(tau):
     '''Coeficiente de plasticidad para pandeo de columnas o LTB de vigas, segun Eq B-5.
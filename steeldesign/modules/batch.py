@@ -0,0 +1,199 @@
+'''Analisis vectorizados sobre lotes de miembros.
+
+    Cada funcion recibe una lista de analisis (class ASCE_8_02), arma arrays con las propiedades de los
+    perfiles y aceros y resuelve todos los miembros a la vez con las versiones vectorizadas de la seccion 2.
+    Los resultados son los mismos que los de los metodos escalares de ASCE_8_02, con las mismas tolerancias.
+
+    Functions
+    ---------
+        s3_3_1_1_y : function
+            Resistencia a flexion respecto del eje y (3.3.1.1, procedimiento I) de perfiles C con labios.
+        s3_3_1_1_PII : function
+            Resistencia nominal a flexion respecto del eje x (3.3.1.1, procedimiento II) con secciones de fibras.
+'''
+
+import numpy as np
+from .functions import effectiveSection_y
+from .sec_3 import sec3_3_1_1
+from .fiber import strainLimitMoment
+
+
+def _profileArrays(analyses, names):
+    '''Array con el atributo name de cada perfil, para cada name en names.'''
+    return [np.array([getattr(a.member.profile, name) for a in analyses], dtype= float) for name in names]
+
+def _compFlange(profile):
+    '''Tipo de ala comprimida para sec3_3_1_1, igual que en ASCE_8_02.s3_3_1_1_y.'''
+    comp_flange = 'UNSTIFF'
+    for element in profile.elements.values():
+        if element['name'] == 'flange':
+            if element['type'] == 'stiffned_w_slps':
+                comp_flange = 'STIFF'
+            elif element['type'] == 'unstiffned':
+                comp_flange = 'UNSTIFF'
+    return comp_flange
+
+def s3_3_1_1_y(analyses, Cs = 1, tol = 0.005, maxIter = 50, f0 = None):
+    '''Resistencia de diseno a flexion respecto del eje y (3.3.1.1 procedimiento I) para un lote de perfiles
+    C con labios. Version vectorizada de ASCE_8_02.s3_3_1_1_y y ASCE_8_02.s3_Se_effective_y_FY: para cada
+    miembro se resuelve fc - FY*min(1, xc/xt) = 0 en [0, FY] con secante y biseccion de resguardo.
+
+    Parameters
+    ----------
+        analyses : list of ASCE_8_02
+            Analisis de miembros con perfiles 'c_w_lps'
+        Cs : int [-1, +1]
+            +1: centro de corte a compresion, -1 centro de corte a traccion
+        tol : float
+            Tolerancia relativa en fc
+        maxIter : int
+            Numero maximo de iteraciones
+        f0 : array
+            Tensiones iniciales. Por defecto las de la seccion bruta
+
+    Returns
+    -------
+        fiMny : array
+            Resistencia de diseno a flexion de cada miembro
+        midC : dict
+            {'Sey', 'fc', 'Mn_no', 'fi_no', 'nIter', 'converged'} como arrays
+    Raises
+    ------
+        Exception : si algun perfil no es del tipo 'c_w_lps'
+
+    Tests
+    -----
+        >>> from steeldesign import ASCE_8_02, member, designParameters, c_w_lps_profile, steel
+        >>> s = steel(FY= 337, E0= 180510.0, nu= 0.3, n= 13.5, offset= 0.002, name= 'SA304_1_4Hard')
+        >>> analyses = []
+        >>> for H in [100, 150]:
+        ...     p = c_w_lps_profile(H= H, B= 50, D= 12, t= 1.5, r_out= 3.75)
+        ...     p.calculate()
+        ...     analyses.append(ASCE_8_02(member(L= 1000, profile= p, steel= s, designParameters= designParameters())))
+        >>> fiMny_plus, midC_plus = s3_3_1_1_y(analyses, Cs= +1)
+        >>> fiMny_minus, midC_minus = s3_3_1_1_y(analyses, Cs= -1)
+        >>> for i, a in enumerate(analyses):
+        ...     plus, minus, _ = a.s3_3_1_1_y()
+        ...     print(abs(fiMny_plus[i]/plus - 1) < 1e-3, abs(fiMny_minus[i]/minus - 1) < 1e-3, midC_plus['fi_no'][i])
+        True True 0.9
+        True True 0.9
+    '''
+    for a in analyses:
+        if a.member.profile.type != 'c_w_lps':
+            print('Perfil', a.member.profile.name, 'del tipo', a.member.profile.type, 'no soportado en batch.s3_3_1_1_y. Usar ASCE_8_02.s3_3_1_1_y()')
+            raise Exception('>> Analisis abortado <<')
+    if Cs not in [-1, 1]:
+        print('Cs =', Cs, 'no reconocido. Valores admitidos: +1, -1')
+        raise Exception('>> Analisis abortado <<')
+
+    names = ['t', 'B', 'c_x', 'r_out', 'A', 'Iy']
+    p = dict(zip(names, _profileArrays(analyses, names)))
+    for key, key_p in [('wFlange', 1), ('wWeb', 2), ('wLip', 3)]:
+        p[key] = np.array([a.member.profile.elements[key_p]['w'] for a in analyses], dtype= float)
+    p['E0'] = np.array([a.member.steel.E0 for a in analyses], dtype= float)
+    FY = np.array([a.member.steel.FY for a in analyses], dtype= float)
+
+    # root_iter vectorizado
+    lo = np.zeros_like(FY)
+    hi = FY.copy()
+    if f0 is None:
+        xc0 = p['c_x'] if Cs > 0 else p['B'] - p['c_x']
+        f0 = FY*np.minimum(1.0, xc0/(p['B'] - xc0))
+    x = np.clip(np.asarray(f0, dtype= float), lo, hi)
+    xPrev = np.full_like(x, np.nan)
+    rPrev = np.full_like(x, np.nan)
+    cx = np.full_like(x, np.nan)
+    Sey = np.zeros_like(x)
+    fc = x.copy()
+    nIter = np.zeros(x.shape, dtype= int)
+    active = np.ones(x.shape, dtype= bool)
+    converged = np.zeros(x.shape, dtype= bool)
+    while active.any() and nIter.max() < maxIter:
+        SeyNew, rSe = effectiveSection_y(x, Cs, p, cx0= cx, tol= tol, maxIter= 100)
+        cxNew, xc, xt = rSe['cx'], rSe['xc'], rSe['xt']
+        r = x - FY*np.minimum(1.0, xc/xt)
+        Sey = np.where(active, SeyNew, Sey)
+        cx = np.where(active, cxNew, cx)
+        fc = np.where(active, x, fc)
+        nIter = nIter + active
+
+        err = np.abs(r/x)
+        lo = np.where(active & (r < 0), x, lo)
+        hi = np.where(active & (r >= 0), x, hi)
+        done = (err <= tol) | (hi - lo <= tol*np.abs(x))
+        converged = converged | (active & done)
+        active = active & ~done
+
+        secant = ~np.isnan(xPrev) & (r != rPrev)
+        with np.errstate(divide= 'ignore', invalid= 'ignore'):
+            xNew = np.where(secant, x - r*(x - xPrev)/(r - rPrev), x - r)
+        xNew = np.where((lo < xNew) & (xNew < hi), xNew, 0.5*(lo + hi))
+        xPrev, rPrev = np.where(active, x, xPrev), np.where(active, r, rPrev)
+        x = np.where(active, xNew, x)
+    if active.any():
+        print('batch.s3_3_1_1_y: se alcanzo el numero maximo de iteraciones en', int(active.sum()), 'miembros')
+
+    fiMn, Mn, fi = np.zeros((3,) + x.shape)
+    for i, a in enumerate(analyses):
+        fiMn[i], midC = sec3_3_1_1(FY= FY[i], Se= Sey[i], comp_flange= _compFlange(a.member.profile))
+        Mn[i], fi[i] = midC['Mn_no'], midC['fi_no']
+    return fiMn, {'Sey': Sey, 'fc': fc, 'Mn_no': Mn, 'fi_no': fi, 'nIter': nIter, 'converged': converged}
+
+def s3_3_1_1_PII(analyses, tol = 1e-9, maxIter = 100):
+    '''Resistencia de diseno a flexion respecto del eje x segun 3.3.1.1 procedimiento II para un lote de miembros.
+    Version vectorizada de ASCE_8_02.s3_3_1(procedure= 'PII') sin pandeo lateral: las secciones de fibras de todos
+    los miembros (s3_fiberSection) se completan con fibras de area nula hasta igual longitud y se resuelven en una
+    sola llamada a fiber.strainLimitMoment.
+
+    Parameters
+    ----------
+        analyses : list of ASCE_8_02
+            Analisis de miembros con perfiles soportados por fiber.profileFibers
+        tol : float
+            Tolerancia de equilibrio (ver fiber.strainLimitMoment)
+        maxIter : int
+            Numero maximo de iteraciones
+
+    Returns
+    -------
+        fiMn : array
+            Resistencia de diseno a flexion de la seccion de cada miembro
+        midC : dict
+            {'Mn_no', 'fi_no', 'Mcu', 'yn', 'Cy', 'PII_applicable'} como arrays
+
+    Tests
+    -----
+        Igual resultado que el Procedimiento II de cada miembro por separado
+        >>> from steeldesign import ASCE_8_02, member, designParameters, c_w_lps_profile, steel
+        >>> s = steel(FY= 337, E0= 180510.0, nu= 0.3, n= 13.5, offset= 0.002, name= 'SA304_1_4Hard')
+        >>> analyses = []
+        >>> for H in [60, 80]:
+        ...     p = c_w_lps_profile(H= H, B= 30, D= 8, t= 3, r_out= 4.5)
+        ...     p.calculate()
+        ...     analyses.append(ASCE_8_02(member(L= 10, profile= p, steel= s, designParameters= designParameters())))
+        >>> fiMn, midC = s3_3_1_1_PII(analyses)
+        >>> for i, a in enumerate(analyses):
+        ...     _, midC_i = a.s3_3_1(procedure= 'PII')
+        ...     print(abs(fiMn[i]/midC_i['fiMn_no'] - 1) < 1e-6, bool(midC['PII_applicable'][i]))
+        True True
+        True True
+    '''
+    sections = [a.s3_fiberSection()[0] for a in analyses]
+    strains = [a._s3_3_1_1_PII_strain()[0] for a in analyses]
+    nf = max(section.y.size for section in sections)
+    y = np.zeros((len(sections), nf))
+    A = np.zeros((len(sections), nf))
+    for i, section in enumerate(sections):
+        y[i, :section.y.size] = section.y
+        A[i, :section.A.size] = section.A
+    mat = [np.array([getattr(a.member.steel, name) for a in analyses], dtype= float) for name in ['E0', 'FY', 'n', 'offset']]
+    yTop = np.array([section.yTop for section in sections], dtype= float)
+    Mcu, yn, kappa = strainLimitMoment(y, A, yTop, np.array(strains), *mat, tol= tol, maxIter= maxIter)
+
+    fiMn, midC = [], {key: [] for key in ['Mn_no', 'fi_no', 'Mcu', 'yn', 'Cy', 'PII_applicable']}
+    for i, a in enumerate(analyses):
+        fiMn_i, midC_i = a._s3_3_1_1_PII(solution= (Mcu[i], yn[i], kappa[i]))
+        fiMn.append(fiMn_i)
+        for key in midC:
+            midC[key].append(midC_i[key])
+    return np.array(fiMn), {key: np.array(value) for key, value in midC.items()}
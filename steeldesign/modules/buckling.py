@@ -0,0 +1,144 @@
+'''Tensiones criticas elasticas de pandeo de un miembro, evaluadas una sola vez.
+
+    Los estados limites de pandeo flexional (FB), torsional (TB), flexo-torsional (FTB) y lateral
+    (LTB) comparten las mismas magnitudes intermedias: x0, r0 (Ec 3.3.1.2-9), sigma_ex y sigma_ey
+    (Ec 3.3.1.2-6) y sigma_t (Ec 3.3.1.2-8). elasticBuckling las organiza como un grafo de
+    dependencias que se evalua de forma perezosa: cada nodo se calcula la primera vez que se lo
+    pide y se reutiliza en los modos que dependen de el.
+
+    Todos los valores son con eta = 1 (FF de eta_iter). Fn() resuelve juntos los puntos fijos
+    s = FF*eta(s) de los modos pedidos y limita el resultado a FY.
+
+    Classes
+    -------
+        elasticBuckling : class
+            Grafo de tensiones criticas elasticas de un miembro.
+'''
+
+import numpy as np
+from .sec_3 import E_3_3_1_2_e2, E_3_3_1_2_e4, E_3_3_1_2_e6, E_3_3_1_2_e8, E_3_3_1_2_e9
+from .functions import eta_iter, eta_iter_vec
+
+
+class elasticBuckling():
+    '''Tensiones criticas elasticas (eta = 1) de los modos de pandeo de un miembro.
+
+    Parameters
+    ----------
+        profile : class profile
+            Perfil del miembro
+        steel : class steel
+            Acero del miembro
+        Kx, Ky, Kz, Lx, Ly, Lz : float or array
+            Factores y longitudes de pandeo (ver ASCE_8_02._bucklingLengths)
+        L : float or array
+            Longitud sin soporte lateral para Ec 3.3.1.2-2 (perfiles I)
+        Cb : float or array
+            Coeficiente de flexion para el pandeo lateral
+
+    Nodes
+    -----
+        x0, r0, beta : geometria respecto del centro de corte
+        s_ex, s_ey, s_t : tensiones criticas de Ec 3.3.1.2-6 (x, y) y 3.3.1.2-8
+        Mc_eta : momento critico de pandeo lateral dividido por eta (3.3.1.2)
+        FBx, FBy, TB, FTB, LTB : tension critica de cada modo (LTB = Mc_eta/Sx)
+
+    Methods
+    -------
+        __getitem__(node) :
+            Valor del nodo, calculado una sola vez
+        Fn(modes) :
+            Tension nominal de cada modo resolviendo s = FF*eta(s), limitada a FY
+
+    Tests
+    -----
+        Example 9.1 - C-section w/lateral buckling consideration (ver sec3_3_1_2_3_i)
+        >>> class p:
+        ...     type, rx, ry, c_x, sc_x, A, Cw, J, Sx = 'cee', 2.47, 0.40, 0.217, -0.417, 1.284, 1.819, 0.0078, 1.0
+        >>> class s: E0, G0, FY = 27000, 10500, 30.0
+        >>> g = elasticBuckling(p, s, Kx= 1.0, Ky= 1.0, Kz= 1.0, Lx= 30.0, Ly= 30.0, Lz= 30.0, L= 30.0, Cb= 1.685)
+        >>> round(g['Mc_eta'], 2), round(g['s_t'], 2), sorted(g.values)
+        (327.35, 72.53, ['Mc_eta', 'r0', 's_ey', 's_t', 'x0'])
+    '''
+    def __init__(self, profile, steel, Kx, Ky, Kz, Lx, Ly, Lz, L = None, Cb = 1.0):
+        self.profile = profile
+        self.steel = steel
+        self.lengths = {'Kx': Kx, 'Ky': Ky, 'Kz': Kz, 'Lx': Lx, 'Ly': Ly, 'Lz': Lz, 'L': L, 'Cb': Cb}
+        self.values = {}
+
+    def __getitem__(self, node):
+        if node not in self.values:
+            self.values[node] = getattr(self, '_' + node)()
+        return self.values[node]
+
+    # nodos del grafo
+    def _x0(self):
+        return -abs(self.profile.c_x - self.profile.sc_x) # distancia desde el centroide al centro de corte, negativo
+
+    def _r0(self):
+        return E_3_3_1_2_e9(rx= self.profile.rx, ry= self.profile.ry, x0= self['x0'])
+
+    def _beta(self):
+        return 1 - (self['x0']/self['r0'])**2
+
+    def _s_ex(self):
+        return E_3_3_1_2_e6(E0= self.steel.E0, K= self.lengths['Kx'], L= self.lengths['Lx'], r= self.profile.rx)
+
+    def _s_ey(self):
+        return E_3_3_1_2_e6(E0= self.steel.E0, K= self.lengths['Ky'], L= self.lengths['Ly'], r= self.profile.ry)
+
+    def _s_t(self):
+        p = self.profile
+        return E_3_3_1_2_e8(E0= self.steel.E0, Kt= self.lengths['Kz'], Lt= self.lengths['Lz'], r0= self['r0'],
+                            A= p.A, Cw= p.Cw, G0= self.steel.G0, J= p.J)
+
+    def _Mc_eta(self):
+        p = self.profile
+        if p.type in ['I_builtup_cee', 'I_builtup_cee_w_lps']:  # perfil I - aplica CASE I
+            return E_3_3_1_2_e2(E0= self.steel.E0, Cb= self.lengths['Cb'], d= p.H, Iyc= p.Iy/2, L= self.lengths['L'])
+        elif p.type in ['cee', 'c_w_lps']:  # perfil C - aplica CASE III (flexion alrededor del eje de simetria)
+            return E_3_3_1_2_e4(Cb= self.lengths['Cb'], r0= self['r0'], A= p.A, sigma_ey_eta= self['s_ey'], sigma_t_eta= self['s_t'])
+        print('Seccion del tipo', p.type,'no implementada en analisis 3.3.1.2.')
+        raise NotImplementedError
+
+    def _FBx(self):
+        return self['s_ex']
+
+    def _FBy(self):
+        return self['s_ey']
+
+    def _TB(self):
+        return self['s_t']
+
+    def _FTB(self):
+        # Ec 3.4.3-1 con eta = 1
+        s_ex, s_t, beta = self['s_ex'], self['s_t'], self['beta']
+        raiz = ( (s_ex + s_t)**2 - 4*beta*s_ex*s_t )**0.5
+        return 1/2/beta*(s_ex + s_t - raiz)
+
+    def _LTB(self):
+        return self['Mc_eta']/self.profile.Sx
+
+    def Fn(self, modes = ('FBx', 'FBy', 'TB', 'FTB')):
+        '''Tension nominal de cada modo: solucion de s = FF*eta(s) limitada a FY.
+
+            Con longitudes escalares se resuelve cada modo con eta_iter. Con arrays, los puntos fijos de
+            todos los modos se apilan y se resuelven en una sola llamada a eta_iter_vec.
+
+        Parameters
+        ----------
+            modes : list of string
+                Modos a resolver (FBx, FBy, TB, FTB, LTB)
+        Returns
+        -------
+            Fn : dict
+                {mode: Fn}
+        '''
+        FY = self.steel.FY
+        FF = [self[mode] for mode in modes]
+        if all(np.ndim(FF_i) == 0 for FF_i in FF):
+            Fn = [eta_iter(FF_i, self.steel) for FF_i in FF]
+            return {mode: FY if Fn_i > FY else Fn_i for mode, Fn_i in zip(modes, Fn)}
+        FF = np.broadcast_arrays(*FF)
+        Fn = np.minimum(eta_iter_vec(np.stack(FF), self.steel), FY)
+        return dict(zip(modes, Fn))
@@ -0,0 +1,61 @@
+'''Cache de resultados que dependen solo del perfil y del acero.
+
+    Los resultados se guardan por combinacion (perfil, acero) y los comparten todos los miembros y
+    analisis que usan esa combinacion. La clave del perfil se arma con sus atributos escalares
+    (dimensiones y propiedades de seccion), por lo que modificar una propiedad del perfil (e.g. ry)
+    genera una entrada nueva en lugar de devolver resultados desactualizados.
+
+    Functions
+    ---------
+        sectionKey : function
+            Clave del perfil a partir de sus atributos escalares.
+        sectionCache : function
+            Diccionario de resultados compartido para (perfil, acero).
+        clear : function
+            Vacia el cache.
+
+    Tests
+    -----
+        >>> class p: pass
+        >>> class s: key = (337, 180510.0, 0.3, 13.5, 0.002)
+        >>> p1 = p(); p1.A, p1.t = 319.04, 1.5
+        >>> sectionCache(p1, s)['Ae'] = 1
+        >>> p2 = p(); p2.A, p2.t = 319.04, 1.5
+        >>> sectionCache(p2, s)
+        {'Ae': 1}
+        >>> p2.t = 2.0
+        >>> sectionCache(p2, s)
+        {}
+        >>> clear()
+'''
+
+_sections = {}
+
+def sectionKey(profile):
+    '''Clave del perfil: tupla ordenada de sus atributos numericos y de texto.'''
+    return tuple(sorted((k, v) for k, v in vars(profile).items() if isinstance(v, (int, float, str))))
+
+def sectionCache(profile, steel):
+    '''Devuelve el diccionario de resultados compartido para la combinacion (profile, steel).
+
+    Parameters
+    ----------
+        profile : class profile
+            Perfil de la seccion
+        steel : class steel
+            Acero, identificado por steel.key
+
+    Returns
+    -------
+        cache : dict
+            Resultados ya calculados para esta combinacion
+    '''
+    key = (sectionKey(profile), steel.key)
+    cache = _sections.get(key)
+    if cache is None:
+        cache = _sections.setdefault(key, {})
+    return cache
+
+def clear():
+    '''Vacia el cache de todas las secciones.'''
+    _sections.clear()
@@ -0,0 +1,49 @@
+'''Opciones globales de ejecucion.
+
+    Variables
+    ---------
+        TRACE : bool
+            True (por defecto): los analisis registran los resultados intermedios (analysis.results con los
+            anchos efectivos de cada elemento por origen, diccionarios midC y nEffAreas).
+            False (modo lean): solo se calculan las resistencias; los metodos devuelven None en lugar de midC
+            y no completan analysis.results.
+
+    Functions
+    ---------
+        setTrace(trace) :
+            Cambia el modo por defecto.
+        traceMode(trace) :
+            Context manager que cambia el modo por defecto dentro de un bloque with.
+
+    El modo tambien se puede indicar por analisis (ASCE_8_02(member, trace= False)) o por llamada
+    (e.g. analysis.s3_4(trace= False)). Prioridad: llamada, analisis, TRACE.
+
+    Tests
+    -----
+        >>> from . import config
+        >>> with traceMode(False):
+        ...     config.TRACE
+        False
+        >>> config.TRACE
+        True
+'''
+
+from contextlib import contextmanager
+
+TRACE = True
+
+def setTrace(trace):
+    '''Fija el modo por defecto: True registra los resultados intermedios, False modo lean.'''
+    global TRACE
+    TRACE = bool(trace)
+
+@contextmanager
+def traceMode(trace):
+    '''Cambia el modo por defecto dentro de un bloque with y lo restablece al salir.'''
+    global TRACE
+    previous = TRACE
+    TRACE = bool(trace)
+    try:
+        yield
+    finally:
+        TRACE = previous
@@ -0,0 +1,192 @@
+'''Curvas precalculadas de propiedades efectivas en funcion de la tension.
+
+    Para un perfil y un acero dados, las propiedades efectivas dependen solo de la tension de
+    trabajo. Se evaluan una vez sobre una grilla adaptiva entre 0 y FY y luego se interpolan
+    linealmente, de modo que las consultas repetidas (barridos de longitud, s3_4, ...) no vuelven
+    a recorrer los elementos del perfil.
+
+    Classes
+    -------
+        AeCurve : class
+            Area efectiva Ae(f) y anchos efectivos b(f) de cada elemento (seccion 2).
+        SeCurve : class
+            Modulo resistente efectivo Se(f), inercia efectiva Ie(f) y corrimiento del eje neutro cy(f).
+'''
+
+import numpy as np
+
+
+class AeCurve():
+    '''Curva Ae(f) entre 0 y FY para miembros a compresion, con los anchos efectivos de cada elemento.
+
+    La grilla se refina por biseccion hasta que en cada intervalo |Ae(f_i) - Ae(f_i+1)| <= tol*A.
+    Como Ae(f) es monotona decreciente, el valor exacto y el interpolado quedan ambos entre Ae(f_i)
+    y Ae(f_i+1), por lo que el error de interpolacion esta acotado por errorBound <= tol*A. La
+    monotonia se verifica sobre los nodos (atributo monotone).
+
+    Parameters
+    ----------
+        analysis : class ASCE_8_02
+            Analisis del miembro, se usa su metodo s2_Ae_compMemb_vec
+        tol : float
+            Cota del error de interpolacion relativo al area bruta A
+        nPoints : int
+            Cantidad de puntos de la grilla inicial
+        maxPoints : int
+            Cantidad maxima de puntos de la grilla
+
+    Attributes
+    ----------
+        f : array
+            Tensiones de la grilla
+        Ae : array
+            Area efectiva en cada tension de la grilla
+        be : dict
+            Anchos efectivos de cada elemento en la grilla {key: array}
+        errorBound : float
+            Cota del error absoluto de Ae interpolada
+        monotone : bool
+            True si Ae es no creciente en los nodos de la grilla
+
+    Methods
+    -------
+        __call__(f) :
+            Ae interpolada para f (float o array)
+        b(f, key) :
+            Ancho efectivo interpolado del elemento key
+
+    Tests
+    -----
+        >>> class a:
+        ...     class member:
+        ...         class steel: FY = 200.0
+        ...         class profile: A = 100.0
+        ...     def s2_Ae_compMemb_vec(self, f):
+        ...         return 100.0 - 0.1*f, {1: 50.0 - 0.05*f}
+        >>> c = AeCurve(a(), tol= 1e-3)
+        >>> round(float(c(150.0)), 6), round(float(c.b(150.0, 1)), 6), c.monotone
+        (85.0, 42.5, True)
+        >>> c.errorBound <= 1e-3*100.0
+        True
+    '''
+    def __init__(self, analysis, tol = 1e-3, nPoints = 17, maxPoints = 4097):
+        self.FY = analysis.member.steel.FY
+        self.tol = tol
+        A = analysis.member.profile.A
+
+        f = np.linspace(0.0, self.FY, nPoints)
+        Ae, be = analysis.s2_Ae_compMemb_vec(f)
+        Ae = np.broadcast_to(np.asarray(Ae, dtype= float), f.shape).copy()
+        be = {key: np.broadcast_to(np.asarray(b, dtype= float), f.shape).copy() for key, b in be.items()}
+
+        while True:
+            refine = np.abs(np.diff(Ae)) > tol*A
+            if not refine.any() or f.size + refine.sum() > maxPoints:
+                break
+            fNew = 0.5*(f[:-1][refine] + f[1:][refine])
+            AeNew, beNew = analysis.s2_Ae_compMemb_vec(fNew)
+            index = np.searchsorted(f, fNew)
+            f = np.insert(f, index, fNew)
+            Ae = np.insert(Ae, index, AeNew)
+            be = {key: np.insert(b, index, beNew[key]) for key, b in be.items()}
+
+        self.f = f
+        self.Ae = Ae
+        self.be = be
+        self.errorBound = float(np.abs(np.diff(Ae)).max()) if f.size > 1 else 0.0
+        self.monotone = bool(np.all(np.diff(Ae) <= 1e-12*A))
+        if self.errorBound > tol*A:
+            print('Advertencia: AeCurve alcanzo maxPoints =', maxPoints, 'con errorBound =', self.errorBound, '> tol*A =', tol*A)
+
+    def __call__(self, f):
+        '''Ae interpolada para f. Fuera de [0, FY] se toma el valor del extremo.'''
+        return np.interp(f, self.f, self.Ae)
+
+    def b(self, f, key):
+        '''Ancho efectivo interpolado del elemento key de profile.elements.'''
+        return np.interp(f, self.f, self.be[key])
+
+
+class SeCurve():
+    '''Curvas Se(f), Ie(f) y cy(f) de flexion respecto del eje x, para tensiones f en el ala comprimida entre 0 y fMax.
+
+    Se recorre la grilla en orden creciente de tension y cada s3_Se_effective parte (yMAX0) de la solucion en
+    la tension anterior, por lo que la mayoria de los puntos convergen en una o dos iteraciones. En f = 0 la
+    seccion es totalmente efectiva (Se = Ix/(H/2), cy = 0). Luego las consultas se interpolan linealmente.
+    El barrido se ejecuta en modo lean: no se registran resultados intermedios en los elementos.
+
+    Parameters
+    ----------
+        analysis : class ASCE_8_02
+            Analisis del miembro, se usa su metodo s3_Se_effective
+        nPoints : int
+            Cantidad de puntos de la grilla
+        fMax : float
+            Tension maxima de la grilla. Por defecto FY
+        tol : float
+            Tolerancia de s3_Se_effective
+
+    Attributes
+    ----------
+        f : array
+            Tensiones de la grilla
+        Se, Ie, cy : array
+            Modulo resistente efectivo, inercia efectiva y corrimiento del eje neutro en la grilla
+        nIter : array
+            Iteraciones de s3_Se_effective en cada punto
+
+    Methods
+    -------
+        __call__(f) :
+            Se interpolado para f (float o array)
+        Ix(f) :
+            Inercia efectiva interpolada
+        y(f) :
+            Corrimiento del eje neutro interpolado
+
+    Tests
+    -----
+        >>> class a:
+        ...     class member:
+        ...         class steel: FY = 100.0
+        ...         class profile: Ix, H = 1000.0, 10.0
+        ...     def s3_Se_effective(self, fFlange, tol = 0.005, yMAX0 = None, telemetry = None, trace = None):
+        ...         cy = fFlange/100.0
+        ...         telemetry.update({'nIter': 1, 'yMAX': [5.0 + cy]})
+        ...         return (1000.0 - fFlange)/(5.0 + cy), {}
+        >>> c = SeCurve(a(), nPoints= 11)
+        >>> round(float(c(0.0)), 3), round(float(c.Ix(55.0)), 3), round(float(c.y(55.0)), 3)
+        (200.0, 945.0, 0.55)
+    '''
+    def __init__(self, analysis, nPoints = 51, fMax = None, tol = 0.005):
+        profile = analysis.member.profile
+        fMax = analysis.member.steel.FY if fMax is None else fMax
+        self.f = np.linspace(0.0, fMax, nPoints)
+        self.Se = np.zeros(nPoints)
+        self.Ie = np.zeros(nPoints)
+        self.cy = np.zeros(nPoints)
+        self.nIter = np.zeros(nPoints, dtype= int)
+
+        # f = 0: seccion totalmente efectiva
+        yMAX = profile.H/2
+        self.Se[0] = profile.Ix/yMAX
+        self.Ie[0] = profile.Ix
+        for i in range(1, nPoints):
+            telemetry = {}
+            self.Se[i], _ = analysis.s3_Se_effective(self.f[i], tol= tol, yMAX0= yMAX, telemetry= telemetry, trace= False)
+            yMAX = telemetry['yMAX'][-1]
+            self.cy[i] = yMAX - profile.H/2
+            self.Ie[i] = self.Se[i]*yMAX
+            self.nIter[i] = telemetry['nIter']
+
+    def __call__(self, f):
+        '''Se interpolado para f. Fuera de [0, fMax] se toma el valor del extremo.'''
+        return np.interp(f, self.f, self.Se)
+
+    def Ix(self, f):
+        '''Inercia efectiva interpolada para f.'''
+        return np.interp(f, self.f, self.Ie)
+
+    def y(self, f):
+        '''Corrimiento del eje neutro (cy) interpolado para f.'''
+        return np.interp(f, self.f, self.cy)
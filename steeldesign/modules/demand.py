@@ -0,0 +1,121 @@
+'''Reduccion de nubes de demanda antes de las verificaciones de interaccion.
+
+    Las utilizaciones de 3.3.3 (|Mu|, |Vu|) y de 3.5 (Pu, |Mu_x|, |Mu_y|) son no decrecientes en cada
+    solicitacion. Por lo tanto el maximo sobre un conjunto de puntos se alcanza en un punto maximal de Pareto:
+    un punto dominado (otro punto es mayor o igual en todas las componentes) nunca puede gobernar. Se
+    descartan los puntos dominados y se conserva el mismo maximo exacto.
+
+    La envolvente convexa no se usa: Ec 3.5-1 no es convexa en (Pu, Mu) por la amplificacion 1/alpha_n, de
+    modo que un punto interior a la envolvente puede gobernar. La frontera de Pareto es valida para cualquier
+    verificacion monotona.
+
+    En 3.5 la utilizacion cambia de ecuacion en Pu/fiPn = 0.15 (y puede bajar al pasar a Ec 3.5-1), y fiMn_y
+    depende del signo de Mu_y: la reduccion se hace por separado en cada grupo, donde la utilizacion es monotona.
+
+    Functions
+    ---------
+        paretoMax(X) :
+            Indices de las filas de X no dominadas.
+        prune_3_3_3(Mu, Vu) :
+            Casos de carga que pueden gobernar la verificacion 3.3.3.
+        prune_3_5(Pu, Mu_x, Mu_y, fiPn) :
+            Combinaciones que pueden gobernar la verificacion 3.5.
+
+    Tests
+    -----
+        >>> X = np.array([[1.0, 1.0], [2.0, 0.5], [0.5, 2.0], [0.9, 0.9], [2.0, 0.5], [1.5, 0.2]])
+        >>> paretoMax(X).tolist()
+        [0, 1, 2]
+        >>> index, report = prune_3_5(Pu= [1.0, 0.5, 5.0, 4.0], Mu_x= [1.0, 0.5, 1.0, -2.0], Mu_y= 0.0, fiPn= 10.0)
+        >>> index.tolist(), report['nPruned']
+        ([0, 2, 3], 1)
+'''
+
+import numpy as np
+
+
+def paretoMax(X):
+    '''Indices (ordenados) de las filas de X (n x d) que no estan dominadas por otra fila. De filas repetidas se
+    conserva la primera.'''
+    X = np.asarray(X, dtype= float)
+    n = X.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype= int)
+    # orden lexicografico decreciente: un punto solo puede estar dominado por uno anterior
+    order = np.lexsort(-X[:, ::-1].T)
+    Xs = X[order]
+    if X.shape[1] == 2:
+        # dominado si algun punto anterior (x >= x_i) tiene y >= y_i
+        runMax = np.maximum.accumulate(Xs[:, 1])
+        keep = np.ones(n, dtype= bool)
+        keep[1:] = Xs[1:, 1] > runMax[:-1]
+        return np.sort(order[keep])
+
+    # el de mayor suma no esta dominado: descarta de entrada la mayor parte de la nube
+    seed = int(np.argmax(Xs.sum(axis= 1)))
+    candidates = np.flatnonzero(~(Xs[seed] >= Xs).all(axis= 1))
+    candidates = np.sort(np.append(candidates, seed))
+
+    # por bloques: cada punto se compara con los conservados y luego con los anteriores de su bloque. Si el que
+    # lo domina esta a su vez dominado, la dominancia es transitiva y el descarte sigue siendo correcto
+    block = 256
+    kept = np.zeros(0, dtype= int)
+    for start in range(0, candidates.size, block):
+        rows = candidates[start:start + block]
+        C = Xs[rows]
+        if kept.size:
+            alive = ~(Xs[kept][None, :, :] >= C[:, None, :]).all(axis= 2).any(axis= 1)
+            rows, C = rows[alive], C[alive]
+        dominated = (C[None, :, :] >= C[:, None, :]).all(axis= 2) & np.tri(rows.size, k= -1, dtype= bool)
+        kept = np.concatenate([kept, rows[~dominated.any(axis= 1)]])
+    return np.sort(order[kept])
+
+def _report(n, index):
+    return {'nPoints': n, 'nKept': int(index.size), 'nPruned': int(n - index.size)}
+
+def prune_3_3_3(Mu, Vu):
+    '''Casos de carga (Mu, Vu) que pueden gobernar la verificacion 3.3.3.
+
+    Parameters
+    ----------
+        Mu, Vu : float or array
+            Momento y corte requeridos de cada caso de carga
+
+    Returns
+    -------
+        index : array
+            Indices de los casos conservados
+        report : dict
+            nPoints, nKept, nPruned
+    '''
+    Mu, Vu = np.broadcast_arrays(np.abs(np.asarray(Mu, dtype= float)), np.abs(np.asarray(Vu, dtype= float)))
+    Mu, Vu = Mu.ravel(), Vu.ravel()
+    index = paretoMax(np.column_stack([Mu, Vu]))
+    return index, _report(Mu.size, index)
+
+def prune_3_5(Pu, Mu_x, Mu_y, fiPn):
+    '''Combinaciones (Pu, Mu_x, Mu_y) que pueden gobernar la verificacion 3.5.
+
+    Parameters
+    ----------
+        Pu, Mu_x, Mu_y : float or array
+            Solicitaciones de cada combinacion
+        fiPn : float
+            Resistencia axial de diseno del miembro (separa Ec 3.5-3 de Ec 3.5-1/3.5-2)
+
+    Returns
+    -------
+        index : array
+            Indices de las combinaciones conservadas
+        report : dict
+            nPoints, nKept, nPruned
+    '''
+    Pu, Mu_x, Mu_y = [v.ravel() for v in np.broadcast_arrays(*[np.asarray(v, dtype= float) for v in (Pu, Mu_x, Mu_y)])]
+    X = np.column_stack([Pu, np.abs(Mu_x), np.abs(Mu_y)])
+    group = 2*(Pu/fiPn <= 0.15) + (Mu_y >= 0)
+    index = []
+    for g in np.unique(group):
+        rows = np.flatnonzero(group == g)
+        index.append(rows[paretoMax(X[rows])])
+    index = np.sort(np.concatenate(index)) if index else np.zeros(0, dtype= int)
+    return index, _report(Pu.size, index)
@@ -108,35 +108,48 @@
         >>> fiPn, midC = analysis.s3_4()
         >>> print('fiPn =', round(fiPn,2),'| Pn =', round(midC['Fn_FBy']*midC['Ae'],2))
         fiPn = 19.78 | Pn = 23.27
-        >>> print('Esbeltez de', m.profile.elements[1]['name'],'=', round(m.profile.elements[1]['esbeltez'],2))
-        Esbeltez de web = 0.4
-        >>> print('Esbeltez de', m.profile.elements[2]['name'],'=', round(m.profile.elements[2]['esbeltez'],2))
+        >>> print('Esbeltez de', m.profile.elements[1]['name'],'=', round(analysis.results['sec 3.4-fiPn'][1]['esbeltez'],2))
         Esbeltez de flange = 0.25
+        >>> print('Esbeltez de', m.profile.elements[2]['name'],'=', round(analysis.results['sec 3.4-fiPn'][2]['esbeltez'],2))
+        Esbeltez de web = 0.4
         
 
 
 '''
 
 from math import pi
+from copy import deepcopy
+import numpy as np
 from .sec_2 import sec2_1_1_c1,sec2_1_1_c3, sec2_2_1, sec2_3_1, sec2_3_2, sec2_4_2, sec2_2_2
+from .sec_2 import sec2_2_1_vec, sec2_3_1_vec, sec2_4_2_vec
 from .sec_3 import sec3_2
 # Imports for Section 3.3.1.1
-from .sec_3 import sec3_3_1_1, E_3_3_1_1_e1, LocalDistorsion
+from .sec_3 import sec3_3_1_1, E_3_3_1_1_e1, E_3_3_1_1_Cy, LocalDistorsion
 # Imports for Section 3.3.1.2
-from .sec_3 import sec3_3_1_2_eta, sec3_3_1_2_3_i, E_3_3_1_2_e1, E_3_3_1_2_e2, E_3_3_1_2_e4, E_3_3_1_2_e6, E_3_3_1_2_e8, E_3_3_1_2_e9
+from .sec_3 import sec3_3_1_2_3_i, E_3_3_1_2_e1, E_3_3_1_2_e2, E_3_3_1_2_e4, E_3_3_1_2_e8, E_3_3_1_2_e9
 # Imports for Section 3.3.2
 from .sec_3 import E_3_3_2_e1
 # Imports for Section 3.3.3
 from .sec_3 import E_3_3_3_e1, E_3_3_3_e2
 # Imports for Section 3.3.4
+from .sec_3 import sec3_3_4
+# Imports for Section 3.3.5
+from .sec_3 import E_3_3_5_e1, E_3_3_5_e2
 
 # Imports for Section 3.4
-from .sec_3 import E_3_4_e1, E_3_4_2_e1, E_3_4_3_e1, E_3_4_3_e3
+from .sec_3 import E_3_4_e1, E_3_4_3_e3
 # Imports for Section 3.5
-from .sec_3 import E_3_5_e1, E_3_5_e2, E_3_5_e3, E_3_5_e4, E_3_5_e5
+from .sec_3 import E_3_5_e1, E_3_5_e2, E_3_5_e3
 from .appendix_B import B_2, B_1
 from .properties import c_w_lps_profile, c_profile, steel, I_builtup_c_profile
-from .functions import eta_iter, adjustNeutralAxis, get_linear_stress
+from .functions import eta_iter, eta_iter_vec, nonEffectiveAreas, get_linear_stress, root_iter, effectiveSection_y
+from .cache import sectionCache
+from .curves import AeCurve, SeCurve
+from .buckling import elasticBuckling
+from .interaction import interactionSurface
+from .demand import prune_3_3_3, prune_3_5
+from .momentGradient import Cb_diagram
+from . import config, fsm, serviceability, fiber
 
 
 class designParameters:
@@ -152,6 +165,10 @@ class designParameters:
             Indica si el miembro soporta cargas puntuales para realizar chequeo segun 2.1.1-3 Shear Lag Effects
         Cb: float
             Factor de distribucion de momento. Valor por defecto 1.0. Si se espeficica Cb= 0 se calcula internamente.
+        Mdiagram: array
+            Diagrama de momentos muestreado a lo largo del tramo sin arriostrar (ver momentGradient.Cb_diagram).
+            Con Cb= 0, Cb se calcula a partir de este diagrama. Si tiene mas de una dimension (e.g. una fila por
+            combinacion de carga) Cb es un array y s3_3_1 evalua todas las combinaciones a la vez.
 
     Attributes
     ----------
@@ -172,7 +189,7 @@ class designParameters:
     ------
         En archivo
     '''
-    def __init__(self, Kx = 1.0, Ky = 1.0, Kz = 1.0, Lx = 0.0, Ly = 0.0, Lz = 0.0, cLoadFlag = True, Cb= 1.0):
+    def __init__(self, Kx = 1.0, Ky = 1.0, Kz = 1.0, Lx = 0.0, Ly = 0.0, Lz = 0.0, cLoadFlag = True, Cb= 1.0, Mdiagram= None):
         self.Kx = Kx
         self.Ky = Ky
         self.Kz = Kz
@@ -180,6 +197,7 @@ class designParameters:
         self.Ly = Ly
         self.Lz = Lz
         self.Cb = Cb
+        self.Mdiagram = Mdiagram
         self.cLoadFlag = cLoadFlag
 
 class member():
@@ -264,10 +282,17 @@ class ASCE_8_02:
         member : class member
             Miembro estructural configurado con profile, steel y dP
 
+        trace : bool
+            Registro de resultados intermedios (ver config). Por defecto config.TRACE
+
     Attributes
     ----------
         member : class member
             Miembro estructural configurado con profile, steel y dP
+        results : dict
+            Resultados intermedios por elemento de la ultima llamada de cada origen: results[origin][key],
+            con key la clave del elemento en profile.elements (e.g. results['sec 3.4-fiPn'][1]['esbeltez']).
+            Los analisis no escriben en el perfil, por lo que un mismo perfil puede compartirse entre miembros.
         
     Methods
     -------
@@ -275,19 +300,49 @@ class ASCE_8_02:
             Design axial strength
         s3_3_1() :
             Strength for Bending Only
+        s3_3_2() :
+            Strength for Shear Only
+        s3_3_3(Mu, Vu) :
+            Interaccion flexion-corte para un conjunto de casos de carga
+        s3_3_4(N) :
+            Web Crippling Strength para un conjunto de apoyos o cargas concentradas
+        s3_3_5(Pu, Mu, N) :
+            Interaccion flexion-abolladura del alma para un conjunto de apoyos o cargas concentradas
+        s3_5(Pu, Mu_x, Mu_y) :
+            Interaccion carga axial-flexion para un conjunto de combinaciones de carga
+        s3_5_surface() :
+            Superficie de interaccion 3.5 para consultas de utilizacion y factor de reserva
         s3_FTB() : 
             Tension y Carga críticas de pandeo flexo-torsional
         s3_FB() : 
             Tension y Carga críticas de pandeo flexional
         s3_TB() : 
             Tension y Carga críticas de pandeo torsional
+        s3_buckling() :
+            Tensiones criticas elasticas de todos los modos de pandeo, con magnitudes intermedias compartidas
         s2_Ae_compMemb(f) :
             Area efectiva para miembros a compresion calculado para una tension f
+        s2_Ae_compMemb_vec(f) :
+            Area efectiva y anchos efectivos para un array de tensiones f
+        s2_Ae_curve() :
+            Curva Ae(f) interpolada entre 0 y FY, compartida por perfil y acero
+        s3_Se_curve() :
+            Curvas Se(f), Ie(f) y cy(f) entre 0 y FY, compartidas por perfil y acero
+        fsm_signature(load) :
+            Curva de firma de pandeo elastico local y distorsional (franjas finitas), compartida por perfil y acero
+        s3_4_Lmax(Pu), s3_3_1_Lmax(Mu) :
+            Longitud maxima (o separacion maxima de arriostramientos) para una carga requerida
+        s3_fiberSection() :
+            Seccion de fibras (Ramberg-Osgood) para el Procedimiento II de 3.3.1.1, compartida por perfil y acero
+        s2_deflection(Ms) :
+            Flechas para cargas de servicio con Ie y Es a la tension de servicio
 
     '''
 
-    def __init__(self, member):
+    def __init__(self, member, trace = None):
         self.member = member
+        self.trace = trace
+        self.results = {}
         if not member.profile:
             print ('Advertencia: El miembro', member.name, 'no tiene asignado ningun pefil.')
         if not member.steel:
@@ -295,6 +350,37 @@ class ASCE_8_02:
         if not member.dP:
             print ('Advertencia: El miembro', member.name, 'no tiene asignado parametros de diseño.')
 
+    def _trace(self, trace):
+        '''Modo de registro de resultados intermedios para una llamada: trace, o el del analisis, o config.TRACE.'''
+        if trace is None:
+            trace = self.trace
+        if trace is None:
+            trace = config.TRACE
+        return trace
+
+    def _results(self, origin):
+        '''Diccionario {key: resultados} de los elementos para origin. Se reinicia en cada llamada.'''
+        results = self.results[origin] = {}
+        return results
+
+    def _sectionResult(self, key, compute, origins, trace):
+        '''Resultado que depende solo del perfil y del acero (no de longitudes ni de Cb), compartido por todos
+        los miembros de igual perfil y acero a traves de sectionCache.
+
+            compute() se evalua una sola vez, registrando los resultados intermedios de origins, que se guardan
+            junto al valor. Si trace, se devuelve una copia del valor y se copian los resultados intermedios en
+            results; en modo lean se devuelve el valor compartido, que no debe modificarse.
+        '''
+        cache = sectionCache(self.member.profile, self.member.steel)
+        if key not in cache:
+            value = compute()
+            cache[key] = (value, {origin: self.results.pop(origin, None) for origin in origins})
+        if not trace:
+            return cache[key][0]
+        value, results = deepcopy(cache[key])
+        self.results.update(results)
+        return value
+
     def s2_1(self):
         '''Dimensional Limits and Considerations. 
         2.1.1 Flange Flat-Width-to-Thickness Considerations
@@ -308,7 +394,7 @@ class ASCE_8_02:
             none
         Returns
         -------
-            none
+            none (resultados en results['sec2.1'])
         Raises
         ------
             none
@@ -318,48 +404,50 @@ class ASCE_8_02:
         '''
         profile = self.member.profile
         elements = profile.elements
+        results = self._results('sec2.1')
         
         for key in elements.keys():
             element = elements[key]
+            r = results[key] = {}
             # condition i
             if element['type'] == 'stiffned_w_slps':
                 ratio_adm_1, midC = sec2_1_1_c1(condition= 'i', w= element['w'], t= profile.t)
-                element['ratioAdm_1']= ratio_adm_1
-                element['ratio_1']= midC['ratio_1']
-                element['condition']= 'i'
-                if element['ratio_1'] > element['ratioAdm_1']:
+                r['ratioAdm_1']= ratio_adm_1
+                r['ratio_1']= midC['ratio_1']
+                r['condition']= 'i'
+                if r['ratio_1'] > r['ratioAdm_1']:
                     print('El elemento:',key , element['name'],'del perfil:',profile.name, 'excede los limites la clausula 2.2.1-1')
                     raise Exception('>> Analisis abortado <<')
                 # 2.1.1-3 Shear Lag Effects - Flanges
                 if element['name'] == 'flange' and self.member.dP.cLoadFlag:
                     ratio_3, _ = sec2_1_1_c3(L = self.member.L*2, wf= element['wf'])
-                    element['ratio_3'] = ratio_3
+                    r['ratio_3'] = ratio_3
                     if ratio_3 < 1.0:
-                        element['beff_max'] = element['w']*ratio_3
+                        r['beff_max'] = element['w']*ratio_3
             # condition ii
             elif element['name'] == 'web':
                 ratio_adm_1, midC = sec2_1_1_c1(condition= 'ii', w= element['w'], t= profile.t)
-                element['ratioAdm_1']= ratio_adm_1
-                element['ratio_1']= midC['ratio_1']
-                element['condition']= 'ii'
-                if element['ratio_1'] > element['ratioAdm_1']:
+                r['ratioAdm_1']= ratio_adm_1
+                r['ratio_1']= midC['ratio_1']
+                r['condition']= 'ii'
+                if r['ratio_1'] > r['ratioAdm_1']:
                     print('El elemento:',key , element['name'],'del perfil:',profile.name, 'excede los limites la clausula 2.2.1-1')
                     raise Exception('>> Analisis abortado <<')
             # condition iii
             elif element['type'] == 'unstiffned' or (element['type'] == 'stiffned_w_slps' and element['Is']<element['Ia']):
                 ratio_adm_1, midC = sec2_1_1_c1(condition= 'iii', w= element['w'], t= profile.t)
-                element['ratioAdm_1']= ratio_adm_1
-                element['ratio_1']= midC['ratio_1']
-                element['condition']= 'iii'
-                if element['ratio_1'] > element['ratioAdm_1']:
+                r['ratioAdm_1']= ratio_adm_1
+                r['ratio_1']= midC['ratio_1']
+                r['condition']= 'iii'
+                if r['ratio_1'] > r['ratioAdm_1']:
                     print('El elemento:',key , element['name'],'del perfil:',profile.name, 'excede los limites la clausula 2.2.1-1')
                     raise Exception('>> Analisis abortado <<')
                 # 2.1.1-3 Shear Lag Effects - Flanges
                 if element['name'] == 'flange' and self.member.dP.cLoadFlag:
                     ratio_3, _ = sec2_1_1_c3(L = self.member.L*2, wf= element['wf'])
-                    element['ratio_3'] = ratio_3
+                    r['ratio_3'] = ratio_3
                     if ratio_3 < 1.0:
-                        element['beff_max'] = element['w']*ratio_3
+                        r['beff_max'] = element['w']*ratio_3
             else:
                 print('El elemento:',element['name'], 'del perfil:', profile.name, 'no tiene asignada una clasificacion reconocida:', element['type'])
                 raise Exception('>> Analisis abortado <<')
@@ -396,8 +484,14 @@ class ASCE_8_02:
         return fiTn, midC
 
     
-    def s3_3_1(self, procedure= 'PI', localDistorsion = False):
+    def s3_3_1(self, procedure= 'PI', localDistorsion = False, trace = None, L = None, Ky = None, Kz = None, Ly = None, Lz = None, Cb = None):
         '''Design Flexural Strength. Bending Only. Smaller of Sections 3.3.1.1 and 3.3.1.2.
+
+            Si alguno de L, Ky, Kz, Ly, Lz, Cb es un array (se admiten grillas por broadcasting, e.g. Ly[:, None] y
+            Cb[None, :]) se evalua la curva de pandeo lateral completa en una sola llamada: las tensiones criticas se
+            resuelven juntas con eta_iter_vec y Sc se interpola en s3_Se_curve(nPoints= 201) (calculo exacto para f > FY).
+            3.3.1.1 no depende de la longitud y se calcula una sola vez por perfil y acero.
+
         Parameters
         ----------
             procedure : string
@@ -406,9 +500,13 @@ class ASCE_8_02:
                     PII: 2. Procedure II—Based on Inelastic Reserve Capacity
             localDistorsion: bool
                 determina si se consideran distorsiones locales para la resistencia a la flexion nominal (3.3.1.1-3 [CASE III]).
+            trace : bool
+                Registro de resultados intermedios (ver config). En modo lean se devuelve midC = None
+            L, Ky, Kz, Ly, Lz, Cb : float or array
+                Longitudes, factores de longitud efectiva y coeficiente de flexion. Por defecto los de member y member.dP
         Returns
         -------
-            fiMn : float
+            fiMn : float or array
                 resistencia de diseno a la flexion.
             midC : dict
                 fi: Design factor segun 3.3.1.1 Nominal section strength.
@@ -440,13 +538,23 @@ class ASCE_8_02:
                 elif element['type'] == 'unstiffned':
                     comp_flange = 'UNSTIFF'
 
+        trace = self._trace(trace)
         if procedure == 'PI':    
-            Sex, nEffAreas = self.s3_Se_effective(fFlange= steel.FY)
-            fiMn_no, midC = sec3_3_1_1(FY=steel.FY, Se=Sex, procedure=procedure, comp_flange=comp_flange)
-            midC['nEffAreas-3.3.1.1'] = nEffAreas
+            def nominal():
+                telemetry = {}
+                Sex, nEffAreas = self.s3_Se_effective(fFlange= steel.FY, telemetry= telemetry, trace= True)
+                fiMn_no, midC = sec3_3_1_1(FY=steel.FY, Se=Sex, procedure=procedure, comp_flange=comp_flange)
+                midC['nEffAreas-3.3.1.1'] = nEffAreas
+                return fiMn_no, midC, telemetry['yMAX'][-1]
+            # independiente de la longitud: se comparte entre miembros de igual perfil y acero
+            fiMn_no, midC, yMAX_no = self._sectionResult(('sec3.3.1.1', procedure), nominal, ['sec3.3.1.1'], trace)
         elif procedure == 'PII':
-            print('Seccion 3.3.1.1 - Procedimiento II no implementado.')
-            raise NotImplementedError
+            def nominal():
+                _, _, nEffAreas, yMAX = self.s3_fiberSection()
+                fiMn_no, midC = self._s3_3_1_1_PII()
+                midC['nEffAreas-3.3.1.1'] = nEffAreas
+                return fiMn_no, midC, yMAX
+            fiMn_no, midC, yMAX_no = self._sectionResult(('sec3.3.1.1', procedure), nominal, ['sec3.3.1.1'], trace)
         else:
             print('Prodedimiento',procedure,'no roconocido en Section 3.1.1')
             raise Exception('>> Analisis abortado <<')
@@ -458,27 +566,116 @@ class ASCE_8_02:
         # Section 3.3.1.2 - Lateral Buckling Strength
         Sf = profile.Sx
 
-        Mc_eta_LB = sec3_3_1_2_eta(prof_type=profile.type, Cb=dp.Cb, E0=steel.E0, d=profile.H, Iyc=profile.Iy/2, L=member.L,
-                                     rx=profile.rx, ry=profile.ry, c_x=profile.c_x, sc_x=profile.sc_x, A=profile.A,
-                                     Lx=dp.Lx, Kx=dp.Kx, Ly=dp.Ly, Ky=dp.Ky, Lz=dp.Lz, Kz=dp.Kz,
-                                     Cw=profile.Cw, G0=steel.G0, J=profile.J, j=profile.j)
         # construyo ecuacion: f - Mc/Sf = 0
         #                     f - (Mc_eta_LB/Sf)*eta(f) = 0
-        #                     f - FF*eta(f) = 0 (itero con eta_iter)
-        FF = Mc_eta_LB/Sf
-        f = eta_iter(FF=FF, mat=steel)
-        Sc, nEffAreas= self.s3_Se_effective(f)
+        #                     f - FF*eta(f) = 0 (itero con eta_iter), FF = Mc_eta_LB/Sf (ver sec3_3_1_2_eta)
+        FF = self.s3_buckling(L= L, Ky= Ky, Kz= Kz, Ly= Ly, Lz= Lz, Cb= Cb)['LTB']
+        if np.ndim(FF) > 0:
+            f = eta_iter_vec(FF=FF, mat=steel)
+            Sc = self.s3_Se_curve(nPoints= 201)(f) # error de interpolacion < 0.1%, menor que la tolerancia de s3_Se_effective
+            for i in np.flatnonzero(f > steel.FY): # fuera de la curva
+                Sc.flat[i], _ = self.s3_Se_effective(f.flat[i], yMAX0= yMAX_no, trace= False)
+            nEffAreas = None
+        else:
+            f = eta_iter(FF=FF, mat=steel)
+            Sc, nEffAreas= self.s3_Se_effective(f, yMAX0= yMAX_no, trace= trace)
 
         fiMn_LBx, midC2 = E_3_3_1_2_e1(Sc=Sc, Mc=f*Sf, Sf=Sf)
 
         # Defino que resistencia controla
-        fiMnx = min(fiMn_no, fiMn_LBx)
+        fiMnx = np.minimum(fiMn_no, fiMn_LBx) if np.ndim(f) > 0 else min(fiMn_no, fiMn_LBx)
+        if not trace:
+            return fiMnx, None
         midC.update(midC2)  # merge entre los diccionarios
         midC.update({'nEffAreas-3.3.1.2': nEffAreas,'fiMn_LBx': fiMn_LBx, 'fiMn_no': fiMn_no})
 
         return fiMnx, midC
 
-    def s3_3_1_1_y(self, procedure= 'PI', localDistorsion = False):
+    def s3_fiberSection(self, nT = 2, ds = None):
+        '''Seccion de fibras del perfil para flexion respecto de x (ver modulo fiber), con los anchos efectivos del
+        Procedimiento I (fFlange = FY) como fibras de area negativa. Se comparte (sectionCache) con todos los miembros
+        de igual perfil y acero.
+
+        Parameters
+        ----------
+            nT : int
+                Fibras en el espesor de los elementos horizontales y las esquinas
+            ds : float
+                Longitud de las fibras a lo largo de los elementos. Por defecto t
+        Returns
+        -------
+            section : class fiber.fiberSection
+                Seccion de fibras, con yTop = H/2
+            Sex : float
+                Modulo resistente efectivo del Procedimiento I
+            nEffAreas : dict
+                Areas no efectivas
+            yMAX : float
+                Distancia del eje neutro efectivo a la fibra comprimida extrema
+        Tests
+        -----
+            Seccion compartida y, para curvatura chica, rigidez E0*Ie y eje neutro de la seccion efectiva
+            (Ie = Sex*yMAX, yMAX = yTop - yn)
+            >>> p1 = c_w_lps_profile(H= 100, B= 50, D= 12, t= 1.5, r_out= 3.75)
+            >>> p1.calculate()
+            >>> s = steel(FY= 337, E0= 180510.0, nu= 0.3, n= 13.5, offset= 0.002, name= 'SA304_1_4Hard')
+            >>> a = ASCE_8_02(member(L= 1000, profile= p1, steel= s, designParameters= designParameters()))
+            >>> section, Sex, nEffAreas, yMAX = a.s3_fiberSection()
+            >>> b = ASCE_8_02(member(L= 2000, profile= p1, steel= s, designParameters= designParameters()))
+            >>> b.s3_fiberSection()[0] is section, section.yTop == p1.H/2
+            (True, True)
+            >>> M, yn = section.momentCurvature(1e-9)
+            >>> abs(float(M)/(s.E0*1e-9)/(Sex*yMAX) - 1) < 0.01, abs(section.yTop - float(yn) - yMAX) < 0.01*p1.H
+            (True, True)
+        '''
+        profile = self.member.profile
+        cache = sectionCache(profile, self.member.steel)
+        key = ('fibers', nT, ds)
+        result = cache.get(key)
+        if result is None:
+            telemetry = {}
+            Sex, nEffAreas = self.s3_Se_effective(fFlange= self.member.steel.FY, telemetry= telemetry, trace= True)
+            y, A = fiber.profileFibers(profile, nEffAreas, nT= nT, ds= ds)
+            section = fiber.fiberSection(y, A, self.member.steel, yTop= profile.H/2)
+            result = cache.setdefault(key, (section, Sex, nEffAreas, telemetry['yMAX'][-1]))
+        return result
+
+    def _s3_3_1_1_PII(self, solution = None):
+        '''3.3.1.1 Procedimiento II con la seccion de fibras: momento con la deformacion Cy*ey en la fibra comprimida
+        extrema (ey: deformacion del acero en FY, FY/E0 + offset). Si la altura comprimida del alma supera lambda_1*t
+        el procedimiento no es aplicable y se usa el Procedimiento I. solution: (Mcu, yn, kappa) ya calculados (ver
+        batch.s3_3_1_1_PII); por defecto se resuelve la seccion de fibras.'''
+        steel = self.member.steel
+        profile = self.member.profile
+        section, Sex, _, _ = self.s3_fiberSection()
+        flange = [e for e in profile.elements.values() if e['name'] == 'flange'][0]
+        comp_flange = 'STIFF' if flange['type'] == 'stiffned_w_slps' else 'UNSTIFF'
+        epsCu, Cy, midCy = self._s3_3_1_1_PII_strain()
+        if solution is None:
+            solution = section.strainLimit(epsCu)
+        Mcu, yn, kappa = [float(v) for v in solution]
+
+        hc = profile.H/2 - profile.r_out - yn # altura comprimida del alma
+        applicable = hc/profile.t <= midCy['lambda_1']
+        if applicable:
+            fiMn_no, midC = sec3_3_1_1(FY= steel.FY, Se= Sex, procedure= 'PII', comp_flange= comp_flange, Mcu= Mcu)
+        else:
+            print('Advertencia: Seccion 3.3.1.1 - Procedimiento II no aplicable al perfil', profile.name, '(h_c/t =', round(hc/profile.t, 2), '> lambda_1 =', round(midCy['lambda_1'], 2), '). Se usa el Procedimiento I.')
+            fiMn_no, midC = sec3_3_1_1(FY= steel.FY, Se= Sex, procedure= 'PI', comp_flange= comp_flange)
+        midC.update({'Cy': Cy, 'epsCu': epsCu, 'Mcu': Mcu, 'yn': yn, 'kappa': kappa, 'hc': hc, 'PII_applicable': applicable})
+        midC.update(midCy)
+        return fiMn_no, midC
+
+    def _s3_3_1_1_PII_strain(self):
+        '''Deformacion maxima de compresion Cy*ey del Procedimiento II, Cy y limites de esbeltez.'''
+        steel = self.member.steel
+        profile = self.member.profile
+        flange = [e for e in profile.elements.values() if e['name'] == 'flange'][0]
+        element = {'stiffned': 'STIFF', 'unstiffned': 'UNSTIFF'}.get(flange['type'], 'EDGE')
+        Cy, midCy = E_3_3_1_1_Cy(w= flange['w'], t= profile.t, FY= steel.FY, E0= steel.E0, element= element)
+        return Cy*(steel.FY/steel.E0 + steel.offset), Cy, midCy
+
+    def s3_3_1_1_y(self, procedure= 'PI', localDistorsion = False, tol = 0.005, maxIter = 50, f0 = None, trace = None):
         '''Design Flexural Strength. Bending Only. Smaller of Sections 3.3.1.1 and 3.3.1.2.
         Parameters
         ----------
@@ -488,11 +685,22 @@ class ASCE_8_02:
                     PII: 2. Procedure II—Based on Inelastic Reserve Capacity
             localDistorsion: bool
                 determina si se consideran distorsiones locales para la resistencia a la flexion nominal (3.3.1.1-3 [CASE III]).
+            tol : float
+                Tolerancia relativa en la tension de la fibra comprimida (ver s3_Se_effective_y_FY)
+            maxIter : int
+                Numero maximo de iteraciones admitidas
+            f0 : list [f_plus, f_minus]
+                Tensiones iniciales de la fibra comprimida para Cs = +1 y Cs = -1 (e.g. midC['fc'] de un perfil similar)
+            trace : bool
+                Registro de resultados intermedios (ver config). En modo lean se devuelve midC = None
         Returns
         -------
-            fiMn : float
-                resistencia de diseno a la flexion.
+            fiMny_plus : float
+                resistencia de diseno a la flexion con el centro de corte a compresion (Cs = +1).
+            fiMny_minus : float
+                resistencia de diseno a la flexion con el centro de corte a traccion (Cs = -1).
             midC : dict
+                resultados para Cs = +1, con los de Cs = -1 en midC['y-']
                 fi: Design factor segun 3.3.1.1 Nominal section strength.
                 Mn: resistencia nominal de la seccion a flexion segun 3.3.1.1
                 LB_fi: Design factor segun 3.3.1.2 Lateral buckling strength
@@ -525,22 +733,20 @@ class ASCE_8_02:
                     comp_flange = 'UNSTIFF'
 
         if procedure == 'PI':
-            ## Cs = 1
-            tol = 0.005
-            f1= 20
-            err = 1
-            while err > tol:
-                fFlange = f1
-                Sex, nEffAreas= self.s3_Se_effective_y(fFlange, Cs = 1, origin= 'sec3.3.1-y+')
-                cx= elements[1]['sec3.3.1-y+']['cx']
-                xCG= profile.c_x + cx
-                f1= steel.FY*xCG/(profile.B - xCG)
-                err = abs((fFlange - f1)/fFlange)
-            fiMny_plus, midC = sec3_3_1_1(FY=steel.FY, Se=Sex, procedure=procedure, comp_flange=comp_flange)
+            trace = self._trace(trace)
+            if f0 is None: f0 = [None, None]
+            results = []
+            for Cs, origin, fStart in [(1, 'sec3.3.1-y+', f0[0]), (-1, 'sec3.3.1-y-', f0[1])]:
+                fc, Sey, nEffAreas, info = self.s3_Se_effective_y_FY(Cs= Cs, origin= origin, tol= tol, maxIter= maxIter, f0= fStart, trace= trace)
+                fiMny, midCy = sec3_3_1_1(FY=steel.FY, Se=Sey, procedure=procedure, comp_flange=comp_flange)
+                midCy.update({'fc': fc, 'nIter': info['nIter']})
+                results.append((fiMny, midCy, nEffAreas))
+            (fiMny_plus, midC, nEffAreas), (fiMny_minus, midC_minus, nEffAreas_minus) = results
+            if not trace:
+                return fiMny_plus, fiMny_minus, None
             midC['nEffAreas-3.3.1.1-y+'] = nEffAreas
-
-            ## Cs = -1
-            fiMny_minus = 'N/A'
+            midC['nEffAreas-3.3.1.1-y-'] = nEffAreas_minus
+            midC['y-'] = midC_minus
 
             return fiMny_plus, fiMny_minus, midC
         elif procedure == 'PII':
@@ -550,8 +756,63 @@ class ASCE_8_02:
             print('Prodedimiento',procedure,'no roconocido en Section 3.1.1')
             raise Exception('>> Analisis abortado <<')
 
-    def s3_Se_effective(self, fFlange, tol = 0.005, maxIter = 100):
+    def s3_Se_effective_y_FY(self, Cs, origin, tol = 0.005, maxIter = 50, f0 = None, trace = None):
+        '''Tension fc en la fibra extrema comprimida para la que la seccion efectiva (eje y) alcanza la fluencia
+        en su fibra extrema: fc = FY*min(1, xc/xt), con xc y xt las distancias del eje neutro efectivo a las
+        fibras extremas comprimida y traccionada (ver s3_Se_effective_y).
+
+        El residuo fc - FY*min(1, xc/xt) es negativo en fc = 0 y positivo en fc = FY, por lo que se resuelve
+        con root_iter en [0, FY] (secante con biseccion de resguardo y maxIter). Cada evaluacion parte del eje
+        neutro de la evaluacion anterior.
+
+        Parameters
+        ----------
+            Cs : int [-1, +1]
+                +1: centro de corte a compresion, -1 centro de corte a traccion
+            origin : string
+                Label para almacenar los resultados en results
+            tol : float
+                Tolerancia relativa en fc
+            maxIter : int
+                Numero maximo de evaluaciones de s3_Se_effective_y
+            f0 : float
+                Tension inicial. Por defecto la de la seccion bruta
+            trace : bool
+                Registro de resultados intermedios (ver config). Por defecto el del analisis
+        Returns
+        -------
+            fc : float
+                Tension en la fibra extrema comprimida
+            Sey : float
+                Modulo resistente efectivo para fc
+            nEffAreas : dict
+                Areas no efectivas. None en modo lean
+            info : dict
+                nIter, err, converged (ver root_iter)
         '''
+        profile = self.member.profile
+        FY = self.member.steel.FY
+        if f0 is None:
+            xc0 = profile.c_x if Cs > 0 else profile.B - profile.c_x
+            f0 = FY*min(1.0, xc0/(profile.B - xc0))
+
+        state = {'cx': None}
+        def residual(fc):
+            r = {}
+            Sey, nEffAreas = self.s3_Se_effective_y(fc, Cs= Cs, origin= origin, cx0= state['cx'], telemetry= r, trace= trace)
+            state.update({'cx': r['cx'], 'Sey': Sey, 'nEffAreas': nEffAreas})
+            return fc - FY*min(1.0, r['xc']/r['xt'])
+
+        fc, info = root_iter(residual, 0.0, FY, x0= f0, tol= tol, maxIter= maxIter)
+        return fc, state['Sey'], state['nEffAreas'], info
+
+    def s3_Se_effective(self, fFlange, tol = 0.005, maxIter = 100, yMAX0 = None, telemetry = None, trace = None):
+        '''Modulo resistente efectivo Se para la tension fFlange en el ala comprimida.
+
+        yMAX se obtiene resolviendo yMAX = g(yMAX), donde g calcula los anchos efectivos del alma (2.2.2)
+        con la distribucion de tensiones de yMAX y devuelve la nueva posicion del eje neutro. Se usa el
+        metodo de la secante sobre g(yMAX) - yMAX, con un paso de punto fijo si la secante sale del alma.
+
         Parameters
         ----------
             fFlange : float
@@ -560,14 +821,26 @@ class ASCE_8_02:
                 Valor requerido a alcanzar del ratio relativo de la variacion de yMax entre dos iteraciones
             maxIter : int
                 Numero maximo de iteraciones admitidas
-
+            yMAX0 : float
+                Valor inicial de yMAX (e.g. solucion a una tension cercana). Por defecto se parte del alma totalmente efectiva.
+            telemetry : dict
+                Si se indica, se completa con nIter, err, converged y yMAX (historia de las iteraciones)
+            trace : bool
+                Registro de resultados intermedios en results['sec3.3.1.1'] (ver config). Por defecto el del analisis
+        Returns
+        -------
+            Se : float
+                Modulo resistente efectivo
+            nEffAreas : dict
+                Areas no efectivas {1: flange, 2: web, 3: lip} (formato de adjustNeutralAxis). None en modo lean
         '''
 
+        trace = self._trace(trace)
         profile= self.member.profile
         elements = profile.elements
         t= profile.t
         E0= self.member.steel.E0
-        nEffAreas= {}
+        nEffAreas= nonEffectiveAreas(Ix= profile.Ix, A= profile.A)
 
         if profile.type in ['I_builtup_cee', 'I_builtup_cee_w_lps']:
             nEf= 2.0
@@ -579,16 +852,20 @@ class ASCE_8_02:
         
         # calculo beff para flange
         flange = elements[1]
-        flange['sec3.3.1.1'] = {}
         if 3 in elements.keys():
             lip = elements[3]
-            lip['sec3.3.1.1'] = {}
+        if trace:
+            results = self._results('sec3.3.1.1')
+            rFlange = results[1] = {}
+            if 3 in elements.keys():
+                rLip = results[3] = {}
         if flange['name'] != 'flange':
             print('El elemento', 1, 'no corresponde al tipo 1:<flange>. Reordenar los elemenentos en el perfil',profile.type)
             raise Exception('>> Analisis abortado <<')
         elif flange['type'] == 'unstiffned':
             b, midC = sec2_3_1(w= flange['w'], t= t, f= fFlange, E= E0)
-            flange['sec3.3.1.1'].update({'b':b,'rho': midC['rho'],'esbeltez': midC['esbeltez']})
+            if trace:
+                rFlange.update({'b':b,'rho': midC['rho'],'esbeltez': midC['esbeltez']})
             cy_ = (profile.H-t)/2.0
             nEffAreas[1] = {'t': t, 'b_': (flange['w'] - b)*nEf, 'cy_': cy_, 'paralel': True}
         elif flange['type'] == 'stiffned_w_slps':
@@ -599,37 +876,42 @@ class ASCE_8_02:
                 raise Exception('>> Analisis abortado <<')
             #flange
             b, midC = sec2_4_2(E0= E0, f= fFlange, w= flange['w'], t= t, d= d, r_out= profile.r_out)
-            flange['sec3.3.1.1'].update(midC)
-            flange['sec3.3.1.1']['b']= b
+            ds = midC['ds']
+            if trace:
+                rFlange.update(midC)
+                rFlange['b']= b
             cy_ = (profile.H-t)/2.0
             nEffAreas[1] = {'t': t, 'b_': (flange['w'] - b)*nEf, 'cy_': cy_, 'paralel': True}
             
             #lip
             b, midC = sec2_3_2(w= lip['w'], t= t, f3= fFlange, E= E0)
-            lip['sec3.3.1.1'].update(midC)
-            lip['sec3.3.1.1']['b']= b
+            if trace:
+                rLip.update(midC)
+                rLip['b']= b
 
-            if flange['sec3.3.1.1']['ds'] < b: # ancho efectivo del lip (ver definicion ds en 2.4)
-                b = flange['sec3.3.1.1']['ds']
+            if ds < b: # ancho efectivo del lip (ver definicion ds en 2.4)
+                b = ds
             b_ = lip['w'] - b
             cy_ = (profile.H + b_)/2.0 - profile.D
             nEffAreas[3] = {'t': t, 'b_': b_*nEf , 'cy_': cy_, 'paralel': False}                         
-            lip['sec3.3.1.1'].update({'b':b, 'cy_': cy_})
-            lip['sec3.3.1.1'].update(midC)
+            if trace:
+                rLip.update({'b':b, 'cy_': cy_})
+                rLip.update(midC)
         else:
             print('El elemento:', flange['name'], 'del perfil:', profile.name, 'no tiene asignada una clasificacion reconocida:', flange['type'])
             raise Exception('>> Analisis abortado <<')
         
         ## calculo el yCG, primer iteracion [web fully effective]
         
-        cy, Ix = adjustNeutralAxis(Ix= profile.Ix, A= profile.A, nEffAreas= nEffAreas)
+        cy, Ix = nEffAreas.neutralAxis()
         yMAX = (profile.H/2 + cy) # distancia mayor desde el eje neutro al borde de la seccion
-        Se = Ix/yMAX
-        flange['sec3.3.1.1'].update({'Se': Se,'Ix': Ix, 'cy': cy})
+        if trace:
+            rFlange.update({'Se': Ix/yMAX,'Ix': Ix, 'cy': cy})
 
         # calculo beff para web, itero
         web = elements[2]
-        web['sec3.3.1.1']= {}
+        if trace:
+            rWeb = results[2] = {}
         if web['name'] != 'web':
             print('El elemento', 2, 'no corresponde al tipo 1:<web>. Reordenar los elemenentos en el perfil',profile.type)
             raise Exception('>> Analisis abortado <<')
@@ -637,52 +919,127 @@ class ASCE_8_02:
             print('El elemento:', web['name'], 'del perfil:', profile.name, 'no tiene asignada una clasificacion reconocida:', web['type'])
             raise Exception('>> Analisis abortado <<')
         
-        err = 1.0
-        nIter = 0
-        while err > tol and nIter < maxIter:
+        def g(yMAX):
+            '''yMAX resultante de los anchos efectivos del alma calculados con yMAX.'''
+            cy = yMAX - profile.H/2
             f1= get_linear_stress(fFlange, yCG= yMAX, y= profile.r_out)
             f2= get_linear_stress(fFlange, yCG= yMAX, y= profile.H - profile.r_out)
             b1, b2, midC = sec2_2_2(w= web['w'], t= t, f1= f1, f2=f2, E0= E0) 
-            web['sec3.3.1.1'].update({'b1':b1, 'b2':b2, 'f1': f1, 'f2': f2})
-            web.update(midC)
-
-            yMAX_prev = yMAX
+            if trace:
+                rWeb.update({'b1':b1, 'b2':b2, 'f1': f1, 'f2': f2})
+                rWeb.update(midC)
             if b1 + b2 < yMAX - profile.r_out:
                 b_ = yMAX - profile.r_out - b1 - b2
                 cy_= b1 + b_/2.0 - cy # distancia del centroide del area no-efectiva respecto de x-x (incial)
                 nEffAreas[2]= {'t': t, 'b_': b_ , 'cy_': cy_, 'paralel': False}
-                cy, Ix = adjustNeutralAxis(Ix= profile.Ix, A= profile.A, nEffAreas= nEffAreas)
-                yMAX = (profile.H/2 + cy) # distancia mayor desde el eje neutro al borde de la seccion
-                
-            err = abs((yMAX_prev-yMAX)/yMAX_prev)
+            elif 2 in nEffAreas:
+                nEffAreas.remove(2)
+            cy, Ix = nEffAreas.neutralAxis()
+            return profile.H/2 + cy, Ix, cy
+
+        y = yMAX if yMAX0 is None else yMAX0
+        history = [y]
+        yPrev = hPrev = None
+        err = 1.0
+        nIter = 0
+        while err > tol and nIter < maxIter:
+            yMAX, Ix, cy = g(y)
+            history.append(yMAX)
+            h = yMAX - y
+            err = abs(h/y)
             nIter += 1
-        if nIter >= maxIter:
+            # paso de la secante, o de punto fijo en la primera iteracion
+            if hPrev is not None and h != hPrev:
+                yNew = y - h*(y - yPrev)/(h - hPrev)
+            else:
+                yNew = yMAX
+            if not profile.r_out < yNew < profile.H:
+                yNew = yMAX
+            yPrev, hPrev, y = y, h, yNew
+        if nIter >= maxIter and err > tol:
             print('Sec. 3, determinacion de Se: Se alcanzo el numero maximo de iteraciones. Error % alcanzado:', err*100)
+        if telemetry is not None:
+            telemetry.update({'nIter': nIter, 'err': err, 'converged': err <= tol, 'yMAX': history})
         
         Se = Ix/yMAX
-        flange['sec3.3.1.1'].update({'Se': Se,'Ix': Ix, 'cy': cy})
+        if not trace:
+            return Se, None
+        rFlange.update({'Se': Se,'Ix': Ix, 'cy': cy})
+
+        return Se, nEffAreas.asDict()
 
-        return Se, nEffAreas
-    def s3_Se_effective_y(self, fFlange, Cs, origin, tol = 0.005, maxIter = 100):
+    def s3_Se_curve(self, nPoints = 51, fMax = None, tol = 0.005):
+        '''Curvas Se(f), Ie(f) y cy(f) (eje x) para el perfil y acero del miembro. Se construyen en un unico barrido
+        de tensiones la primera vez que se solicitan y se comparten (sectionCache) con todos los miembros de igual
+        perfil y acero.
+
+        Parameters
+        ----------
+            nPoints : int
+                Cantidad de puntos de la grilla entre 0 y fMax
+            fMax : float
+                Tension maxima en el ala comprimida. Por defecto FY
+            tol : float
+                Tolerancia de s3_Se_effective
+        Returns
+        -------
+            curve : class SeCurve
+                curve(f) devuelve Se, curve.Ix(f) la inercia efectiva y curve.y(f) el corrimiento del eje neutro.
+                Los arrays de la grilla estan en curve.f, curve.Se, curve.Ie y curve.cy
+        Tests
+        -----
+            En archivo
         '''
+        cache = sectionCache(self.member.profile, self.member.steel)
+        key = ('Se(f)', nPoints, fMax, tol)
+        curve = cache.get(key)
+        if curve is None:
+            curve = cache.setdefault(key, SeCurve(self, nPoints= nPoints, fMax= fMax, tol= tol))
+        return curve
+
+    def s3_Se_effective_y(self, fFlange, Cs, origin, tol = 0.005, maxIter = 100, cx0 = None, telemetry = None, trace = None):
+        '''Modulo resistente efectivo respecto del eje y para la tension fFlange en la fibra extrema comprimida.
+
+        Cs = +1: el alma esta en compresion uniforme (2.2.1) y las alas con gradiente de tensiones (2.2.2).
+        Cs = -1: los labios estan en compresion uniforme (2.3.1) y las alas con gradiente de tensiones (2.2.2).
+        La posicion del eje neutro se itera hasta que la variacion relativa de la distancia a la fibra extrema
+        sea menor a tol.
+
         Parameters
         ----------
             fFlange : float
                 Tension a considerar en el elemento a compresion uniforme
             Cs : int [-1, +1]
                 +1: centro de corte a compresion, -1 centro de corte a traccion -> [Mny_plus, Mny_minus]
+            origin : string
+                Label para almacenar los resultados en results
             tol : float
                 Valor requerido a alcanzar del ratio relativo de la variacion de yMax entre dos iteraciones
             maxIter : int
                 Numero maximo de iteraciones admitidas
+            cx0 : float
+                Valor inicial del corrimiento del eje neutro (e.g. solucion a una tension cercana)
+            telemetry : dict
+                Si se indica, se completa con nIter, err, converged, cx, xc y xt
+            trace : bool
+                Registro de resultados intermedios en results[origin] (ver config). Por defecto el del analisis
+        Returns
+        -------
+            Sex : float
+                Modulo resistente efectivo, Iy/max(xc, xt)
+            nEffAreas : dict
+                Areas no efectivas (formato de adjustNeutralAxis). None en modo lean
 
+        Los resultados quedan en results[origin][1]: Sex, Iy, cx, xc (distancia del eje neutro a la fibra
+        extrema comprimida) y xt (distancia a la fibra extrema traccionada).
         '''
 
+        trace = self._trace(trace)
         profile= self.member.profile
         elements = profile.elements
         t= profile.t
         E0= self.member.steel.E0
-        nEffAreas= {}
+        nEffAreas= nonEffectiveAreas(Ix= profile.Iy, A= profile.A)
 
         # factor de multiplicacion para tener el cuenta elementos duplicados (e.g. flanges, lips)
         if profile.type in ['I_builtup_cee', 'I_builtup_cee_w_lps']:
@@ -692,84 +1049,65 @@ class ASCE_8_02:
         else:
             print('Seccion del tipo', profile.type,'no implementada en analisis 3.3.1 Se effecivo')
             raise NotImplementedError
-        
-        # chequeo si tiene lips
-        lipFlag = False
-        if 3 in elements.keys():
-            lip = elements[3]
-            lip[origin] = {}
-            lipFlag = True
-
-        # calculo beff para flange (en esta orientacion flanges-> web y lips; web -> flanges )
-        # web in uniform compression
-        if Cs > 0:
-            web = elements[2]
-            web[origin]= {}
-            if web['name'] != 'web':
-                print('El elemento', 2, 'no corresponde al tipo 1:<web>. Reordenar los elemenentos en el perfil',profile.type)
-                raise Exception('>> Analisis abortado <<')
-            elif web['type'] != 'stiffned':
-                print('El elemento:', web['name'], 'del perfil:', profile.name, 'no tiene asignada una clasificacion reconocida:', web['type'])
-                raise Exception('>> Analisis abortado <<')
-            b, midC = sec2_2_1(w= web['w'], t= t, f= fFlange, E= E0)
-            web[origin].update(midC)
-            web[origin]['b']= b
-            cx_ = profile.c_x - t/2.0
-            nEffAreas[2] = {'t': t, 'b_': (web['w'] - b), 'cy_': cx_, 'paralel': True}
-        
-            ## calculo el yCG, primer iteracion [web fully effective]
-            cx, Iy = adjustNeutralAxis(Ix= profile.Iy, A= profile.A, nEffAreas= nEffAreas)
-            xMAX = profile.B -(profile.c_x + cx) # distancia mayor desde el eje neutro al borde de la seccion
-            Sex = Iy/xMAX
-            web[origin].update({'Sex': Sex,'Iy': Iy, 'cx': cx})
-        elif Cs < 0 and lipFlag:
-            raise NotImplementedError
+        if Cs not in [-1, 1]:
+            print('Cs =', Cs, 'no reconocido. Valores admitidos: +1, -1')
+            raise Exception('>> Analisis abortado <<')
 
-        # calculo beff para flange, itero
+        web = elements[2]
         flange = elements[1]
-        flange[origin] = {}
+        if web['name'] != 'web':
+            print('El elemento', 2, 'no corresponde al tipo 1:<web>. Reordenar los elemenentos en el perfil',profile.type)
+            raise Exception('>> Analisis abortado <<')
+        elif web['type'] != 'stiffned':
+            print('El elemento:', web['name'], 'del perfil:', profile.name, 'no tiene asignada una clasificacion reconocida:', web['type'])
+            raise Exception('>> Analisis abortado <<')
         if flange['name'] != 'flange':
             print('El elemento', 1, 'no corresponde al tipo 1:<flange>. Reordenar los elemenentos en el perfil',profile.type)
             raise Exception('>> Analisis abortado <<')
         elif flange['type'] == 'unstiffned':
             print('El elemento:', flange['name'], 'del perfil:', profile.name, 'es del tipo:', flange['type'],'. Este perfil no esta implementado en s3_Se_effective_y()')
             raise NotImplementedError
-        elif flange['type'] == 'stiffned_w_slps':
-            if lip['name'] == 'lip':
-                _ = lip['w']                
-            else:
-                print('El elemento',3, 'no corresponde al tipo <lip>. Reordenar los elemenentos en el perfil',profile.type)
-                raise Exception('>> Analisis abortado <<')
-            #flange
-            err = 1.0
-            nIter = 0
-            while err > tol and nIter < maxIter:
-                f1= get_linear_stress(fFlange, yCG= profile.c_x + cx, y= profile.r_out)
-                f2= get_linear_stress(fFlange, yCG= profile.c_x + cx, y= profile.B - profile.r_out)
-                b1, b2, midC = sec2_2_2(w= flange['w'], t= t, f1= f1, f2=f2, E0= E0) 
-                flange[origin].update({'b1':b1, 'b2':b2, 'f1': f1, 'f2': f2})
-                flange.update(midC)
-
-                xMAX_prev = xMAX
-                if b1 + b2 < profile.c_x + cx - profile.r_out:
-                    b_ = profile.c_x + cx - profile.r_out - b1 - b2
-                    cy_= b1 + b_/2.0 - cx # distancia del centroide del area no-efectiva respecto de x-x (incial)
-                    nEffAreas[1]= {'t': t, 'b_': b_*2.0 , 'cy_': cy_, 'paralel': False}
-                    cx, Iy = adjustNeutralAxis(Ix= profile.Iy, A= profile.A, nEffAreas= nEffAreas)
-                    xMAX = profile.B -(profile.c_x + cx) # distancia mayor desde el eje neutro al borde de la seccion
-                    
-                err = abs((xMAX_prev-xMAX)/xMAX_prev)
-                nIter += 1
-            if nIter >= maxIter:
-                print('Sec. 3, determinacion de Se: Se alcanzo el numero maximo de iteraciones. Error % alcanzado:', err*100)
-        else:
+        elif flange['type'] != 'stiffned_w_slps':
             print('El elemento:', flange['name'], 'del perfil:', profile.name, 'no tiene asignada una clasificacion reconocida:', flange['type'])
             raise Exception('>> Analisis abortado <<')
-
-        Sex = Iy/xMAX
-        flange[origin].update({'Sex': Sex,'Iy': Iy, 'cx': cx})
-
-        return Sex, nEffAreas
+        lip = elements[3]
+        if lip['name'] != 'lip':
+            print('El elemento',3, 'no corresponde al tipo <lip>. Reordenar los elemenentos en el perfil',profile.type)
+            raise Exception('>> Analisis abortado <<')
+        if trace:
+            results = self._results(origin)
+            rWeb = results[2] = {}
+            rFlange = results[1] = {}
+            rLip = results[3] = {}
+
+        # calculo beff para el elemento en compresion uniforme (en esta orientacion flanges-> web y lips; web -> flanges )
+        # y para flange con gradiente de tensiones, iterando el eje neutro (ver effectiveSection_y)
+        p = {'t': t, 'B': profile.B, 'c_x': profile.c_x, 'r_out': profile.r_out, 'A': profile.A, 'Iy': profile.Iy,
+             'E0': E0, 'wFlange': flange['w'], 'wWeb': web['w'], 'wLip': lip['w']}
+        Sex, r = effectiveSection_y(fFlange, Cs, p, cx0= cx0, tol= tol, maxIter= maxIter)
+        Sex = float(Sex)
+        nIter, err = int(r['nIter']), float(r['err'])
+        Iy, cx, xc, xMAX = [float(r[key]) for key in ['Iy', 'cx', 'xc', 'xt']]
+        if nIter >= maxIter and err > tol:
+            print('Sec. 3, determinacion de Se: Se alcanzo el numero maximo de iteraciones. Error % alcanzado:', err*100)
+        if telemetry is not None:
+            telemetry.update({'nIter': nIter, 'err': err, 'converged': err <= tol, 'cx': cx, 'xc': xc, 'xt': xMAX})
+        if not trace:
+            return Sex, None
+
+        uniform = r['uniform']
+        rUniform = rWeb if Cs > 0 else rLip
+        rUniform.update({key: float(value) for key, value in uniform['midC'].items()})
+        rUniform['b'] = float(uniform['b'])
+        nEffAreas[2 if Cs > 0 else 3] = {'t': t, 'b_': float(uniform['b_']), 'cy_': float(uniform['cx_']), 'paralel': True}
+        rf = r['flange']
+        rFlange.update({key: float(rf[key]) for key in ['b1', 'b2', 'f1', 'f2']})
+        rFlange.update({key: float(value) for key, value in rf['midC'].items()})
+        if rf['b_'] > 0:
+            nEffAreas[1] = {'t': t, 'b_': float(rf['b_']), 'cy_': float(rf['cy_']), 'paralel': False}
+        rFlange.update({'Sex': Sex,'Iy': Iy, 'cx': cx, 'xc': xc, 'xt': xMAX})
+
+        return Sex, nEffAreas.asDict()
 
     def s3_3_2(self, FY_v = 0):
         '''Design Strength for Shear Only. Shear Buckling.
@@ -792,11 +1130,15 @@ class ASCE_8_02:
         -----
             >>> 
         '''
+        # independiente de la longitud: se comparte entre miembros de igual perfil y acero
+        return self._sectionResult(('sec3.3.2', FY_v), lambda: self._s3_3_2(FY_v), [], trace= True)
+
+    def _s3_3_2(self, FY_v):
+        '''Calculo de s3_3_2, sin cache.'''
         steel = self.member.steel
         profile = self.member.profile
 
         web = profile.elements[2]
-        web['sec3.3.1.1']= {}
         if web['name'] != 'web':
             print('El elemento', 2, 'no corresponde al tipo 1:<web>. Reordenar los elemenentos en el perfil',profile.type)
             raise Exception('>> Analisis abortado <<')
@@ -825,25 +1167,243 @@ class ASCE_8_02:
         midC= {'Vn': Vn, 'Av': Av, 'tau': tau}
         return fiVn, midC
 
+    def s3_3_3(self, Mu, Vu, stiffeners = False, fiMn = None, fiVn = None, prune = False):
+        '''Combined Bending and Shear. Verificacion 3.3.3 para un conjunto de casos de carga (Mu, Vu).
+
+            fiMn (s3_3_1) y fiVn (s3_3_2) se calculan una sola vez por miembro y las ecuaciones de interaccion
+            se evaluan sobre los arrays de solicitaciones. Ademas de la interaccion se verifican flexion (3.3.1)
+            y corte (3.3.2) por separado: la utilizacion de cada caso es la mayor de las tres relaciones.
+
+        Parameters
+        ----------
+            Mu, Vu : float or array
+                Momento y corte requeridos de cada caso de carga (se usa el valor absoluto)
+            stiffeners : bool
+                False: alma sin rigidizadores transversales, Ec 3.3.3-1.
+                True: alma con rigidizadores transversales, Ec 3.3.3-2 (solo si Mu/fiMn > 0.5 y Vu/fiVn > 0.7)
+            fiMn, fiVn : float
+                Resistencias de diseno. Por defecto las de s3_3_1() y s3_3_2()
+            prune : bool
+                True: solo se evaluan los casos no dominados (ver demand.prune_3_3_3). El caso que gobierna y su
+                utilizacion son los mismos; los casos descartados tienen utilizacion nan
+        Returns
+        -------
+            utilization : array
+                Utilizacion de cada caso de carga (<= 1 verifica)
+            midC : dict
+                fiMn, fiVn: resistencias de diseno
+                ratio_M, ratio_V, ratio_MV: relaciones de flexion, corte e interaccion de cada caso (de los casos
+                    evaluados si prune)
+                governing: indice del caso con mayor utilizacion
+                utilization_max: utilizacion del caso que gobierna
+                index, pruning: casos evaluados y resumen de la reduccion (solo si prune)
+        Raises
+        ------
+            none
+        Tests
+        -----
+            Example 9.1 - C-profile with LB consideration (fiMn y fiVn de referencia)
+            >>> p1 = c_profile(H= 7.0, B= 1.5, t= 0.135, r_out= (0.135+3/16) )
+            >>> p1.calculate()
+            >>> s = steel(FY= 50, E0= 27000, nu= 0.3, n= 4.58, offset= 0.002, name= 'SA301_1_4Hard')
+            >>> m = member(L= 30*12, profile= p1, steel= s, designParameters= designParameters(Ly= 2.5*12, Lz= 2.5*12, Cb= 1.685))
+            >>> analysis = ASCE_8_02(m)
+            >>> u, midC = analysis.s3_3_3(Mu= [44.16, 70.0, 10.0], Vu= [2.21, 20.0, 27.0], fiMn= 80.16, fiVn= 27.88)
+            >>> [round(float(r), 2) for r in midC['ratio_MV']], [round(float(r), 2) for r in u], midC['governing']
+            ([0.31, 1.28, 0.95], [0.55, 1.28, 0.97], 1)
+            >>> u, midC = analysis.s3_3_3(Mu= [44.16, 70.0, 10.0], Vu= [2.21, 20.0, 27.0], stiffeners= True, fiMn= 80.16, fiVn= 27.88)
+            >>> [round(float(r), 2) for r in midC['ratio_MV']], [round(float(r), 2) for r in u]
+            ([0.0, 0.95, 0.0], [0.55, 0.95, 0.97])
+            >>> u, midC = analysis.s3_3_3(Mu= [44.16, 70.0, 10.0, 40.0], Vu= [2.21, 20.0, 27.0, 2.0], fiMn= 80.16, fiVn= 27.88, prune= True)
+            >>> midC['governing'], round(midC['utilization_max'], 2), [bool(np.isnan(r)) for r in u]
+            (1, 1.28, [True, False, False, True])
+        '''
+        if fiMn is None:
+            fiMn, _ = self.s3_3_1(trace= False)
+        if fiVn is None:
+            fiVn, _ = self.s3_3_2()
+        Mu = np.abs(np.asarray(Mu, dtype= float))
+        Vu = np.abs(np.asarray(Vu, dtype= float))
+        if prune:
+            index, report = prune_3_3_3(Mu, Vu)
+            Mu, Vu = [v.ravel()[index] for v in np.broadcast_arrays(Mu, Vu)]
+
+        ratio_M = Mu/fiMn
+        ratio_V = Vu/fiVn
+        if stiffeners:
+            ratio_MV = np.where((ratio_M > 0.5) & (ratio_V > 0.7), E_3_3_3_e2(fiMn= fiMn, fiVn= fiVn, Mu= Mu, Vu= Vu), 0.0)
+        else:
+            ratio_MV = E_3_3_3_e1(fiMn= fiMn, fiVn= fiVn, Mu= Mu, Vu= Vu)
+        utilization = np.maximum(np.maximum(ratio_M, ratio_V), ratio_MV)
+        governing = int(np.argmax(utilization))
+
+        midC = {'fiMn': fiMn, 'fiVn': fiVn, 'ratio_M': ratio_M, 'ratio_V': ratio_V, 'ratio_MV': ratio_MV,
+                'governing': governing, 'utilization_max': float(utilization.flat[governing])}
+        if prune:
+            utilization, midC = self._unprune(utilization, midC, index, report)
+        return utilization, midC
+
+    def _unprune(self, utilization, midC, index, report):
+        '''Lleva la utilizacion de los casos evaluados (index) al conjunto completo, con nan en los descartados.'''
+        full = np.full(report['nPoints'], np.nan)
+        full[index] = utilization
+        midC.update({'governing': int(index[midC['governing']]), 'index': index, 'pruning': report})
+        return full, midC
+
+    def _webCrippling(self):
+        '''Tipo de alma y de alas del perfil para 3.3.4 y 3.3.5.'''
+        profile = self.member.profile
+        if profile.type in ['I_builtup_cee', 'I_builtup_cee_w_lps']:
+            return 'I', 'STIFF' if profile.type == 'I_builtup_cee_w_lps' else 'UNSTIFF'
+        elif profile.type in ['cee', 'c_w_lps']:
+            return 'single', 'STIFF' if profile.type == 'c_w_lps' else 'UNSTIFF'
+        print('Seccion del tipo', profile.type,'no implementada en analisis 3.3.4.')
+        raise NotImplementedError
+
+    def s3_3_4(self, N, reaction = 'end', opposing = False, theta = 90, units = 'SI'):
+        '''Web Crippling Strength. Tabla 3.3.4-1 para perfiles de alma simple (C) y secciones I.
+
+            N, reaction y opposing pueden ser arrays (uno por apoyo o carga concentrada): todos se evaluan
+            en una sola llamada a sec3_3_4.
+
+        Parameters
+        ----------
+            N : float or array
+                Longitud de apoyo
+            reaction : string or array of string
+                'end' reaccion extrema o 'interior' reaccion/carga interior
+            opposing : bool or array of bool
+                True si hay cargas opuestas separadas menos de 1.5h
+            theta : float
+                Angulo entre el plano del alma y la superficie de apoyo, en grados
+            units : string
+                Sistema de unidades del perfil y del acero: 'SI' (N, mm, MPa) o 'US' (kips, in, ksi)
+        Returns
+        -------
+            fiPn : float or array
+                Resistencia de diseno a la abolladura del alma
+            midC : dict
+                Resultados intermedios de sec3_3_4. Si algun apoyo esta fuera del rango de la Tabla 3.3.4-1
+                (midC['inRange'] False) se imprime una advertencia
+        Raises
+        ------
+            NotImplementedError: tipo de perfil no implementado
+        Tests
+        -----
+            >>> p1 = c_w_lps_profile(H= 7.415 + 2*0.3225, B= 2.5, D= 0.8, t= 0.135, r_out= 0.3225)
+            >>> p1.calculate()
+            >>> s = steel(FY= 30, E0= 27000, nu= 0.3, n= 9.7, offset= 0.002, name= 'SA409_long')
+            >>> analysis = ASCE_8_02(member(L= 120, profile= p1, steel= s, designParameters= designParameters()))
+            >>> fiPn, midC = analysis.s3_3_4(N= [3.5, 3.5], reaction= ['end', 'interior'], units= 'US')
+            >>> [round(float(P), 2) for P in fiPn], midC['fi']
+            ([4.21, 6.79], 0.7)
+            >>> fiPn, midC = analysis.s3_3_4(N= [3.5, 30.0], units= 'US')
+            Advertencia: Seccion 3.3.4 - 1 apoyos con N/t > 210 o N/h > 3.5, fuera del rango de la Tabla 3.3.4-1
+            >>> midC['inRange'].tolist()
+            [True, False]
+        '''
+        profile = self.member.profile
+        webs, flange = self._webCrippling()
+        t = profile.t
+        h = profile.H - 2*profile.r_out # altura plana del alma
+        R = profile.r_out - t           # radio interior de plegado
+        fiPn, midC = sec3_3_4(FY= self.member.steel.FY, t= t, h= h, R= R, N= N, reaction= reaction, opposing= opposing,
+                              webs= webs, flange= flange, theta= theta, units= units)
+        if not np.all(midC['inRange']):
+            print('Advertencia: Seccion 3.3.4 -', int(np.size(midC['inRange']) - np.sum(midC['inRange'])), 'apoyos con N/t > 210 o N/h > 3.5, fuera del rango de la Tabla 3.3.4-1')
+        return fiPn, midC
+
+    def s3_3_5(self, Pu, Mu, N, reaction = 'end', opposing = False, theta = 90, units = 'SI', fiMn = None):
+        '''Combined Bending and Web Crippling. Verificacion 3.3.5 para un conjunto de apoyos o cargas concentradas.
+
+            fiPn (s3_3_4) se evalua para todos los apoyos en una sola llamada y fiMn (s3_3_1) una vez por miembro.
+            Se aplica Ec 3.3.5-1 a perfiles de alma simple y Ec 3.3.5-2 a secciones I. Ademas de la interaccion
+            se verifican abolladura (3.3.4) y flexion (3.3.1) por separado.
 
-    def s3_4(self):
+        Parameters
+        ----------
+            Pu, Mu : float or array
+                Reaccion o carga concentrada y momento requeridos en cada apoyo (se usa el valor absoluto)
+            N, reaction, opposing, theta, units :
+                ver s3_3_4()
+            fiMn : float
+                Resistencia de diseno a flexion. Por defecto la de s3_3_1()
+        Returns
+        -------
+            utilization : array
+                Utilizacion de cada apoyo (<= 1 verifica)
+            midC : dict
+                fiPn, fiMn: resistencias de diseno
+                ratio_P, ratio_M, ratio_PM: relaciones de abolladura, flexion e interaccion de cada apoyo
+                governing: indice del apoyo con mayor utilizacion
+                utilization_max: utilizacion del apoyo que gobierna
+        Raises
+        ------
+            NotImplementedError: tipo de perfil no implementado
+        Tests
+        -----
+            Ec 3.3.5-1 (alma simple) con fiMn de Example 9.1
+            >>> p1 = c_w_lps_profile(H= 7.415 + 2*0.3225, B= 2.5, D= 0.8, t= 0.135, r_out= 0.3225)
+            >>> p1.calculate()
+            >>> s = steel(FY= 30, E0= 27000, nu= 0.3, n= 9.7, offset= 0.002, name= 'SA409_long')
+            >>> analysis = ASCE_8_02(member(L= 120, profile= p1, steel= s, designParameters= designParameters()))
+            >>> u, midC = analysis.s3_3_5(Pu= [2.0, 4.05], Mu= 44.16, N= 3.5, reaction= ['end', 'interior'], units= 'US', fiMn= 80.16)
+            >>> [round(float(r), 2) for r in midC['ratio_P']], [round(float(r), 2) for r in midC['ratio_PM']], midC['governing']
+            ([0.47, 0.6], [0.75, 0.84], 1)
+
+            Ec 3.3.5-2 (seccion I)
+            >>> p2 = I_builtup_c_profile(H= 6, B= 1.5, t= 0.135, r_out= (0.135+3/16) )
+            >>> p2.calculate()
+            >>> analysis = ASCE_8_02(member(L= 120, profile= p2, steel= s, designParameters= designParameters()))
+            >>> u, midC = analysis.s3_3_5(Pu= 4.0, Mu= 20.0, N= 3.5, units= 'US', fiMn= 40.0)
+            >>> bool(midC['ratio_PM'] == (0.82*4.0/midC['fiPn'] + 20.0/40.0)/1.32), midC['fiPn'] > 4.0
+            (True, True)
+        '''
+        fiPn, _ = self.s3_3_4(N= N, reaction= reaction, opposing= opposing, theta= theta, units= units)
+        if fiMn is None:
+            fiMn, _ = self.s3_3_1(trace= False)
+        Pu = np.abs(np.asarray(Pu, dtype= float))
+        Mu = np.abs(np.asarray(Mu, dtype= float))
+
+        ratio_P = Pu/fiPn
+        ratio_M = Mu/fiMn
+        if self._webCrippling()[0] == 'single':
+            ratio_PM = E_3_3_5_e1(Pu= Pu, fiPn= fiPn, Mu= Mu, fiMn= fiMn)
+        else:
+            ratio_PM = E_3_3_5_e2(Pu= Pu, fiPn= fiPn, Mu= Mu, fiMn= fiMn)
+        utilization = np.maximum(np.maximum(ratio_P, ratio_M), ratio_PM)
+        governing = int(np.argmax(utilization))
+
+        midC = {'fiPn': fiPn, 'fiMn': fiMn, 'ratio_P': ratio_P, 'ratio_M': ratio_M, 'ratio_PM': ratio_PM,
+                'governing': governing, 'utilization_max': float(utilization.flat[governing])}
+        return utilization, midC
+
+
+    def s3_4(self, trace = None, L = None, Kx = None, Ky = None, Kz = None, Lx = None, Ly = None, Lz = None):
         '''Design axial strength. 
             
             Ec 3.4-1: Tension menor de estados limites FB, TB, FTB multiplicada por factor de resistencia y area efectiva.
+
+            Si alguno de L, Kx, Ky, Kz, Lx, Ly, Lz es un array se evalua la curva de columna completa en una sola
+            llamada vectorizada: fiPn, Fn, Pn, Ae, ... son arrays (ver _bucklingLengths). En ese caso no se
+            registran los anchos efectivos de cada elemento en results['sec 3.4-fiPn'].
         
         Parameters
         ----------
-            none
+            trace : bool
+                Registro de resultados intermedios (ver config). En modo lean se devuelve midC = None
+            L, Kx, Ky, Kz, Lx, Ly, Lz : float or array
+                Longitudes y factores de longitud efectiva. Por defecto los de member.dP
         Returns
         -------
-            fiPn : float
+            fiPn : float or array
                 Resistencia axial de diseño
-            fiPno : float
-                Resistencia axial de diseño nominal (f=FY)
-            [Fn_FB, Fn_TB, Fn_FTB, Ae] : list of float
-                Fn_FB: Tension de pandeo flexional
+            midC : dict
+                fiPno: Resistencia axial de diseño nominal (f=FY)
+                Fn_FBx, Fn_FBy: Tension de pandeo flexional
                 Fn_TB: Tension de pandeo torsional
                 Fn_FTB: Tension de pandeo flexo-torsional
+                Fn, Pn: Tension y carga nominal
                 Ae: Area efectiva calculada a Fn
         Raises
         ------
@@ -853,17 +1413,21 @@ class ASCE_8_02:
             En archivo
         '''
         FY = self.member.steel.FY
-        ([Fn_FBx, _], [Fn_FBy, _]) = self.s3_FB()
-        (Fn_TB, _) = self.s3_TB()
-        (Fn_FTB, _) = self.s3_FTB()
+        Fn_modes = self.s3_buckling(L= L, Kx= Kx, Ky= Ky, Kz= Kz, Lx= Lx, Ly= Ly, Lz= Lz).Fn(['FBx', 'FBy', 'TB', 'FTB'])
+        Fn_FBx, Fn_FBy, Fn_TB, Fn_FTB = Fn_modes['FBx'], Fn_modes['FBy'], Fn_modes['TB'], Fn_modes['FTB']
 
-        Fn = min(Fn_FBx, Fn_FBy, Fn_TB, Fn_FTB)
-
-        Ae = self.s2_Ae_compMemb(Fn, origin= 'sec 3.4-fiPn')
+        trace = self._trace(trace)
+        if np.ndim(Fn_FBx) > 0:
+            Fn = np.minimum(np.minimum(Fn_FBx, Fn_FBy), np.minimum(Fn_TB, Fn_FTB))
+            Ae, _ = self.s2_Ae_compMemb_vec(Fn)
+        else:
+            Fn = min(Fn_FBx, Fn_FBy, Fn_TB, Fn_FTB)
+            Ae = self.s2_Ae_compMemb(Fn, origin= 'sec 3.4-fiPn', trace= trace)
         fiPn = E_3_4_e1(Fn, Ae)
+        if not trace:
+            return fiPn, None
 
-        Ae_no = self.s2_Ae_compMemb(FY, origin= 'sec 3.4-fiPno')
-        fiPno = E_3_4_e1(FY, Ae_no)
+        Ae_no, fiPno = self._s3_4_nominal(trace)
 
         midC = {'fiPno': fiPno, 'Pno': Ae_no*FY ,'Pn': Ae*Fn, 
                 'Fn_FBx': Fn_FBx, 'Fn_FBy': Fn_FBy, 'Fn_TB': Fn_TB, 'Fn_FTB':Fn_FTB,
@@ -871,8 +1435,158 @@ class ASCE_8_02:
 
         return fiPn, midC
 
+    def _s3_4_nominal(self, trace):
+        '''Area efectiva y resistencia axial de diseno nominal (f = FY): Ae_no, fiPno.'''
+        FY = self.member.steel.FY
+        def nominal():
+            Ae_no = self.s2_Ae_compMemb(FY, origin= 'sec 3.4-fiPno', trace= True)
+            return Ae_no, E_3_4_e1(FY, Ae_no)
+        # independiente de la longitud: se comparte entre miembros de igual perfil y acero
+        return self._sectionResult(('sec 3.4-fiPno',), nominal, ['sec 3.4-fiPno'], trace)
+
+    def _Lmax(self, capacity, demand, L0, tol, maxIter):
+        '''Mayor longitud L con capacity(L) >= demand, para capacity no creciente en L.
+
+            Se acota la raiz duplicando (o dividiendo) L0 y se resuelve con root_iter sobre
+            L*(1 + tol/2 - capacity(L)/demand), creciente en L, con tolerancia tol/2: la convergencia en el
+            residuo asegura demand <= capacity(L) <= (1 + tol)*demand. Si el ultimo punto evaluado no cumple la
+            demanda (convergencia por ancho del intervalo) se devuelve el extremo inferior del intervalo
+            (info['lo']), por lo que siempre capacity(Lmax) >= demand.
+        '''
+        nEval = [0]
+        last = [None]
+        evaluated = {}
+        def residual(L):
+            nEval[0] += 1
+            last[0] = evaluated[L] = capacity(L)
+            return L*(1.0 + tol/2 - last[0]/demand)
+
+        L0 = float(L0)
+        r0 = residual(L0)
+        if r0 <= 0:
+            lo, rLo, hi, rHi = L0, r0, 2.0*L0, residual(2.0*L0)
+            while rHi <= 0:
+                if nEval[0] >= maxIter:
+                    print('La resistencia supera', demand, 'para toda longitud hasta', hi)
+                    return float('inf'), {'nIter': nEval[0], 'converged': False}
+                lo, rLo, hi = hi, rHi, 2.0*hi
+                rHi = residual(hi)
+        else:
+            capHi = last[0]
+            lo, rLo, hi, rHi = 0.5*L0, residual(0.5*L0), L0, r0
+            while rLo > 0:
+                # la resistencia dejo de crecer (Fn = FY u otra longitud gobierna) o se agotaron las iteraciones
+                if last[0] <= capHi*(1 + 1e-9) or nEval[0] >= maxIter:
+                    print('La resistencia no alcanza', demand, 'para ninguna longitud (maximo', last[0], ')')
+                    return 0.0, {'nIter': nEval[0], 'converged': False}
+                capHi = last[0]
+                lo, hi, rHi = 0.5*lo, lo, rLo
+                rLo = residual(lo)
+        # primer punto por interpolacion lineal en el intervalo
+        slope = (rHi - rLo)/(hi - lo)
+        L, info = root_iter(residual, lo, hi, x0= lo - rLo/slope, slope= slope, tol= tol/2, maxIter= maxIter - nEval[0])
+        if evaluated[L] < demand:
+            L = info['lo']
+        info.update({'nIter': nEval[0], 'capacity': evaluated[L]})
+        return L, info
+
+    def s3_4_Lmax(self, Pu, length = 'L', L0 = None, tol = 0.005, maxIter = 50):
+        '''Longitud maxima del miembro para la carga axial requerida Pu (fiPn(L) = Pu).
+
+            fiPn es no creciente con las longitudes de pandeo, por lo que la raiz se acota y se resuelve con
+            root_iter (secante con biseccion de resguardo). Cada evaluacion es un s3_4 en modo lean; los
+            resultados independientes de la longitud se toman del cache por perfil y acero.
+
+        Parameters
+        ----------
+            Pu : float
+                Carga axial requerida
+            length : string
+                Longitud a variar: 'L' (Lx = Ly = Lz = L), 'Lx', 'Ly' o 'Lz'. Las demas se toman de member.dP
+            L0 : float
+                Valor inicial. Por defecto member.L
+            tol : float
+                Tolerancia relativa en fiPn: Pu <= fiPn(Lmax) <= (1 + tol)*Pu
+            maxIter : int
+                Numero maximo de evaluaciones de s3_4
+        Returns
+        -------
+            Lmax : float
+                Longitud maxima (inf si fiPn >= Pu para toda longitud, 0 si fiPn < Pu aun para longitudes muy cortas).
+                Siempre fiPn(Lmax) >= Pu
+            info : dict
+                nIter: evaluaciones de s3_4, capacity: fiPn(Lmax), converged, err, lo, hi (ver root_iter)
+        Raises
+        ------
+            Exception : si length no es 'L', 'Lx', 'Ly' o 'Lz'
+        Tests
+        -----
+            >>> p1 = c_w_lps_profile(H= 100, B= 50, D= 12, t= 1.5, r_out= 3.75)
+            >>> p1.calculate()
+            >>> s = steel(FY= 337, E0= 180510.0, nu= 0.3, n= 13.5, offset= 0.002, name= 'SA304_1_4Hard')
+            >>> analysis = ASCE_8_02(member(L= 1000, profile= p1, steel= s, designParameters= designParameters(Kx= 0.7, Ky= 0.7, Kz= 0.7)))
+            >>> for Pu in [50000.0, 30000.0, 5000.0]:
+            ...     Lmax, info = analysis.s3_4_Lmax(Pu)
+            ...     fiPn = analysis.s3_4(L= Lmax, trace= False)[0]
+            ...     print(fiPn >= Pu, fiPn <= 1.005*Pu, fiPn == info['capacity'])
+            True True True
+            True True True
+            True True True
+        '''
+        if length not in ['L', 'Lx', 'Ly', 'Lz']:
+            print('Longitud', length, 'no reconocida. Valores admitidos: L, Lx, Ly, Lz')
+            raise Exception('>> Analisis abortado <<')
+        capacity = lambda L: self.s3_4(trace= False, **{length: L})[0]
+        return self._Lmax(capacity, Pu, self.member.L if L0 is None else L0, tol, maxIter)
+
+    def s3_3_1_Lmax(self, Mu, length = 'L', L0 = None, tol = 0.005, maxIter = 50):
+        '''Longitud maxima sin arriostramiento lateral (separacion de arriostramientos) para el momento requerido
+        Mu (fiMn(L) = Mu). Mismo esquema que s3_4_Lmax, con evaluaciones de s3_3_1 en modo lean.
+
+        Parameters
+        ----------
+            Mu : float
+                Momento requerido
+            length : string
+                Longitud a variar: 'L' (L = Ly = Lz, separacion de arriostramientos), 'Ly' o 'Lz'
+            L0 : float
+                Valor inicial. Por defecto member.L
+            tol : float
+                Tolerancia relativa en fiMn: Mu <= fiMn(Lmax) <= (1 + tol)*Mu
+            maxIter : int
+                Numero maximo de evaluaciones de s3_3_1
+        Returns
+        -------
+            Lmax : float
+                Longitud maxima (inf si fiMn >= Mu para toda longitud, 0 si Mu supera la resistencia de la seccion).
+                Siempre fiMn(Lmax) >= Mu
+            info : dict
+                nIter: evaluaciones de s3_3_1, capacity: fiMn(Lmax), converged, err, lo, hi (ver root_iter)
+        Raises
+        ------
+            Exception : si length no es 'L', 'Ly' o 'Lz'
+        Tests
+        -----
+            >>> p1 = c_w_lps_profile(H= 100, B= 50, D= 12, t= 1.5, r_out= 3.75)
+            >>> p1.calculate()
+            >>> s = steel(FY= 337, E0= 180510.0, nu= 0.3, n= 13.5, offset= 0.002, name= 'SA304_1_4Hard')
+            >>> analysis = ASCE_8_02(member(L= 1000, profile= p1, steel= s, designParameters= designParameters()))
+            >>> for Mu in [2.0e6, 1.2e6, 3.0e5]:
+            ...     Lmax, info = analysis.s3_3_1_Lmax(Mu)
+            ...     fiMn = analysis.s3_3_1(L= Lmax, trace= False)[0]
+            ...     print(fiMn >= Mu, fiMn <= 1.005*Mu, fiMn == info['capacity'])
+            True True True
+            True True True
+            True True True
+        '''
+        if length not in ['L', 'Ly', 'Lz']:
+            print('Longitud', length, 'no reconocida. Valores admitidos: L, Ly, Lz')
+            raise Exception('>> Analisis abortado <<')
+        capacity = lambda L: self.s3_3_1(trace= False, **{length: L})[0]
+        return self._Lmax(capacity, Mu, self.member.L if L0 is None else L0, tol, maxIter)
 
-    def s2_Ae_compMemb(self, f, origin):
+
+    def s2_Ae_compMemb(self, f, origin, useCurve = False, trace = None):
         '''Area efectiva para miembros a compresion, segun 2.2.1 (stiffned), 2.3.1 (unstiffned) y 2.4.2 (stiffned_w_slps)
         
         Parameters
@@ -880,7 +1594,11 @@ class ASCE_8_02:
             f : float
                 Valor de la tension a compresion uniforme del elemento
             origin : string
-                Label para almacenar los midC
+                Label para almacenar los midC en results
+            useCurve : bool
+                Si es True se interpola en la curva Ae(f) de s2_Ae_curve() y no se almacenan los midC
+            trace : bool
+                Almacenar los midC en results[origin] (ver config). Por defecto el del analisis
         Returns
         -------
             Ae : float
@@ -892,6 +1610,9 @@ class ASCE_8_02:
         -----
             En archivo
         '''
+        if useCurve:
+            return float(self.s2_Ae_curve()(f))
+
         profile= self.member.profile
         # inicio con el area neta
         Ae = profile.A
@@ -907,60 +1628,256 @@ class ASCE_8_02:
             print('Seccion del tipo', profile.type,'no implementada en analisis 3.3.1 Se effecivo')
             raise NotImplementedError
 
-        for element in elements.values():
+        trace = self._trace(trace)
+        if trace:
+            results = self._results(origin)
+        for key, element in elements.items():
+            A_ = 0.0 # el lip se descuenta junto con su flange
             if element['type'] == 'stiffned':
-                element[origin]= {}
                 b, midC = sec2_2_1(w= element['w'], t= t, f= f, E= E0)
-                element[origin].update({'b':b,'rho': midC['rho'],'esbeltez': midC['esbeltez']})
-                element[origin]['A_'] = (element['w'] - b)*t
+                A_ = (element['w'] - b)*t
+                if trace:
+                    results[key]= {'b':b,'rho': midC['rho'],'esbeltez': midC['esbeltez'], 'A_': A_}
             elif element['type'] == 'unstiffned' and element['name'] != 'lip':
-                element[origin]= {}
                 b, midC = sec2_3_1(w= element['w'], t= t, f= f, E= E0)
-                element[origin].update({'b':b,'rho': midC['rho'],'esbeltez': midC['esbeltez']})
-                element[origin]['A_'] = (element['w'] - b)*t*nEf
+                A_ = (element['w'] - b)*t*nEf
+                if trace:
+                    results[key]= {'b':b,'rho': midC['rho'],'esbeltez': midC['esbeltez'], 'A_': A_}
             elif element['type'] == 'stiffned_w_slps':
-                element[origin]= {}
                 if elements[3]['name'] == 'lip':
                     d = elements[3]['w']
                     lip = elements[3]
-                    lip[origin]= {}
                 else:
                     print('El elemento',3, 'no corresponde al tipo <lip>. Reordenar los elemenentos en el perfil',profile.type)
                     raise Exception('>> Analisis abortado <<')
                 b, midC = sec2_4_2(E0=E0, f = f, w= element['w'], t= t, d=d, r_out= profile.r_out)
-                element[origin].update(midC)
-                element[origin]['b']= b
-                element[origin]['A_'] = (element['w'] - b)*t*nEf
+                A_ = (element['w'] - b)*t*nEf
+                if trace:
+                    results[key]= dict(midC, b= b, A_= A_)
+                Ae = Ae - A_
 
                 #lip
+                ds = midC['ds']
                 b, midC = sec2_3_1(w= lip['w'], t= t, f= f, E= E0)
-                lip[origin].update(midC)
-                lip[origin]['b']= b
-                if element[origin]['ds'] < b: # ancho efectivo del lip (ver definicion ds en 2.4)
-                    lip[origin]['b'] = element[origin]['ds']
-                lip[origin]['A_'] = (lip['w'] - lip[origin]['b'])*t*nEf
+                if ds < b: # ancho efectivo del lip (ver definicion ds en 2.4)
+                    b = ds
+                A_ = (lip['w'] - b)*t*nEf
+                if trace:
+                    results[3]= dict(midC, b= b, A_= A_)
             elif element['name'] != 'lip':
                 print('El elemento:',element['name'], 'del perfil:',profile.name, 'no tiene asignada una clasificacion reconocida:', element['type'])
                 raise Exception('>> Analisis abortado <<')
 
-            Ae =  Ae - element[origin]['A_']
+            Ae =  Ae - A_
         return Ae
 
+    def s2_Ae_compMemb_vec(self, f):
+        '''Area efectiva para miembros a compresion evaluada en un array de tensiones. Mismo criterio que s2_Ae_compMemb.
+
+        Parameters
+        ----------
+            f : array
+                Tensiones de compresion uniforme
+        Returns
+        -------
+            Ae : array
+                Area efectiva para cada tension
+            b : dict
+                Ancho efectivo de cada elemento {key: array}, con la misma clave que profile.elements
+        Raises
+        ------
+            none
+        Tests
+        -----
+            En archivo
+        '''
+        profile= self.member.profile
+        elements = profile.elements
+        t= profile.t
+        E0= self.member.steel.E0
+        f = np.asarray(f, dtype= float)
+
+        if profile.type in ['I_builtup_cee', 'I_builtup_cee_w_lps']:
+            nEf= 4.0
+        elif profile.type in ['cee', 'c_w_lps']:
+            nEf= 2.0
+        else:
+            print('Seccion del tipo', profile.type,'no implementada en analisis 3.3.1 Se effecivo')
+            raise NotImplementedError
+
+        Ae = np.full_like(f, profile.A)
+        b = {}
+        for key, element in elements.items():
+            if element['type'] == 'stiffned':
+                b[key], _ = sec2_2_1_vec(w= element['w'], t= t, f= f, E= E0)
+                Ae = Ae - (element['w'] - b[key])*t
+            elif element['type'] == 'unstiffned' and element['name'] != 'lip':
+                b[key], _ = sec2_3_1_vec(w= element['w'], t= t, f= f, E= E0)
+                Ae = Ae - (element['w'] - b[key])*t*nEf
+            elif element['type'] == 'stiffned_w_slps':
+                if elements[3]['name'] != 'lip':
+                    print('El elemento',3, 'no corresponde al tipo <lip>. Reordenar los elemenentos en el perfil',profile.type)
+                    raise Exception('>> Analisis abortado <<')
+                lip = elements[3]
+                b[key], midC = sec2_4_2_vec(E0=E0, f = f, w= element['w'], t= t, d=lip['w'], r_out= profile.r_out)
+                Ae = Ae - (element['w'] - b[key])*t*nEf
+
+                #lip
+                bLip, _ = sec2_3_1_vec(w= lip['w'], t= t, f= f, E= E0)
+                b[3] = np.minimum(bLip, midC['ds']) # ancho efectivo del lip (ver definicion ds en 2.4)
+                Ae = Ae - (lip['w'] - b[3])*t*nEf
+            elif element['name'] != 'lip':
+                print('El elemento:',element['name'], 'del perfil:',profile.name, 'no tiene asignada una clasificacion reconocida:', element['type'])
+                raise Exception('>> Analisis abortado <<')
+        return Ae, b
+
+    def s2_Ae_curve(self, tol = 1e-3):
+        '''Curva Ae(f) entre 0 y FY para el perfil y acero del miembro. Se construye la primera vez que se
+        solicita y se comparte (sectionCache) con todos los miembros de igual perfil y acero.
+
+        Parameters
+        ----------
+            tol : float
+                Cota del error de interpolacion relativo al area bruta A (ver AeCurve)
+        Returns
+        -------
+            curve : class AeCurve
+                curve(f) devuelve Ae y curve.b(f, key) el ancho efectivo del elemento key
+        Tests
+        -----
+            En archivo
+        '''
+        cache = sectionCache(self.member.profile, self.member.steel)
+        key = ('Ae(f)', tol)
+        curve = cache.get(key)
+        if curve is None:
+            curve = cache.setdefault(key, AeCurve(self, tol= tol))
+        return curve
+
+
+    def s2_deflection(self, Ms, load = 'uniform', L = None, f0 = None, tol = 1e-6, maxIter = 50):
+        '''Flechas del miembro (flexion respecto de x) para un array de momentos maximos de servicio Ms.
 
-    def s3_FTB(self):
+        Para cada nivel de carga se itera la tension de servicio fd en el ala comprimida con la inercia efectiva
+        Ie(fd) (anchos efectivos de la seccion 2 con fd, deflection determination), y la flecha se calcula con el
+        modulo secante Es a esa tension. Todos los niveles de carga se resuelven juntos sobre la curva s3_Se_curve,
+        compartida por perfil y acero. Ver modulo serviceability.
+
+        Parameters
+        ----------
+            Ms : float or array
+                Momentos maximos de servicio
+            load : string or float
+                'uniform', 'point', 'moment', 'cantilever_uniform', 'cantilever_point' o el coeficiente K de
+                delta = K*Ms*L**2/(Es*Ie)
+            L : float
+                Luz. Por defecto la longitud del miembro
+            f0 : float or array
+                Tensiones iniciales (e.g. de una historia de carga anterior). Por defecto la inversa tabulada de f*Se(f)
+            tol : float
+                Tolerancia relativa en el residuo de momento
+            maxIter : int
+                Numero maximo de iteraciones
+        Returns
+        -------
+            delta : array
+                Flecha de cada nivel de carga
+            midC : dict
+                {'K', 'fd', 'ft', 'Ie', 'Es', 'nIter', 'converged', 'yielded'}
+        Tests
+        -----
+            En archivo
+        '''
+        L = self.member.L if L is None else L
+        return serviceability.deflection(self, Ms, L, load= load, f0= f0, tol= tol, maxIter= maxIter)
+
+    def fsm_signature(self, load = 'axial', L = None, nModes = 1):
+        '''Curva de firma del perfil por el metodo de las franjas finitas: tension critica elastica en funcion de la
+        semilongitud de onda, con los minimos de pandeo local y distorsional. Se calcula la primera vez que se
+        solicita y se comparte (sectionCache) con todos los miembros de igual perfil y acero.
+
+        Parameters
+        ----------
+            load : string
+                'axial' (compresion uniforme) o 'bending' (flexion respecto de x, ala superior comprimida)
+            L : array
+                Semilongitudes de onda. Por defecto 60 valores logaritmicos entre 0.1 y 30 veces la altura
+            nModes : int
+                Cantidad de modos por semilongitud
+        Returns
+        -------
+            curve : class fsm.signatureCurve
+                curve.L, curve.fcr y curve.minima ({'local': (L, fcr), 'distortional': (L, fcr)}, 'distortional'
+                solo en perfiles con labios)
+        Tests
+        -----
+            En archivo
+        '''
+        return fsm.signature(self.member.profile, self.member.steel, load= load, L= L, nModes= nModes)
+
+    def _bucklingLengths(self, L = None, Kx = None, Ky = None, Kz = None, Lx = None, Ly = None, Lz = None):
+        '''Factores y longitudes de pandeo (Kx, Ky, Kz, Lx, Ly, Lz) para s3_FB, s3_TB, s3_FTB y s3_4.
+
+            Los valores no indicados se toman de member.dP; si se indica L, se usa para las longitudes
+            Lx, Ly, Lz no indicadas. Si alguno es un array, todos se devuelven como arrays de la misma forma.
+        '''
+        dP = self.member.dP
+        Lx, Ly, Lz = [(dP_L if L is None else L) if Li is None else Li for Li, dP_L in [(Lx, dP.Lx), (Ly, dP.Ly), (Lz, dP.Lz)]]
+        Kx, Ky, Kz = [dP_K if Ki is None else Ki for Ki, dP_K in [(Kx, dP.Kx), (Ky, dP.Ky), (Kz, dP.Kz)]]
+        values = [Kx, Ky, Kz, Lx, Ly, Lz]
+        if any(np.ndim(v) > 0 for v in values):
+            values = [np.array(v, dtype= float) for v in np.broadcast_arrays(*values)]
+        return values
+
+    def s3_buckling(self, L = None, Kx = None, Ky = None, Kz = None, Lx = None, Ly = None, Lz = None, Cb = None):
+        '''Tensiones criticas elasticas de pandeo del miembro (FB, TB, FTB y LTB) con las magnitudes intermedias
+        compartidas (x0, r0, sigma_ex, sigma_ey, sigma_t) evaluadas una sola vez.
+
+        Parameters
+        ----------
+            L, Kx, Ky, Kz, Lx, Ly, Lz : float or array
+                Longitudes y factores de longitud efectiva. Por defecto los de member.dP (ver _bucklingLengths)
+            Cb : float or array
+                Coeficiente de flexion. Por defecto member.dP.Cb, o el calculado de member.dP.Mdiagram si dP.Cb = 0
+        Returns
+        -------
+            buckling : class elasticBuckling
+                buckling[mode] devuelve la tension critica con eta = 1 y buckling.Fn(modes) la tension nominal
+        Tests
+        -----
+            En archivo
+        '''
+        Kx, Ky, Kz, Lx, Ly, Lz = self._bucklingLengths(L= L, Kx= Kx, Ky= Ky, Kz= Kz, Lx= Lx, Ly= Ly, Lz= Lz)
+        return elasticBuckling(self.member.profile, self.member.steel, Kx= Kx, Ky= Ky, Kz= Kz, Lx= Lx, Ly= Ly, Lz= Lz,
+                               L= self.member.L if L is None else L, Cb= self._Cb() if Cb is None else Cb)
+
+    def _Cb(self):
+        '''Coeficiente de flexion del miembro: dP.Cb, o calculado del diagrama de momentos dP.Mdiagram si dP.Cb = 0.'''
+        dP = self.member.dP
+        if np.ndim(dP.Cb) > 0 or dP.Cb != 0:
+            return dP.Cb
+        Mdiagram = getattr(dP, 'Mdiagram', None)
+        if Mdiagram is None:
+            print('Cb = 0 en el miembro', self.member.name, 'sin diagrama de momentos (designParameters.Mdiagram) para calcularlo.')
+            raise Exception('>> Analisis abortado <<')
+        Cb = Cb_diagram(Mdiagram)
+        return float(Cb) if Cb.ndim == 0 else Cb
+
+    def s3_FTB(self, L = None, Kx = None, Kz = None, Lx = None, Lz = None):
         '''Tensión y carga critica nominal de pandeo flexo-torsional.
 
             Basado en Ec. 3.4.3-1. Itera sobre Et(s) segun un esquema de Newton-Rapson.
             
         Parameters
         ----------
-            none
+            L, Kx, Kz, Lx, Lz : float or array
+                Longitudes y factores de longitud efectiva. Por defecto los de member.dP (ver _bucklingLengths)
 
         Returns
         -------
-            Fn : float
+            Fn : float or array
                 Tension critica de pandeo flexo-torsional
-            Pn : float
+            Pn : float or array
                 Carga critica de pandeo flexo-torsional (sobre area nominal)
 
         Raises
@@ -972,34 +1889,23 @@ class ASCE_8_02:
             En archivo
         ''' 
         
-        dP = self.member.dP
-        profile = self.member.profile
-        steel = self.member.steel
-
-        FF = E_3_4_3_e1(E0 = steel.E0, G0 = steel.G0,
-                        Kx = dP.Kx, Kt = dP.Kz, Lx = dP.Lx, Lt = dP.Lz,
-                        rx = profile.rx, ry = profile.ry, c_x = profile.c_x, sc_x = profile.sc_x,
-                        A = profile.A, Cw = profile.Cw, J = profile.J,
-                        eta = 1)
-        Fn = eta_iter(FF,steel)
-        if Fn > steel.FY:
-            Fn = steel.FY
-
-        Pn = Fn* profile.A
+        Fn = self.s3_buckling(L= L, Kx= Kx, Kz= Kz, Lx= Lx, Lz= Lz).Fn(['FTB'])['FTB']
+        Pn = Fn* self.member.profile.A
         return Fn, Pn
 
-    def s3_FB(self):
+    def s3_FB(self, L = None, Kx = None, Ky = None, Lx = None, Ly = None):
         '''Tensión y carga critica nominal para pandeo a flexion en x e y.
 
             Basado en Ec. 3.3.1.2-6. Itera sobre Et(s) segun un esquema de Newton-Rapson.
 
         Parameters
         ----------
-            none
+            L, Kx, Ky, Lx, Ly : float or array
+                Longitudes y factores de longitud efectiva. Por defecto los de member.dP (ver _bucklingLengths)
 
         Returns
         -------
-            [Fnx, Pnx] : list of float
+            [Fnx, Pnx] : list of float (o array)
                 Fnx : Tension critica de pandeo flexional sobre el eje -x-
                 Pnx : Carga critica de pandeo flexional sobre el eje -x- (sobre area nominal)
             [Fny, Pny] : list of float
@@ -1015,39 +1921,33 @@ class ASCE_8_02:
             En archivo
         '''
         
-        dP = self.member.dP
         profile = self.member.profile
-        steel = self.member.steel
         #fi_n = 0.9 # chequear valor
-        
-        FFx = E_3_3_1_2_e6(E0= steel.E0, K = dP.Kx, L = dP.Lx, r = profile.rx)
-        Fnx = eta_iter(FFx,steel)
-        if Fnx > steel.FY:
-            Fnx = steel.FY
+
+        Fn = self.s3_buckling(L= L, Kx= Kx, Ky= Ky, Lx= Lx, Ly= Ly).Fn(['FBx', 'FBy'])
+        Fnx = Fn['FBx']
         Pnx = Fnx* profile.A
 
-        FFy = E_3_3_1_2_e6(E0= steel.E0, K = dP.Ky, L = dP.Ly, r = profile.ry)
-        Fny = eta_iter(FFy,steel)
-        if Fny > steel.FY:
-            Fny = steel.FY
+        Fny = Fn['FBy']
         Pny = Fny* profile.A
 
         return [Fnx, Pnx], [Fny, Pny]
 
-    def s3_TB(self):
+    def s3_TB(self, L = None, Kz = None, Lz = None):
         '''Tensión y carga critica nominal para pandeo torsional.
 
             Basado en Ec. 3.4.2-1. Itera sobre Et(s) segun un esquema de Newton-Rapson.
 
         Parameters
         ----------
-            none
+            L, Kz, Lz : float or array
+                Longitud y factor de longitud efectiva. Por defecto los de member.dP (ver _bucklingLengths)
 
         Returns
         -------
-            Fn : float
+            Fn : float or array
                 Tension critica de pandeo torsional
-            Pn : float
+            Pn : float or array
                 Carga critica de pandeo torsional (sobre area nominal)
 
         Raises
@@ -1059,49 +1959,96 @@ class ASCE_8_02:
             En archivo
         '''
         
-        dP = self.member.dP
-        profile = self.member.profile
-        steel = self.member.steel
-        
-        FF = E_3_4_2_e1(E0= steel.E0, Kt= dP.Kz, Lt= dP.Lz, rx= profile.rx, ry= profile.ry,
-                    c_x= profile.c_x, sc_x= profile.sc_x, A= profile.A, Cw= profile.Cw, G0= steel.G0, J= profile.J,
-                    eta= 1)
-        Fn = eta_iter(FF,steel)
-        if Fn > steel.FY:
-            Fn = steel.FY
-        Pn = Fn* profile.A
+        Fn = self.s3_buckling(L= L, Kz= Kz, Lz= Lz).Fn(['TB'])['TB']
+        Pn = Fn* self.member.profile.A
 
         return Fn, Pn
 
-    def s3_5(self, Pu, fiPn, Mu_x, Mu_y, fiMn_x, fiMn_y):
+    def s3_5(self, Pu, Mu_x, Mu_y = 0.0, Cm_x = 0.85, Cm_y = 0.85, fiPn = None, fiPno = None, fiMn_x = None, fiMn_y = None, prune = False):
+        '''Combined Axial Load and Bending. Verificacion 3.5 para un conjunto de combinaciones de carga (Pu, Mu_x, Mu_y).
+
+            fiPn, fiPno (3.4), fiMn_x, fiMn_y (3.3.1), Pe_x y Pe_y (Ec 3.5-5) se calculan una sola vez por miembro
+            y las ecuaciones de interaccion se evaluan sobre los arrays de solicitaciones:
+                Pu/fiPn > 0.15: mayor de Ec 3.5-1 (con alpha_n = 1 - Pu/Pe, Ec 3.5-4) y Ec 3.5-2
+                Pu/fiPn <= 0.15: Ec 3.5-3
+            Si Pu >= Pe la Ec 3.5-1 no tiene solucion y la utilizacion es inf.
+
+        Parameters
+        ----------
+            Pu : float or array
+                Carga axial de compresion requerida de cada combinacion
+            Mu_x, Mu_y : float or array
+                Momentos requeridos de cada combinacion (se usa el valor absoluto de Mu_x). En perfiles 'c_w_lps'
+                el signo de Mu_y elige la resistencia de s3_3_1_1_y: Mu_y > 0 con el centro de corte a compresion
+            Cm_x, Cm_y : float or array
+                Coeficientes de momento de Ec 3.5-1
+            fiPn, fiPno, fiMn_x, fiMn_y : float
+                Resistencias de diseno. Por defecto las de s3_4(), s3_3_1() y s3_3_1_1_y()
+            prune : bool
+                True: solo se evaluan las combinaciones no dominadas (ver demand.prune_3_5), con Cm_x y Cm_y
+                escalares. La combinacion que gobierna y su utilizacion son las mismas; las descartadas tienen
+                utilizacion nan y midC['index'] indica las filas de los resultados por combinacion
+        Returns
+        -------
+            utilization : array
+                Utilizacion de cada combinacion (<= 1 verifica)
+            midC : dict
+                fiPn, fiPno, fiMn_x, fiMn_y, Pe_x, Pe_y: resistencias y cargas de pandeo elastico
+                alpha_nx, alpha_ny: factores de amplificacion de cada combinacion
+                ratio_e1, ratio_e2, ratio_e3: Ec 3.5-1, 3.5-2 y 3.5-3 de cada combinacion
+                equation: ecuacion que gobierna cada combinacion ('3.5-1', '3.5-2' o '3.5-3')
+                governing: indice de la combinacion con mayor utilizacion
+                utilization_max: utilizacion de la combinacion que gobierna
+        Raises
+        ------
+            Exception: Mu_y no nulo sin fiMn_y en perfiles sin s3_3_1_1_y
+        Tests
+        -----
+            Una combinacion por ecuacion: Pu/fiPn <= 0.15 (3.5-3), flexion dominante (3.5-2) y amplificacion (3.5-1)
+            >>> p1 = c_w_lps_profile(H= 8.0, B= 3, D= 0.80, t= 0.105, r_out= (0.105+3/16))
+            >>> p1.calculate()
+            >>> s = steel(FY= 50, E0= 27000, nu= 0.3, n= 4.58, offset= 0.002, name= 'SA301_1_4Hard')
+            >>> analysis = ASCE_8_02(member(L= 120, profile= p1, steel= s, designParameters= designParameters()))
+            >>> res = {'fiPn': 20.0, 'fiPno': 25.0, 'fiMn_x': 40.0, 'fiMn_y': 10.0}
+            >>> u, midC = analysis.s3_5(Pu= [2.0, 4.0, 15.0], Mu_x= [30.0, 35.0, 10.0], **res)
+            >>> midC['equation'].tolist(), round(float(u[0]), 4), round(float(u[1]), 4), midC['governing']
+            (['3.5-3', '3.5-2', '3.5-1'], 0.85, 1.035, 1)
+            >>> bool(abs(u[2] - (15.0/20.0 + 0.85*10.0/(40.0*(1 - 15.0/midC['Pe_x'])))) < 1e-12)
+            True
+            >>> float(analysis.s3_5(Pu= 1.1*midC['Pe_x'], Mu_x= 1.0, **res)[0])
+            inf
+            >>> u, midC = analysis.s3_5(Pu= [2.0, 4.0, 15.0, 3.0], Mu_x= [30.0, 35.0, 10.0, 30.0], prune= True, **res)
+            >>> midC['governing'], round(midC['utilization_max'], 4)
+            (1, 1.035)
         '''
+        surface = self.s3_5_surface(Cm_x= Cm_x, Cm_y= Cm_y, fiPn= fiPn, fiPno= fiPno, fiMn_x= fiMn_x, fiMn_y= fiMn_y)
+        if not prune:
+            return surface.evaluate(Pu, Mu_x, Mu_y)
+        if np.ndim(Cm_x) > 0 or np.ndim(Cm_y) > 0:
+            print('Seccion 3.5 - prune requiere Cm_x y Cm_y escalares.')
+            raise Exception('>> Analisis abortado <<')
+        index, report = prune_3_5(Pu, Mu_x, Mu_y, fiPn= surface.fiPn)
+        Pu, Mu_x, Mu_y = [v.ravel()[index] for v in np.broadcast_arrays(*[np.asarray(v, dtype= float) for v in (Pu, Mu_x, Mu_y)])]
+        utilization, midC = surface.evaluate(Pu, Mu_x, Mu_y)
+        return self._unprune(utilization, midC, index, report)
+
+    def s3_5_surface(self, Cm_x = 0.85, Cm_y = 0.85, fiPn = None, fiPno = None, fiMn_x = None, fiMn_y = None):
+        '''Superficie de interaccion 3.5 del miembro: resistencias y cargas de pandeo elastico calculadas una sola vez,
+        para consultar utilizacion y factor de reserva de cualquier cantidad de puntos (P, Mx, My).
+
+        Parameters
+        ----------
+            Cm_x, Cm_y, fiPn, fiPno, fiMn_x, fiMn_y :
+                ver s3_5()
+        Returns
+        -------
+            surface : class interactionSurface
+                surface.utilization(Pu, Mu_x, Mu_y), surface.reserve(Pu, Mu_x, Mu_y)
+        Tests
+        -----
+            En archivo
         '''
-        # Parametros
-        steel = self.member.steel
-        profile = self.member.profile
-        dpar = self.member.dP
-
-        E0 = steel.E0
-        Kx = dpar.Kx
-        Ky = dpar.Ky
-        Lx = dpar.Lx
-        Ly = dpar.Ly
-        Ix = profile.Ix
-        Iy = profile.Iy
-
-        Cm_x = 0.85
-        Cm_y = 0.85
-
-        Pe_x = E_3_5_e5(E0=E0, Kb=Kx, Lb=Lx, Ib=Ix)
-        Pe_y = E_3_5_e5(E0=E0, Kb=Ky, Lb=Ly, Ib=Iy)
-        alpha_nx = E_3_5_e4(Pu=Pu, Pe=Pe_x)
-        alpha_ny = E_3_5_e4(Pu=Pu, Pe=Pe_y)
-
-        Ae = 1
-        fiPn_0 = E_3_4_e1(Fn=self.member.steel.FY, Ae=Ae)
-        if 1 == 1:
-            raise NotImplementedError
-        return Cm_x, Cm_y, alpha_nx, alpha_ny, fiPn_0 # para sacar los warnigs BORRAR
+        return interactionSurface(self, Cm_x= Cm_x, Cm_y= Cm_y, fiPn= fiPn, fiPno= fiPno, fiMn_x= fiMn_x, fiMn_y= fiMn_y)
 
         
 
@@ -0,0 +1,264 @@
+'''Analisis de secciones por fibras con la ley de Ramberg-Osgood del acero (Eq B-1: eps = s/E0 + offset*(s/FY)**n).
+
+    La seccion se discretiza en fibras de coordenada y (desde el eje x de la seccion bruta, positiva hacia el ala
+    comprimida) y area A. Las secciones planas permanecen planas, eps(y) = kappa*(y - yn), y la ley es la misma en
+    traccion y en compresion. Para cada estado se busca el eje neutro yn con N = sum(s*A) = 0 (Newton con biseccion
+    de resguardo) y el momento es M = sum(s*A*(y - yn)). Las fibras se guardan en arrays de numpy (una fila por
+    estado o por seccion) y todas las filas se resuelven a la vez: curvas momento-curvatura completas o un catalogo
+    de perfiles en una sola llamada.
+
+    Los anchos efectivos se representan con fibras de area negativa sobre los segmentos no efectivos (formato
+    nEffAreas de s3_Se_effective), de modo que en el rango elastico el modelo reproduce Ie y cy del Procedimiento I.
+
+    Classes
+    -------
+        fiberSection : class
+            Seccion de fibras de un perfil y un acero.
+
+    Functions
+    ---------
+        roStress(eps, E0, FY, n, offset) :
+            Tension y modulo tangente para la deformacion eps (inversa de Eq B-1).
+        profileFibers(profile, nEffAreas) :
+            Fibras (y, A) de c_w_lps_profile, c_profile e I armados para flexion respecto de x.
+        strainLimitMoment(y, A, yTop, epsCu, E0, FY, n, offset) :
+            Momento con la deformacion epsCu en la fibra comprimida extrema, para varias secciones a la vez.
+
+    Tests
+    -----
+        Rectangulo elastico (offset = 0): M = E0*I*kappa
+        >>> y = np.linspace(-49.5, 49.5, 100)
+        >>> M, yn, _ = strainLimitMoment(y, np.full(100, 10.0), yTop= 50.0, epsCu= 0.001, E0= 200000.0, FY= 300.0, n= 10.0, offset= 0.0)
+        >>> round(float(M[0]/(200000.0*0.001/50.0*10.0*100.0**3/12)), 4), abs(float(yn[0])) < 1e-9
+        (0.9999, True)
+        >>> round(float(roStress(300.0/200000.0 + 0.002, 200000.0, 300.0, 10.0, 0.002)[0]), 6)
+        300.0
+'''
+
+import numpy as np
+
+
+def roStress(eps, E0, FY, n, offset, tol = 1e-10, maxIter = 100):
+    '''Tension s y modulo tangente Et para la deformacion eps: inversa de eps = s/E0 + offset*(s/FY)**n (antisimetrica).
+
+        Newton desde la menor de las cotas E0*|eps| y FY*(|eps|/offset)**(1/n): como la ley es convexa en s, las
+        iteraciones decrecen en forma monotona hacia la raiz. Los argumentos se combinan por broadcasting.
+
+    Parameters
+    ----------
+        eps : float or array
+            Deformacion (compresion +)
+        E0, FY, n, offset : float or array
+            Parametros del acero
+        tol : float
+            Tolerancia del residuo en deformacion, relativa a FY/E0
+        maxIter : int
+            Numero maximo de iteraciones
+    Returns
+    -------
+        s, Et : array
+            Tension y modulo tangente
+    '''
+    e = np.abs(np.asarray(eps, dtype= float))
+    plastic = np.asarray(offset) > 0
+    with np.errstate(divide= 'ignore'):
+        s = np.where(plastic, np.minimum(E0*e, FY*(e/np.where(plastic, offset, 1.0))**(1/n)), E0*e)
+    for _ in range(maxIter):
+        r = (s/FY)**(n - 1)
+        g = s/E0 + offset*r*s/FY - e
+        dg = 1/E0 + offset*n*r/FY
+        s = s - g/dg
+        if np.all(np.abs(g) <= tol*FY/E0):
+            break
+    Et = 1/(1/E0 + offset*n*(s/FY)**(n - 1)/FY)
+    return np.sign(eps)*s, Et
+
+def profileFibers(profile, nEffAreas = None, nT = 2, ds = None):
+    '''Fibras de un perfil c_w_lps_profile, c_profile, I_builtup_c_w_lps_profile o I_builtup_c_profile para flexion
+    respecto de x, con las esquinas curvas (radio medio r_out - t/2). En los perfiles I armados se suman los dos
+    perfiles C.
+
+    Parameters
+    ----------
+        profile : class profile
+            Perfil con H, t, r_out y elements
+        nEffAreas : dict {key: {'t', 'b_', 'cy_', 'paralel'}}
+            Segmentos no efectivos (ver adjustNeutralAxis). Se agregan como fibras de area negativa
+        nT : int
+            Fibras en el espesor de los elementos horizontales y las esquinas
+        ds : float
+            Longitud de las fibras a lo largo de los elementos verticales y las esquinas. Por defecto t
+    Returns
+    -------
+        y, A : array
+            Coordenada y area de cada fibra
+    '''
+    H, t, r_out = profile.H, profile.t, profile.r_out
+    ds = t if ds is None else ds
+    widths = {element['name']: element['w'] for element in profile.elements.values()}
+    if profile.type in ['c_w_lps', 'cee']:
+        nC = 1.0
+    elif profile.type in ['I_builtup_cee_w_lps', 'I_builtup_cee']:
+        nC = 2.0
+    else:
+        print('Seccion del tipo', profile.type,'no implementada en fiber.')
+        raise NotImplementedError
+    nCorners = 2 if 'lip' in widths else 1
+
+    layers = ((np.arange(nT) + 0.5)/nT - 0.5)*t
+    y, A = [], []
+    def vertical(y0, y1, tv, nSign = 1.0):
+        nS = max(int(np.ceil(abs(y1 - y0)/ds)), 1)
+        y.append(y0 + (y1 - y0)*(np.arange(nS) + 0.5)/nS)
+        A.append(np.full(nS, nSign*tv*abs(y1 - y0)/nS))
+    def horizontal(yc, b, tv, nSign = 1.0):
+        y.append(yc + layers)
+        A.append(np.full(nT, nSign*b*tv/nT))
+
+    vertical(-(H/2 - r_out), H/2 - r_out, nC*t)
+    rc = r_out - t/2
+    nA = max(int(np.ceil(rc*np.pi/2/ds)), 1)
+    theta = (np.arange(nA) + 0.5)/nA*np.pi/2
+    r = rc + layers
+    for side in [1.0, -1.0]:
+        horizontal(side*(H/2 - t/2), widths['flange'], nC*t)
+        if 'lip' in widths:
+            vertical(side*(H/2 - r_out), side*(H/2 - r_out - widths['lip']), nC*t)
+        # esquinas: y = yc + r*sin(theta), dA = r*dtheta*t/nT
+        yArc = (H/2 - r_out) + r[:, None]*np.sin(theta)[None, :]
+        y.append(side*np.tile(yArc.ravel(), nCorners))
+        A.append(np.tile((nC*r[:, None]*np.pi/2/nA*t/nT*np.ones(nA)).ravel(), nCorners))
+
+    for segment in (nEffAreas or {}).values():
+        if segment['b_'] <= 0:
+            continue
+        if segment['paralel']:
+            horizontal(segment['cy_'], segment['b_'], segment['t'], -1.0)
+        else:
+            vertical(segment['cy_'] - segment['b_']/2, segment['cy_'] + segment['b_']/2, segment['t'], -1.0)
+    return np.concatenate(y), np.concatenate(A)
+
+def _rows(x, m):
+    '''x (float o array (m,)) como columna (m, 1).'''
+    return np.broadcast_to(np.asarray(x, dtype= float).reshape(-1, 1), (m, 1))
+
+def _equilibrium(y, A, yTop, load, E0, FY, n, offset, mode, tol = 1e-9, maxIter = 100):
+    '''Eje neutro de cada fila con N = 0. mode 'kappa': load es la curvatura | 'strain': load es la deformacion de
+    la fibra yTop. Devuelve M, yn, kappa, nIter y converged.'''
+    y, A = np.atleast_2d(y), np.atleast_2d(A)
+    m = max(y.shape[0], A.shape[0], np.size(load), np.size(yTop), *[np.size(p) for p in (E0, FY, n, offset)])
+    y, A = np.broadcast_to(y, (m, y.shape[1])), np.broadcast_to(A, (m, A.shape[1]))
+    load, yTop, E0, FY, n, offset = [_rows(p, m) for p in (load, yTop, E0, FY, n, offset)]
+
+    fibers = A != 0
+    lo = np.where(fibers, y, np.inf).min(axis= 1, keepdims= True)
+    hi = np.where(fibers, y, -np.inf).max(axis= 1, keepdims= True) if mode == 'kappa' else yTop.copy()
+    scale = FY*np.abs(A).sum(axis= 1, keepdims= True)
+    yn = np.clip((A*y).sum(axis= 1, keepdims= True)/A.sum(axis= 1, keepdims= True), lo, hi - 1e-9*(hi - lo))
+
+    nIter = np.zeros((m, 1), dtype= int)
+    active = np.ones((m, 1), dtype= bool)
+    while active.any() and nIter.max() < maxIter:
+        kappa = load if mode == 'kappa' else load/(yTop - yn)
+        s, Et = roStress(kappa*(y - yn), E0, FY, n, offset)
+        N = (s*A).sum(axis= 1, keepdims= True)
+        if mode == 'kappa':
+            dN = -kappa*(Et*A).sum(axis= 1, keepdims= True)
+        else:
+            dN = (Et*A*load*(y - yTop)).sum(axis= 1, keepdims= True)/(yTop - yn)**2
+        nIter = nIter + active
+        # N decrece con yn: N > 0 (exceso de compresion) -> el eje neutro sube
+        lo = np.where(active & (N > 0), yn, lo)
+        hi = np.where(active & (N <= 0), yn, hi)
+        active = active & (np.abs(N) > tol*scale) & (hi - lo > 1e-12*(np.abs(hi) + np.abs(lo)))
+        with np.errstate(divide= 'ignore', invalid= 'ignore'):
+            ynNew = yn - N/dN
+        ynNew = np.where((lo < ynNew) & (ynNew < hi), ynNew, 0.5*(lo + hi))
+        yn = np.where(active, ynNew, yn)
+
+    kappa = load if mode == 'kappa' else load/(yTop - yn)
+    s, _ = roStress(kappa*(y - yn), E0, FY, n, offset)
+    M = (s*A*(y - yn)).sum(axis= 1)
+    if active.any():
+        print('fiber: se alcanzo el numero maximo de iteraciones en', int(active.sum()), 'estados')
+    return M, yn[:, 0], kappa[:, 0], nIter[:, 0], ~active[:, 0]
+
+def strainLimitMoment(y, A, yTop, epsCu, E0, FY, n, offset, tol = 1e-9, maxIter = 100):
+    '''Momento con la deformacion de compresion epsCu en la fibra extrema yTop, sin limite en traccion.
+
+    Parameters
+    ----------
+        y, A : array (nf,) or (m, nf)
+            Fibras de una seccion o de m secciones (filas completadas con A = 0)
+        yTop : float or array (m,)
+            Coordenada de la fibra comprimida extrema
+        epsCu : float or array (m,)
+            Deformacion maxima de compresion
+        E0, FY, n, offset : float or array (m,)
+            Parametros del acero de cada seccion
+        tol : float
+            Tolerancia de N relativa a FY*sum(|A|)
+        maxIter : int
+            Numero maximo de iteraciones
+    Returns
+    -------
+        M, yn, kappa : array (m,)
+            Momento, eje neutro y curvatura de cada seccion
+    '''
+    M, yn, kappa, _, _ = _equilibrium(y, A, yTop, epsCu, E0, FY, n, offset, 'strain', tol= tol, maxIter= maxIter)
+    return M, yn, kappa
+
+
+class fiberSection():
+    '''Seccion de fibras de un perfil y un acero.
+
+    Parameters
+    ----------
+        y, A : array
+            Fibras (ver profileFibers)
+        steel : class steel
+            Acero (E0, FY, n, offset)
+        yTop : float
+            Coordenada de la fibra comprimida extrema. Por defecto la mayor y
+
+    Methods
+    -------
+        momentCurvature(kappa) :
+            Momento y eje neutro para cada curvatura
+        strainLimit(epsCu) :
+            Momento, eje neutro y curvatura con la deformacion epsCu en la fibra yTop
+
+    Tests
+    -----
+        Rectangulo de 10 x 100: elastico para curvatura chica (M = E0*I*kappa), eje neutro en el centro
+        >>> from steeldesign import steel
+        >>> s = steel(FY= 300.0, E0= 200000.0, nu= 0.3, n= 10.0, offset= 0.002)
+        >>> section = fiberSection(np.linspace(-49.5, 49.5, 100), np.full(100, 10.0), s)
+        >>> M, yn = section.momentCurvature([1e-7, 1e-4, 1e-3])
+        >>> round(float(M[0]/(s.E0*(section.A*section.y**2).sum()*1e-7)), 6), bool(np.all(np.abs(yn) < 1e-9)), bool(np.all(np.diff(M) > 0))
+        (1.0, True, True)
+
+        strainLimit: deformacion epsCu en yTop y el mismo momento que momentCurvature con esa curvatura
+        >>> Mc, ync, kc = section.strainLimit([0.003, 0.01])
+        >>> [round(float(k*section.yTop), 6) for k in kc], [round(float(r), 6) for r in section.momentCurvature(kc)[0]/Mc]
+        ([0.003, 0.01], [1.0, 1.0])
+    '''
+    def __init__(self, y, A, steel, yTop = None):
+        self.y = np.asarray(y, dtype= float)
+        self.A = np.asarray(A, dtype= float)
+        self.steel = steel
+        self.yTop = self.y.max() if yTop is None else yTop
+
+    def _material(self):
+        return self.steel.E0, self.steel.FY, self.steel.n, self.steel.offset
+
+    def momentCurvature(self, kappa, tol = 1e-9, maxIter = 100):
+        '''Momento M y eje neutro yn para cada curvatura kappa (float o array, todas resueltas a la vez).'''
+        M, yn, _, _, _ = _equilibrium(self.y, self.A, self.yTop, np.ravel(kappa), *self._material(), 'kappa', tol= tol, maxIter= maxIter)
+        return M.reshape(np.shape(kappa)), yn.reshape(np.shape(kappa))
+
+    def strainLimit(self, epsCu, tol = 1e-9, maxIter = 100):
+        '''Momento M, eje neutro yn y curvatura kappa con la deformacion epsCu (float o array) en la fibra yTop.'''
+        M, yn, kappa = strainLimitMoment(self.y, self.A, self.yTop, np.ravel(epsCu), *self._material(), tol= tol, maxIter= maxIter)
+        shape = np.shape(epsCu)
+        return M.reshape(shape), yn.reshape(shape), kappa.reshape(shape)
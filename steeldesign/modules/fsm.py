@@ -0,0 +1,281 @@
+'''Metodo de las franjas finitas (FSM) para pandeo elastico local y distorsional.
+
+    La seccion se discretiza sobre su linea media en franjas planas. Cada franja tiene desplazamientos de
+    membrana (u, v) lineales y de flexion (w) cubicos (Hermite) en el ancho, y una semionda sin(pi*y/a) a lo
+    largo (extremos simplemente apoyados, semilongitud de onda a). Para una tension de referencia dada (axial
+    uniforme o flexion respecto del eje x) se resuelve
+
+        (K0 + k K1 + k^2 K2 + k^3 K3 + k^4 K4) phi = lambda k^2 G phi,    k = pi/a
+
+    Las matrices K_p y G no dependen de a: se ensamblan una sola vez y los problemas de autovalores de todas
+    las semilongitudes se resuelven juntos (Cholesky y eigh sobre arrays apilados de numpy). La curva de
+    firma lambda(a) tiene un primer minimo local (pandeo local) y, en perfiles con labios, un segundo minimo
+    (pandeo distorsional).
+
+    Las esquinas se modelan vivas y en los perfiles I armados las dos almas son dos franjas coincidentes de
+    espesor t sobre los mismos nodos (se desprecia la separacion s): rigidez de membrana 2t y de flexion
+    2t^3/12, las almas no trabajan como una placa maciza de espesor 2t.
+
+    Classes
+    -------
+        stripModel : class
+            Modelo de franjas de una seccion abierta arbitraria.
+        signatureCurve : class
+            Curva de firma de un perfil (c_w_lps_profile, c_profile e I armados) para carga axial o flexion.
+
+    Functions
+    ---------
+        profileStrips(profile, E0, nu) :
+            stripModel de un perfil de la libreria.
+        signature(profile, steel, load) :
+            signatureCurve compartida por perfil y acero (sectionCache).
+
+    Tests
+    -----
+        Placa simplemente apoyada en los bordes longitudinales, compresion uniforme: k = 4 para a = b
+        >>> b, t, E, nu = 100.0, 1.0, 200000.0, 0.3
+        >>> nodes = np.column_stack([np.linspace(0.0, b, 9), np.zeros(9)])
+        >>> strips = [(i, i + 1, t) for i in range(8)]
+        >>> plate = stripModel(nodes, strips, E, nu, fixed= [(0, 2), (8, 2)])
+        >>> fcr = plate.solve([b], np.ones(9))[:, 0]
+        >>> round(float(fcr[0]*12*(1 - nu**2)/(np.pi**2*E)*(b/t)**2), 3)
+        4.0
+'''
+
+import numpy as np
+from .cache import sectionCache
+
+# puntos y pesos de Gauss (4 puntos) en [0, 1]
+_xg, _wg = np.polynomial.legendre.leggauss(4)
+_xg, _wg = (_xg + 1)/2, _wg/2
+
+
+class stripModel():
+    '''Modelo de franjas finitas de una seccion abierta.
+
+    Parameters
+    ----------
+        nodes : array (n, 2)
+            Coordenadas (X, Z) de los nodos sobre la linea media
+        strips : list of (i, j, t)
+            Franjas entre los nodos i y j, de espesor t
+        E, nu : float
+            Modulo de elasticidad y coeficiente de Poisson
+        fixed : list of (node, dof)
+            Grados de libertad restringidos. dof: 0 U (X), 1 V (longitudinal), 2 W (Z), 3 rotacion
+
+    Attributes
+    ----------
+        K : list of array
+            Matrices de rigidez elastica K0 ... K4 ensambladas, sin los grados de libertad restringidos
+
+    Methods
+    -------
+        solve(L, stress, nModes) :
+            Factores de carga criticos para cada semilongitud de onda
+    '''
+    def __init__(self, nodes, strips, E, nu, fixed = None):
+        self.nodes = np.asarray(nodes, dtype= float)
+        self.strips = list(strips)
+        self.E = E
+        self.nu = nu
+        nDof = 4*len(self.nodes)
+        fixedDofs = [4*node + dof for node, dof in (fixed or [])]
+        self.free = np.setdiff1d(np.arange(nDof), fixedDofs)
+
+        D = np.array([[1.0, nu, 0.0], [nu, 1.0, 0.0], [0.0, 0.0, (1 - nu)/2]])/(1 - nu**2)
+        K = np.zeros((5, nDof, nDof))
+        for i, j, t, b, R, dofs in self._strips():
+            Kl = np.zeros((5, 8, 8))
+            for xi, wi in zip(_xg, _wg):
+                for B, rows, Dt in [(self._membrane(xi, b), [0, 4, 1, 5], E*t*D), (self._bending(xi, b), [2, 3, 6, 7], E*t**3/12*D)]:
+                    for p, Bp in enumerate(B):
+                        for q, Bq in enumerate(B):
+                            Kl[p + q][np.ix_(rows, rows)] += wi*b*Bp.T @ Dt @ Bq
+            K[:, dofs[:, None], dofs[None, :]] += R.T @ Kl @ R
+        self.K = [Kp[np.ix_(self.free, self.free)] for Kp in K]
+
+    def _strips(self):
+        '''Geometria de cada franja: nodos, espesor, ancho, matriz de transformacion y grados de libertad globales.'''
+        for i, j, t in self.strips:
+            dX, dZ = self.nodes[j] - self.nodes[i]
+            b = np.hypot(dX, dZ)
+            c, s = dX/b, dZ/b
+            Rn = np.array([[c, 0, s, 0], [0, 1, 0, 0], [-s, 0, c, 0], [0, 0, 0, 1]])
+            R = np.zeros((8, 8))
+            R[:4, :4] = Rn
+            R[4:, 4:] = Rn
+            dofs = np.r_[4*i:4*i + 4, 4*j:4*j + 4]
+            yield i, j, t, b, R, dofs
+
+    @staticmethod
+    def _membrane(xi, b):
+        '''Coeficientes de k^0, k^1 de la matriz B de membrana (filas ex, ey, gxy; columnas u1, u2, v1, v2).'''
+        N = np.array([1 - xi, xi])
+        dN = np.array([-1.0, 1.0])/b
+        B0 = np.zeros((3, 4))
+        B1 = np.zeros((3, 4))
+        B0[0, :2] = dN      # ex = du/dx
+        B1[1, 2:] = -N      # ey = dv/dy
+        B1[2, :2] = N       # gxy = du/dy + dv/dx
+        B0[2, 2:] = dN
+        return [B0, B1]
+
+    @staticmethod
+    def _bending(xi, b):
+        '''Coeficientes de k^0, k^1, k^2 de la matriz B de flexion (filas kx, ky, kxy; columnas w1, r1, w2, r2).'''
+        N = np.array([1 - 3*xi**2 + 2*xi**3, b*(xi - 2*xi**2 + xi**3), 3*xi**2 - 2*xi**3, b*(-xi**2 + xi**3)])
+        dN = np.array([-6*xi + 6*xi**2, b*(1 - 4*xi + 3*xi**2), 6*xi - 6*xi**2, b*(-2*xi + 3*xi**2)])/b
+        d2N = np.array([-6 + 12*xi, b*(-4 + 6*xi), 6 - 12*xi, b*(-2 + 6*xi)])/b**2
+        B = [np.zeros((3, 4)) for _ in range(3)]
+        B[0][0] = -d2N      # kx = -d2w/dx2
+        B[2][1] = N         # ky = -d2w/dy2 = k^2 w
+        B[1][2] = -2*dN     # kxy = -2 d2w/dxdy
+        return B
+
+    def geometric(self, stress):
+        '''Matriz de rigidez geometrica G (coeficiente de k^2) para las tensiones longitudinales nodales stress
+        (compresion positiva).'''
+        stress = np.asarray(stress, dtype= float)
+        G = np.zeros((4*len(self.nodes), 4*len(self.nodes)))
+        for i, j, t, b, R, dofs in self._strips():
+            Gl = np.zeros((8, 8))
+            for xi, wi in zip(_xg, _wg):
+                f = stress[i]*(1 - xi) + stress[j]*xi
+                Nm = np.array([1 - xi, xi])
+                Nb = np.array([1 - 3*xi**2 + 2*xi**3, b*(xi - 2*xi**2 + xi**3), 3*xi**2 - 2*xi**3, b*(-xi**2 + xi**3)])
+                for rows, N in [([0, 4], Nm), ([1, 5], Nm), ([2, 3, 6, 7], Nb)]:
+                    Gl[np.ix_(rows, rows)] += wi*b*f*t*np.outer(N, N)
+            G[dofs[:, None], dofs[None, :]] += R.T @ Gl @ R
+        return G[np.ix_(self.free, self.free)]
+
+    def solve(self, L, stress, nModes = 1):
+        '''Factores de carga criticos para las semilongitudes de onda L.
+
+        Parameters
+        ----------
+            L : array
+                Semilongitudes de onda
+            stress : array
+                Tension de referencia en cada nodo (compresion positiva)
+            nModes : int
+                Cantidad de modos por semilongitud
+
+        Returns
+        -------
+            lam : array (len(L), nModes)
+                Factores de carga criticos en orden creciente (inf si no hay modo de pandeo)
+        '''
+        k = np.pi/np.asarray(L, dtype= float).reshape(-1)
+        A = sum(k[:, None, None]**p*Kp for p, Kp in enumerate(self.K))
+        B = k[:, None, None]**2*self.geometric(stress)
+        # K phi = lam G phi  ->  (L^-1 G L^-T) y = (1/lam) y, con K = L L^T
+        C = np.linalg.cholesky(A)
+        M = np.linalg.solve(C, np.swapaxes(np.linalg.solve(C, B), 1, 2))
+        mu = np.linalg.eigvalsh((M + np.swapaxes(M, 1, 2))/2)[:, ::-1][:, :nModes]
+        with np.errstate(divide= 'ignore'):
+            return np.where(mu > 0, 1/mu, np.inf)
+
+
+def _addSegment(nodes, strips, p0, p1, n, t):
+    '''Agrega n franjas de espesor t entre los puntos p0 y p1, reutilizando los nodos existentes.'''
+    def node(p):
+        for i, q in enumerate(nodes):
+            if np.allclose(p, q):
+                return i
+        nodes.append(np.asarray(p, dtype= float))
+        return len(nodes) - 1
+    p0, p1 = np.asarray(p0, dtype= float), np.asarray(p1, dtype= float)
+    ids = [node(p0)] + [node(p0 + (p1 - p0)*s) for s in np.arange(1, n + 1)/n]
+    strips.extend((ids[m], ids[m + 1], t) for m in range(n))
+
+def profileStrips(profile, E0, nu, nWeb = 8, nFlange = 4, nLip = 2):
+    '''stripModel sobre la linea media de un perfil c_w_lps_profile, c_profile, I_builtup_c_w_lps_profile o
+    I_builtup_c_profile (esquinas vivas, alma en X = 0, eje x en Z = 0).'''
+    H, B, t = profile.H, profile.B, profile.t
+    lips = profile.type in ['c_w_lps', 'I_builtup_cee_w_lps']
+    h = H - t
+    b = B - t if lips else B - t/2
+    d = profile.D - t/2 if lips else 0.0
+    nodes, strips = [], []
+    if profile.type in ['c_w_lps', 'cee']:
+        segments = [((b, h/2), (0, h/2), nFlange, t), ((0, h/2), (0, -h/2), nWeb, t), ((0, -h/2), (b, -h/2), nFlange, t)]
+        if lips:
+            segments = [((b, h/2 - d), (b, h/2), nLip, t)] + segments + [((b, -h/2), (b, -h/2 + d), nLip, t)]
+    elif profile.type in ['I_builtup_cee_w_lps', 'I_builtup_cee']:
+        segments = [((0, h/2), (0, -h/2), nWeb, t), ((0, h/2), (0, -h/2), nWeb, t)]
+        for side in [-1, 1]:
+            for z in [h/2, -h/2]:
+                segments.append(((0, z), (side*b, z), nFlange, t))
+                if lips:
+                    segments.append(((side*b, z), (side*b, z - np.sign(z)*d), nLip, t))
+    else:
+        print('Seccion del tipo', profile.type,'no implementada en fsm.')
+        raise NotImplementedError
+    for p0, p1, n, ti in segments:
+        _addSegment(nodes, strips, p0, p1, n, ti)
+    return stripModel(np.array(nodes), strips, E0, nu)
+
+
+class signatureCurve():
+    '''Curva de firma: tension critica elastica en funcion de la semilongitud de onda, para una tension de
+    referencia axial (uniforme) o de flexion respecto del eje x (ala superior comprimida).
+
+    Parameters
+    ----------
+        profile : class profile
+            Perfil (ver profileStrips)
+        steel : class steel
+            Acero (E0, nu)
+        load : string
+            'axial' o 'bending'
+        L : array
+            Semilongitudes de onda. Por defecto 60 valores logaritmicos entre 0.1 y 30 veces la altura
+        nModes : int
+            Cantidad de modos por semilongitud
+
+    Attributes
+    ----------
+        L : array
+            Semilongitudes de onda
+        fcr : array (len(L), nModes)
+            Tension critica en la fibra de referencia: uniforme (axial) o fibra comprimida extrema (bending)
+        minima : dict
+            {'local': (L, fcr), 'distortional': (L, fcr)}: primer minimo de la curva y, solo en perfiles con
+            labios, segundo minimo, si existen
+
+    Tests
+    -----
+        En archivo
+    '''
+    def __init__(self, profile, steel, load = 'axial', L = None, nModes = 1):
+        model = profileStrips(profile, steel.E0, steel.nu)
+        Z = model.nodes[:, 1]
+        if load == 'axial':
+            stress = np.ones(len(Z))
+        elif load == 'bending':
+            area = np.array([t*np.hypot(*(model.nodes[j] - model.nodes[i])) for i, j, t in model.strips])
+            zMid = np.array([(Z[i] + Z[j])/2 for i, j, _ in model.strips])
+            zc = (area*zMid).sum()/area.sum()
+            stress = (Z - zc)/(Z.max() - zc)
+        else:
+            print('Carga', load, 'no reconocida en signatureCurve (axial o bending).')
+            raise Exception('>> Analisis abortado <<')
+
+        self.load = load
+        self.L = np.geomspace(0.1*profile.H, 30*profile.H, 60) if L is None else np.asarray(L, dtype= float)
+        self.fcr = model.solve(self.L, stress, nModes= nModes)
+
+        f = self.fcr[:, 0]
+        index = [i for i in range(1, f.size - 1) if f[i] < f[i - 1] and f[i] <= f[i + 1]]
+        names = ['local', 'distortional'] if profile.type in ['c_w_lps', 'I_builtup_cee_w_lps'] else ['local']
+        self.minima = {name: (float(self.L[i]), float(f[i])) for name, i in zip(names, index)}
+
+def signature(profile, steel, load = 'axial', L = None, nModes = 1):
+    '''signatureCurve compartida (sectionCache) por todos los miembros de igual perfil y acero.'''
+    cache = sectionCache(profile, steel)
+    key = ('fsm', load, None if L is None else tuple(np.asarray(L, dtype= float)), nModes)
+    curve = cache.get(key)
+    if curve is None:
+        curve = cache.setdefault(key, signatureCurve(profile, steel, load= load, L= L, nModes= nModes))
+    return curve
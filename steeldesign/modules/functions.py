@@ -2,13 +2,26 @@
 
     eta_iter : 
         esquema de newton-rapson f(s): s- FF*eta(s) = 0
+    eta_iter_vec :
+        version vectorizada de eta_iter para un array de FF
     adjustNeutralAxis : 
         busca el eje neutro de la seccion
+    nonEffectiveAreas :
+        acumulador de areas no efectivas con actualizacion incremental del eje neutro
     get_linear_stress :
         Devuelve el valor de tension en la coordenada indicada para una variacion lineal de tension
+    root_iter :
+        raiz de una funcion creciente acotada en un intervalo (secante con biseccion de resguardo)
+    effectiveSection_y :
+        seccion efectiva respecto del eje y de perfiles C con labios, escalar o para un lote de perfiles
 
 '''
 
+import numpy as np
+from .sec_2 import sec2_2_1_vec, sec2_2_2_vec, sec2_3_1_vec
+from . import kernels
+from .kernels import EQ_CODES
+
 def eta_iter(FF, mat, s = 0, eq = 'B-5'):
     ''' A partir de la constante FF, se itera con un esquema de newton-rapson para 
     satisfacer la ecuacion f(s): s- FF*eta(s) = 0
@@ -20,7 +33,7 @@ def eta_iter(FF, mat, s = 0, eq = 'B-5'):
         mat : <class steel>
             Material del miembro
         s : float
-            Tension incial de la iteracion. Por default s = 0.75*FY
+            Tension incial de la iteracion. Por default la de mat.solveEta(FF, eq)
         eq : string
                 Ecuacion a usar en el calculo del factor de plasticidad
                 B-3 : sqrt(Et/E0)
@@ -29,43 +42,78 @@ def eta_iter(FF, mat, s = 0, eq = 'B-5'):
 
     Tests
     -----
-        incluido en test generales
+        >>> from .properties import steel
+        >>> round(eta_iter(300.0, steel(344.8, 186200.0, 0.3, 4.58, 0.002)), 2)
+        189.65
     '''
 
-    # tension inicial para iterar
-    if not s:
-        s = mat.FY*0.75
-    ds = mat.FY/5000 # delta s para calcular la derivada
-    err = 0.1 # error tolerado porcentual
-    iterr = 0 #inicializo el contador de iteraciones
-    eta = mat.eta(s= s, eq= eq) #inicializo eta
-    F = FF*eta
+    # el esquema de newton-rapson se ejecuta en el kernel (compilado si numba esta disponible)
+    if eq not in EQ_CODES:
+        print('No se reconoce la ecuacion', eq )
+        raise Exception('>> Analisis abortado <<')
+    if not s and np.isfinite(FF):
+        s = mat.solveEta(FF, eq= eq)
+    F, converged = kernels.eta_iter(float(FF), float(mat.FY), float(mat.E0), float(mat.offset), float(mat.n), float(s), EQ_CODES[eq])
+    if not converged:
+        print('Se excedieron las 100 iteraciones')
+    return F
+
+def eta_iter_vec(FF, mat, s = 0, eq = 'B-5'):
+    ''' Version vectorizada de eta_iter: el mismo esquema de newton-rapson aplicado a cada valor de FF.
+    Cada elemento deja de iterar al alcanzar la tolerancia, por lo que el resultado coincide con el de
+    eta_iter elemento a elemento. Para FF no finito (e.g. longitud nula) se devuelve FF.
+
+    Parameters
+    ----------
+        FF : array
+            Valores de la ecuacion para eta = 1
+        mat : <class steel>
+            Material del miembro
+        s : float or array
+            Tension incial de la iteracion. Por default la de mat.solveEta(FF, eq)
+        eq : string
+            Ecuacion a usar en el calculo del factor de plasticidad (ver eta_iter)
 
-    # funcion para encontrar raices
+    Returns
+    -------
+        F : array
+            Tension FF*eta(s) en la ultima iteracion
+
+    Tests
+    -----
+        >>> from .properties import steel
+        >>> mat = steel(344.8, 186200.0, 0.3, 4.58, 0.002)
+        >>> F = eta_iter_vec([300.0, 600.0], mat)
+        >>> [round(float(x), 2) for x in F] == [round(eta_iter(300.0, mat), 2), round(eta_iter(600.0, mat), 2)]
+        True
+    '''
+    if eq not in EQ_CODES:
+        print('No se reconoce la ecuacion', eq )
+        raise Exception('>> Analisis abortado <<')
+    shape = np.shape(FF)
+    FF = np.atleast_1d(np.asarray(FF, dtype= float))
+    finite = np.isfinite(FF)
+    if np.any(np.asarray(s) == 0):
+        s = np.where(np.asarray(s) == 0, mat.solveEta(np.where(finite, FF, 0.0), eq= eq), s)
+    s = s*np.ones_like(FF)
+    ds = mat.FY/5000
+    err = 0.1
+    F = np.where(finite, FF*mat.eta(s, eq= eq), FF)
     fn = s - F
-    
-    # newton-rapson para encontrar raiz de fn
-    while abs((F-s)/s*100) > err and iterr < 100:
-        # diferencial de eta
-        eta_2 = mat.eta(s= s+ds, eq= eq)
-        # diferencial de F
-        F_2 = FF*eta_2
-        # diferencial de fn
-        fn_2 = s+ds - F_2
-        # derivada  dfn/ds
-        dfn = (fn_2 - fn)/ds
-        # nuevo valor de s
-        s = s - fn/dfn
-
-        # actualizo valores, itero
-        eta = mat.eta(s= s, eq= eq)
-        F = FF*eta
-        fn = s - F
+    active = finite & (np.abs((F-s)/s*100) > err)
+    iterr = 0
+    while active.any() and iterr < 100:
+        FFa, sa, fna = FF[active], s[active], fn[active]
+        F_2 = FFa*mat.eta(sa+ds, eq= eq)
+        dfn = (sa+ds - F_2 - fna)/ds
+        sa = sa - fna/dfn
+        Fa = FFa*mat.eta(sa, eq= eq)
+        s[active], F[active], fn[active] = sa, Fa, sa - Fa
+        active[active] = np.abs((Fa-sa)/sa*100) > err
         iterr += 1
-        #print(iterr, s, F, 100-(F-s)/s*100)
-    if abs((F-s)/s*100) > err:
-        print('Se excedieron las 100 iteraciones')
-    return F
+    if active.any():
+        print('Se excedieron las 100 iteraciones en', int(active.sum()), 'valores')
+    return F.reshape(shape)
 
 def adjustNeutralAxis(Ix, A, nEffAreas):
     '''Se calculan las nuevas propiedades efectivas (Ixx, cy) de la seccion  respecto de un nuevo eje neutro x'-x', a partir de quitar areas con propiedades Ixx_, A_, cx_
@@ -76,7 +124,7 @@ def adjustNeutralAxis(Ix, A, nEffAreas):
             Segundo momento de area de la seccion
         A : float
             Area de la seccion
-        nEffAreas : dict {1:{}, 2:{}, }
+        nEffAreas : dict {1:{}, 2:{}, } o class nonEffectiveAreas
             Propiedades geometricas de los segmentos con areas no-efectivas:
             t : float
                 espesor del segmento no-efectivo
@@ -100,33 +148,145 @@ def adjustNeutralAxis(Ix, A, nEffAreas):
         >>> cy, Ixx= adjustNeutralAxis(2.68, 0.541, {1: {'t': 0.06, 'b_':1.471 - 0.806, 'cy_': (6-0.06)/2, 'paralel': True}})
         >>> print( '{:{fmt}}, {:{fmt}}'.format(cy, Ixx, fmt='.3f') )
         0.236, 2.300
+
         # Ex. 4.5 Cold-Formed Steel Design
         >>> nEffAreas= {1: {'b_': 1.0180380857045028, 'cy_': 4.9625, 'paralel': True, 't': 0.075},
         ... 2: {'b_': 0.6166109036450154, 'cy_': 1.7408312699259814, 'paralel': False, 't': 0.075},
         ... 3: {'b_': 0.44269505865706416, 'cy_': 4.501347529328532, 'paralel': False, 't': 0.075}}
         >>> cy, Ixx= adjustNeutralAxis(20.5216, 1.3431, nEffAreas)
+        >>> print( '{:{fmt}}, {:{fmt}}'.format(cy, Ixx, fmt='.2f') )
         0.51, 17.51
     '''
-    sumA_ = 0 # areas de los segmentos no efectivos
-    sumQ_ = 0 # primer momento de area de los sementos no efectivos
-    for nAreas in nEffAreas.values():
-        t, b_, cy_, paralel = nAreas.values()
+    if not isinstance(nEffAreas, nonEffectiveAreas):
+        nEffAreas = nonEffectiveAreas(Ix, A, nEffAreas)
+    return nEffAreas.neutralAxis()
+
+
+class nonEffectiveAreas():
+    '''Acumulador de areas no efectivas de una seccion. Guarda los segmentos en arrays y mantiene las sumas
+    de area, primer momento y segundo momento, por lo que agregar, quitar o reemplazar un segmento es O(1)
+    y el eje neutro (cy, Ixx) se obtiene sin recorrer los segmentos. Se usa como un dict {key: segmento}.
+
+    Con S0 = sum(A_), S1 = sum(A_*cy_), S2 = sum(A_*cy_**2) y Sp = sum(Ixx_ propio):
+        cy = S1/(A - S0)
+        Ixx = Ix + A*cy**2 - (Sp + S2 + 2*cy*S1 + cy**2*S0)
+    que es el resultado de adjustNeutralAxis.
+
+    Parameters
+    ----------
+        Ix : float
+            Segundo momento de area de la seccion bruta
+        A : float
+            Area de la seccion bruta
+        nEffAreas : dict {key: {'t', 'b_', 'cy_', 'paralel'}}
+            Segmentos no efectivos iniciales (opcional)
+        size : int
+            Capacidad inicial de los arrays (crece si hace falta)
+
+    Methods
+    -------
+        add(key, t, b_, cy_, paralel) :
+            Agrega el segmento key, o lo reemplaza si ya existe
+        remove(key) :
+            Quita el segmento key
+        neutralAxis() :
+            Devuelve (cy, Ixx)
+        asDict() :
+            Segmentos como dict of dicts (formato de adjustNeutralAxis)
+
+    Tests
+    -----
+        >>> nE = nonEffectiveAreas(20.5216, 1.3431)
+        >>> nE[1] = {'t': 0.075, 'b_': 1.0180380857045028, 'cy_': 4.9625, 'paralel': True}
+        >>> nE.add(2, t= 0.075, b_= 0.3, cy_= 1.0, paralel= False)
+        >>> nE.add(2, t= 0.075, b_= 0.6166109036450154, cy_= 1.7408312699259814, paralel= False)
+        >>> nE.add(3, t= 0.075, b_= 0.44269505865706416, cy_= 4.501347529328532, paralel= False)
+        >>> print( '{:{fmt}}, {:{fmt}}'.format(*nE.neutralAxis(), fmt='.2f') )
+        0.51, 17.51
+        >>> nE.remove(3); nE.remove(2)
+        >>> len(nE), sorted(nE.keys())
+        (1, [1])
+        >>> print( '{:{fmt}}, {:{fmt}}'.format(*nE.neutralAxis(), fmt='.4f') )
+        0.2991, 18.5279
+    '''
+    def __init__(self, Ix, A, nEffAreas = None, size = 4):
+        self.Ix = Ix
+        self.A = A
+        self.t = np.zeros(size)
+        self.b_ = np.zeros(size)
+        self.cy_ = np.zeros(size)
+        self.paralel = np.zeros(size, dtype= bool)
+        self.slots = {} # key -> indice en los arrays
+        self.free = list(range(size-1, -1, -1))
+        self.S0 = 0.0 # sum(A_)
+        self.S1 = 0.0 # sum(A_*cy_)
+        self.S2 = 0.0 # sum(A_*cy_**2)
+        self.Sp = 0.0 # sum(Ixx_ propio)
+        if nEffAreas:
+            for key, nAreas in nEffAreas.items():
+                self[key] = nAreas
+
+    def _sums(self, i, sign):
+        t, b_, cy_ = self.t[i], self.b_[i], self.cy_[i]
         A_ = b_*t
-        sumA_ = sumA_ + A_ # area del segmento no-efectivo
-        sumQ_ = sumQ_ + cy_*A_ # primer momento de area
-    Ae = A - sumA_
-    cy = sumQ_/Ae
-
-    sumIxx_ = 0 # segundos momentos negativos de los segmentos no efectivos
-    for nAreas in nEffAreas.values():
-        t, b_, cy_, paralel = nAreas.values()
-        if paralel:
-            sumIxx_ = sumIxx_ + t**3*b_/12 + (cy_+cy)**2*b_*t
+        self.S0 = self.S0 + sign*A_
+        self.S1 = self.S1 + sign*A_*cy_
+        self.S2 = self.S2 + sign*A_*cy_**2
+        if self.paralel[i]:
+            self.Sp = self.Sp + sign*t**3*b_/12
+        else:
+            self.Sp = self.Sp + sign*t*b_**3/12
+
+    def add(self, key, t, b_, cy_, paralel):
+        if key in self.slots:
+            i = self.slots[key]
+            self._sums(i, -1.0)
         else:
-            sumIxx_ = sumIxx_ + t*b_**3/12 + (cy_+cy)**2*b_*t
-    Ixx = Ix + A*cy**2 - sumIxx_
+            if not self.free:
+                n = self.t.size
+                self.t, self.b_, self.cy_ = [np.concatenate((x, np.zeros(n))) for x in (self.t, self.b_, self.cy_)]
+                self.paralel = np.concatenate((self.paralel, np.zeros(n, dtype= bool)))
+                self.free = list(range(2*n-1, n-1, -1))
+            i = self.free.pop()
+            self.slots[key] = i
+        self.t[i], self.b_[i], self.cy_[i], self.paralel[i] = t, b_, cy_, paralel
+        self._sums(i, +1.0)
+
+    def remove(self, key):
+        i = self.slots.pop(key)
+        self._sums(i, -1.0)
+        self.t[i] = self.b_[i] = self.cy_[i] = 0.0
+        self.free.append(i)
+        if not self.slots: # se anulan los errores de redondeo acumulados
+            self.S0 = self.S1 = self.S2 = self.Sp = 0.0
+
+    def neutralAxis(self):
+        cy = self.S1/(self.A - self.S0)
+        Ixx = self.Ix + self.A*cy**2 - (self.Sp + self.S2 + 2*cy*self.S1 + cy**2*self.S0)
+        return float(cy), float(Ixx)
+
+    def __setitem__(self, key, nAreas):
+        self.add(key, t= nAreas['t'], b_= nAreas['b_'], cy_= nAreas['cy_'], paralel= nAreas['paralel'])
+
+    def __getitem__(self, key):
+        i = self.slots[key]
+        return {'t': float(self.t[i]), 'b_': float(self.b_[i]), 'cy_': float(self.cy_[i]), 'paralel': bool(self.paralel[i])}
+
+    def __delitem__(self, key):
+        self.remove(key)
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def __len__(self):
+        return len(self.slots)
+
+    def keys(self):
+        return self.slots.keys()
+
+    def asDict(self):
+        return {key: self[key] for key in self.slots}
 
-    return cy, Ixx
 
 def get_linear_stress(fFlange, yCG, y):
     '''Tension s en la coordenada y considerando una distribucion lineal con una tension de compresion fFlange.
@@ -151,4 +311,176 @@ def get_linear_stress(fFlange, yCG, y):
         -40.33
     '''
     s= fFlange- fFlange/yCG*y
-    return s
\ No newline at end of file
+    return s
+
+
+def root_iter(fun, lo, hi, x0 = None, slope = 1.0, tol = 0.005, maxIter = 50):
+    '''Raiz de fun(x) = 0 en [lo, hi] para una funcion creciente con fun(lo) <= 0 <= fun(hi). Se usa el metodo
+    de la secante entre las dos ultimas iteraciones; si el paso sale del intervalo que contiene la raiz se
+    biseca. Cada evaluacion acota el intervalo, por lo que la iteracion no puede divergir.
+
+    Parameters
+    ----------
+        fun : function
+            Funcion (residuo) a anular
+        lo, hi : float
+            Intervalo que contiene la raiz
+        x0 : float
+            Valor inicial (e.g. solucion de un caso cercano). Por defecto el punto medio del intervalo
+        slope : float
+            Estimacion de la derivada de fun para el primer paso (1 para residuos del tipo x - g(x))
+        tol : float
+            Tolerancia relativa: |fun(x)| <= tol*|x| o ancho del intervalo <= tol*|x|
+        maxIter : int
+            Numero maximo de evaluaciones de fun
+
+    Returns
+    -------
+        x : float
+            Raiz. Es siempre el ultimo punto evaluado, aun si no se alcanza la convergencia
+        info : dict
+            nIter: evaluaciones de fun, err: |fun(x)/x|, converged: bool, lo, hi: intervalo final
+
+    Tests
+    -----
+        >>> x, info = root_iter(lambda x: x**2 - 2.0, 0.0, 2.0, x0= 1.0, tol= 1e-9)
+        >>> round(x, 6), info['converged'], info['nIter'] < 10
+        (1.414214, True, True)
+        >>> x, info = root_iter(lambda x: x**2 - 2.0, 0.0, 2.0, x0= 1.0, tol= 1e-12, maxIter= 3) # doctest: +ELLIPSIS
+        Se alcanzo el numero maximo de iteraciones. Error % alcanzado: ...
+        >>> info['converged'], info['nIter'], abs(abs(x**2 - 2.0)/x - info['err']) < 1e-12
+        (False, 3, True)
+    '''
+    x = 0.5*(lo + hi) if x0 is None else min(max(x0, lo), hi)
+    xPrev = rPrev = None
+    nIter = 0
+    converged = False
+    err = float('inf')
+    while True:
+        r = fun(x)
+        nIter += 1
+        err = abs(r/x) if x else abs(r)
+        if err <= tol:
+            converged = True
+            break
+        if r < 0: lo = x
+        else: hi = x
+        if hi - lo <= tol*abs(x):
+            converged = True
+            break
+        if nIter >= maxIter:
+            break
+        if xPrev is not None and r != rPrev:
+            xNew = x - r*(x - xPrev)/(r - rPrev)
+        else:
+            xNew = x - r/slope
+        if not lo < xNew < hi:
+            xNew = 0.5*(lo + hi)
+        xPrev, rPrev, x = x, r, xNew
+    if not converged:
+        print('Se alcanzo el numero maximo de iteraciones. Error % alcanzado:', err*100)
+    return x, {'nIter': nIter, 'err': err, 'converged': converged, 'lo': lo, 'hi': hi}
+
+def effectiveSection_y(fc, Cs, p, cx0 = None, tol = 0.005, maxIter = 100):
+    '''Seccion efectiva respecto del eje y de perfiles C con labios para la tension fc en la fibra extrema comprimida.
+    Es la iteracion de ASCE_8_02.s3_Se_effective_y y de batch.s3_3_1_1_y: fc y las propiedades de p pueden ser
+    floats o arrays (un valor por perfil), y cada perfil deja de iterar al alcanzar la tolerancia.
+
+    Cs = +1: el alma esta en compresion uniforme (2.2.1); Cs = -1: los labios (2.3.1). Las alas tienen gradiente
+    de tensiones (2.2.2) y la posicion del eje neutro se itera hasta que la variacion relativa de la distancia a
+    la fibra extrema traccionada sea menor a tol.
+
+    Parameters
+    ----------
+        fc : float or array
+            Tension en la fibra extrema comprimida
+        Cs : int [-1, +1]
+            +1: centro de corte a compresion, -1 centro de corte a traccion
+        p : dict
+            Propiedades de los perfiles: t, B, c_x, r_out, A, Iy, E0 y anchos planos wFlange, wWeb, wLip
+        cx0 : float or array
+            Corrimiento inicial del eje neutro. None o nan: se parte de las alas efectivas
+        tol : float
+            Tolerancia relativa en la distancia del eje neutro a la fibra extrema traccionada
+        maxIter : int
+            Numero maximo de iteraciones
+
+    Returns
+    -------
+        Sey : float or array
+            Modulo resistente efectivo, Iy/max(xc, xt)
+        r : dict
+            Iy, cx, xc (distancia del eje neutro a la fibra extrema comprimida), xt (a la traccionada), nIter, err,
+            converged; uniform: b, b_, cx_ y midC del elemento en compresion uniforme; flange: b1, b2, f1, f2,
+            b_ (de ambas alas), cy_ y midC de las alas en la ultima iteracion
+
+    Tests
+    -----
+        Alas totalmente efectivas: el eje neutro solo se corre por el alma no efectiva
+        >>> p = {'t': 1.0, 'B': 30.0, 'c_x': 8.0, 'r_out': 2.0, 'A': 200.0, 'Iy': 15000.0, 'E0': 200000.0,
+        ...      'wFlange': 26.0, 'wWeb': 96.0, 'wLip': 8.0}
+        >>> Sey, r = effectiveSection_y(10.0, 1, p)
+        >>> round(float(Sey), 2), float(r['flange']['b_']), int(r['nIter']), bool(r['converged'])
+        (681.82, 0.0, 1, True)
+        >>> Sey, r = effectiveSection_y(np.array([10.0, 300.0]), 1, p)
+        >>> [round(float(v), 2) for v in Sey], [round(float(v), 2) for v in r['uniform']['b_']]
+        ([681.82, 568.82], [0.0, 52.43])
+    '''
+    fc = np.asarray(fc, dtype= float)
+    t, B, c_x, r_out, A, Iy0, E0 = [np.asarray(p[key], dtype= float) for key in ['t', 'B', 'c_x', 'r_out', 'A', 'Iy', 'E0']]
+
+    def neutralAxis(Au, cyu, Ipu, Af, cyf, Ipf):
+        # ver nonEffectiveAreas
+        S0 = Au + Af
+        S1 = Au*cyu + Af*cyf
+        S2 = Au*cyu**2 + Af*cyf**2
+        cx = S1/(A - S0)
+        return cx, Iy0 + A*cx**2 - (Ipu + Ipf + S2 + 2*cx*S1 + cx**2*S0)
+
+    # elemento en compresion uniforme (paralelo a y-y). xComp: distancia del eje y-y original a la fibra extrema comprimida
+    if Cs > 0:
+        b, midC = sec2_2_1_vec(w= p['wWeb'], t= t, f= fc, E= E0)
+        bu_ = p['wWeb'] - b
+        cx_ = c_x - t/2.0
+        xComp = c_x
+    else:
+        b, midC = sec2_3_1_vec(w= p['wLip'], t= t, f= fc, E= E0)
+        bu_ = (p['wLip'] - b)*2.0
+        cx_ = B - c_x - t/2.0
+        xComp = B - c_x
+    Au = bu_*t
+    Ipu = t**3*bu_/12
+    zero = np.zeros(np.broadcast(fc, t).shape)
+
+    cx, Iy = neutralAxis(Au, cx_, Ipu, zero, zero, zero)
+    if cx0 is not None:
+        cx = np.where(np.isnan(cx0), cx, cx0)
+    xMAX = B - (xComp + cx)
+
+    # alas con gradiente de tensiones
+    flange = {key: zero.copy() for key in ['b1', 'b2', 'f1', 'f2', 'b_', 'cy_', 'b_e', 'k', 'psi']}
+    active = np.ones(zero.shape, dtype= bool)
+    err = np.ones(zero.shape)
+    nIter = np.zeros(zero.shape, dtype= int)
+    while active.any() and nIter.max() < maxIter:
+        f1 = get_linear_stress(fc, yCG= xComp + cx, y= r_out)
+        f2 = get_linear_stress(fc, yCG= xComp + cx, y= B - r_out)
+        b1, b2, midF = sec2_2_2_vec(w= p['wFlange'], t= t, f1= f1, f2= f2, E0= E0)
+        bf_ = np.maximum(xComp + cx - r_out - b1 - b2, 0.0)
+        cyf = b1 + bf_/2.0 - cx # distancia del centroide del area no-efectiva respecto de y-y (incial)
+        cxNew, IyNew = neutralAxis(Au, cx_, Ipu, bf_*2.0*t, cyf, t*(bf_*2.0)**3/12)
+        xMAXnew = B - (xComp + cxNew)
+        for key, value in [('b1', b1), ('b2', b2), ('f1', f1), ('f2', f2), ('b_', bf_*2.0), ('cy_', cyf)] + list(midF.items()):
+            flange[key] = np.where(active, value, flange[key])
+        err = np.where(active, np.abs((xMAX - xMAXnew)/xMAX), err)
+        cx = np.where(active, cxNew, cx)
+        Iy = np.where(active, IyNew, Iy)
+        xMAX = np.where(active, xMAXnew, xMAX)
+        nIter = nIter + active
+        active = active & (err > tol)
+
+    xc = xComp + cx
+    flange['midC'] = {key: flange.pop(key) for key in ['b_e', 'k', 'psi']}
+    r = {'Iy': Iy, 'cx': cx, 'xc': xc, 'xt': xMAX, 'nIter': nIter, 'err': err, 'converged': err <= tol,
+         'uniform': {'b': b, 'b_': bu_, 'cx_': cx_, 'midC': midC}, 'flange': flange}
+    return Iy/np.maximum(xc, xMAX), r
@@ -0,0 +1,192 @@
+'''Superficie de interaccion carga axial-flexion (seccion 3.5) de un miembro.
+
+    Con las resistencias de diseno (fiPn, fiPno, fiMn_x, fiMn_y) y las cargas de pandeo elastico (Pe_x, Pe_y)
+    conocidas, las ecuaciones 3.5-1 a 3.5-3 definen una superficie fija en el espacio (P, Mx, My). Se
+    parametriza con esas constantes, de modo que la utilizacion y el factor de reserva de cualquier punto
+    de demanda se evaluan en forma cerrada (operaciones de arrays), sin volver a ejecutar las verificaciones.
+
+    Classes
+    -------
+        interactionSurface : class
+            Superficie de interaccion 3.5 de un miembro.
+'''
+
+import numpy as np
+from .sec_3 import E_3_5_e1, E_3_5_e2, E_3_5_e3, E_3_5_e4, E_3_5_e5
+
+
+class interactionSurface():
+    '''Superficie de interaccion 3.5 de un miembro, construida una vez a partir de las resistencias de ASCE_8_02.
+
+        Pu/fiPn > 0.15: mayor de Ec 3.5-1 (alpha_n = 1 - Pu/Pe) y Ec 3.5-2
+        Pu/fiPn <= 0.15: Ec 3.5-3
+    Si Pu >= Pe la Ec 3.5-1 no tiene solucion y la utilizacion es inf.
+
+    Parameters
+    ----------
+        analysis : class ASCE_8_02
+            Analisis del miembro. Se usan s3_4, s3_3_1 y s3_3_1_1_y para las resistencias no indicadas
+        Cm_x, Cm_y : float
+            Coeficientes de momento de Ec 3.5-1
+        fiPn, fiPno, fiMn_x : float
+            Resistencias de diseno. Por defecto las de s3_4() y s3_3_1()
+        fiMn_y : float or list [fiMny_plus, fiMny_minus]
+            Resistencia de diseno a flexion respecto de y. Por defecto la de s3_3_1_1_y() en perfiles 'c_w_lps',
+            calculada la primera vez que se consulta un punto con Mu_y no nulo
+
+    Attributes
+    ----------
+        fiPn, fiPno, fiMn_x : float
+            Resistencias de diseno
+        Pe_x, Pe_y : float
+            Cargas de pandeo elastico, Ec 3.5-5
+
+    Methods
+    -------
+        evaluate(Pu, Mu_x, Mu_y) :
+            Utilizacion y resultados intermedios de cada punto (ver ASCE_8_02.s3_5)
+        utilization(Pu, Mu_x, Mu_y) :
+            Utilizacion de cada punto
+        reserve(Pu, Mu_x, Mu_y) :
+            Factor de reserva de cada punto: menor lambda tal que la demanda lambda*(Pu, Mu_x, Mu_y) alcanza utilizacion 1
+
+    Tests
+    -----
+        >>> class a:
+        ...     class member:
+        ...         class profile: type, Ix, Iy = 'cee', 1000.0, 100.0
+        ...         class steel: E0 = 1000.0
+        ...     def _bucklingLengths(self): return 1.0, 1.0, 1.0, 50.0, 50.0, 50.0
+        >>> s = interactionSurface(a(), fiPn= 10.0, fiPno= 12.0, fiMn_x= 20.0, fiMn_y= 5.0)
+        >>> [round(float(u), 4) for u in s.utilization([1.0, 5.0], [10.0, 10.0], [0.0, 1.0])]
+        [0.6, 1.1167]
+        >>> lam = s.reserve([1.0, 5.0], [10.0, 10.0], [0.0, 1.0])
+        >>> [round(float(u), 6) for u in s.utilization(lam*[1.0, 5.0], lam*[10.0, 10.0], lam*[0.0, 1.0])]
+        [1.0, 1.0]
+
+        Pe_y menor que la carga: Ec 3.5-1 sin solucion (utilizacion inf) desde Pu = Pe_y
+        >>> a.member.profile.Iy = 0.1
+        >>> s = interactionSurface(a(), fiPn= 10.0, fiPno= 12.0, fiMn_x= 20.0, fiMn_y= 5.0)
+        >>> round(s.Pe_y, 2), [round(float(l), 6) for l in s.reserve([5.0], [0.0], [0.0])]
+        (0.39, [0.3])
+        >>> s = interactionSurface(a(), fiPn= 1.0, fiPno= 12.0, fiMn_x= 20.0, fiMn_y= 5.0)
+        >>> lam = s.reserve([5.0], [0.0], [0.0])
+        >>> round(float(lam[0]*5.0/s.Pe_y), 6), [round(float(u), 2) for u in s.utilization(0.999*lam*5.0, 0.0)], s.utilization(1.001*lam*5.0, 0.0).tolist()
+        (1.0, [0.39], [inf])
+    '''
+    def __init__(self, analysis, Cm_x = 0.85, Cm_y = 0.85, fiPn = None, fiPno = None, fiMn_x = None, fiMn_y = None):
+        self.analysis = analysis
+        steel = analysis.member.steel
+        profile = analysis.member.profile
+        self.Cm_x = Cm_x
+        self.Cm_y = Cm_y
+
+        self.fiPn = analysis.s3_4(trace= False)[0] if fiPn is None else fiPn
+        self.fiPno = analysis._s3_4_nominal(trace= False)[1] if fiPno is None else fiPno
+        self.fiMn_x = analysis.s3_3_1(trace= False)[0] if fiMn_x is None else fiMn_x
+        self._fiMn_y = fiMn_y
+
+        Kx, Ky, _, Lx, Ly, _ = analysis._bucklingLengths()
+        self.Pe_x = E_3_5_e5(E0= steel.E0, Kb= Kx, Lb= Lx, Ib= profile.Ix)
+        self.Pe_y = E_3_5_e5(E0= steel.E0, Kb= Ky, Lb= Ly, Ib= profile.Iy)
+
+    def fiMn_y(self, Mu_y):
+        '''Resistencia a flexion respecto de y para cada Mu_y (Mu_y > 0 con el centro de corte a compresion).'''
+        if not np.any(Mu_y):
+            return np.inf
+        if self._fiMn_y is None:
+            profile = self.analysis.member.profile
+            if profile.type != 'c_w_lps':
+                print('Seccion 3.5 - resistencia a flexion respecto de y no implementada para el perfil', profile.type,'. Indicar fiMn_y.')
+                raise Exception('>> Analisis abortado <<')
+            fiMny_plus, fiMny_minus, _ = self.analysis.s3_3_1_1_y(trace= False)
+            self._fiMn_y = [fiMny_plus, fiMny_minus]
+        if np.ndim(self._fiMn_y) == 0:
+            return self._fiMn_y
+        return np.where(Mu_y >= 0, self._fiMn_y[0], self._fiMn_y[1])
+
+    def evaluate(self, Pu, Mu_x, Mu_y = 0.0):
+        '''Utilizacion de cada punto (Pu, Mu_x, Mu_y) y resultados intermedios, como ASCE_8_02.s3_5.'''
+        Pu = np.asarray(Pu, dtype= float)
+        Mu_x = np.abs(np.asarray(Mu_x, dtype= float))
+        Mu_y = np.asarray(Mu_y, dtype= float)
+        fiMn_y = self.fiMn_y(Mu_y)
+        Mu_y = np.abs(Mu_y)
+        fiPn, fiPno, fiMn_x = self.fiPn, self.fiPno, self.fiMn_x
+
+        alpha_nx = E_3_5_e4(Pu= Pu, Pe= self.Pe_x)
+        alpha_ny = E_3_5_e4(Pu= Pu, Pe= self.Pe_y)
+        with np.errstate(divide= 'ignore', invalid= 'ignore'):
+            ratio_e1 = E_3_5_e1(Pu= Pu, fiPn= fiPn, Mu_x= Mu_x, Mu_y= Mu_y, fiMn_x= fiMn_x, fiMn_y= fiMn_y,
+                                alpha_nx= alpha_nx, alpha_ny= alpha_ny, Cm_x= self.Cm_x, Cm_y= self.Cm_y)
+        ratio_e1 = np.where((alpha_nx > 0) & (alpha_ny > 0), ratio_e1, np.inf)
+        ratio_e2 = E_3_5_e2(Pu= Pu, fiPn_0= fiPno, Mu_x= Mu_x, Mu_y= Mu_y, fiMn_x= fiMn_x, fiMn_y= fiMn_y)
+        ratio_e3 = E_3_5_e3(Pu= Pu, fiPn= fiPn, Mu_x= Mu_x, Mu_y= Mu_y, fiMn_x= fiMn_x, fiMn_y= fiMn_y)
+
+        small = Pu/fiPn <= 0.15
+        utilization = np.where(small, ratio_e3, np.maximum(ratio_e1, ratio_e2))
+        equation = np.where(small, '3.5-3', np.where(ratio_e1 >= ratio_e2, '3.5-1', '3.5-2'))
+        governing = int(np.argmax(utilization))
+
+        midC = {'fiPn': fiPn, 'fiPno': fiPno, 'fiMn_x': fiMn_x, 'fiMn_y': fiMn_y, 'Pe_x': self.Pe_x, 'Pe_y': self.Pe_y,
+                'alpha_nx': alpha_nx, 'alpha_ny': alpha_ny, 'ratio_e1': ratio_e1, 'ratio_e2': ratio_e2, 'ratio_e3': ratio_e3,
+                'equation': equation, 'governing': governing, 'utilization_max': float(utilization.flat[governing])}
+        return utilization, midC
+
+    def utilization(self, Pu, Mu_x, Mu_y = 0.0):
+        '''Utilizacion de cada punto (Pu, Mu_x, Mu_y).'''
+        return self.evaluate(Pu, Mu_x, Mu_y)[0]
+
+    def reserve(self, Pu, Mu_x, Mu_y = 0.0, tol = 1e-12, maxIter = 50):
+        '''Factor de reserva de cada punto: menor lambda >= 0 tal que lambda*(Pu, Mu_x, Mu_y) tiene utilizacion 1.
+
+            Ec 3.5-2 y 3.5-3 son lineales en lambda. Ec 3.5-1 es creciente y convexa en lambda, se resuelve con
+            Newton desde lambda = 0 (converge en forma monotona). Si el eje que alcanza primero alpha_n = 0 no tiene
+            momento, Ec 3.5-1 no llega a 1 antes de lam_max = Pe/Pu, donde pasa a inf: Newton se limita a
+            lam_max*(1 - 1e-9) y el factor de reserva es lam_max. Si al pasar Pu/fiPn = 0.15 la utilizacion salta
+            por encima de 1, el factor de reserva es el de ese cambio de ecuacion. Pu < 0 se toma como 0.
+
+        Parameters
+        ----------
+            Pu, Mu_x, Mu_y : float or array
+                Demanda de cada punto
+            tol : float
+                Tolerancia relativa de Newton en lambda
+            maxIter : int
+                Numero maximo de iteraciones de Newton
+        Returns
+        -------
+            lam : array
+                Factor de reserva de cada punto (inf si la demanda es nula)
+        '''
+        Pu = np.maximum(np.asarray(Pu, dtype= float), 0.0)
+        Mu_x = np.abs(np.asarray(Mu_x, dtype= float))
+        Mu_y = np.asarray(Mu_y, dtype= float)
+        fiMn_y = self.fiMn_y(Mu_y)
+        Pu, Mu_x, Mu_y, fiMn_y = np.broadcast_arrays(Pu, Mu_x, np.abs(Mu_y), fiMn_y)
+
+        a = Pu/self.fiPn
+        bx, by = Mu_x/self.fiMn_x, Mu_y/fiMn_y
+        px, py = Pu/self.Pe_x, Pu/self.Pe_y
+        with np.errstate(divide= 'ignore'):
+            lam_s = 0.15/a                              # cambio de Ec 3.5-3 a Ec 3.5-1/3.5-2
+            lam_3 = 1/(a + bx + by)
+            lam_2 = 1/(Pu/self.fiPno + bx + by)
+            lam_max = 1/np.maximum(px, py)              # alpha_n = 0
+
+        # Ec 3.5-1: f(lam) = lam*(a + Cm_x*bx/(1 - lam*px) + Cm_y*by/(1 - lam*py)) - 1 = 0
+        cx, cy = self.Cm_x*bx, self.Cm_y*by
+        lam = np.zeros(a.shape)
+        active = (a + cx + cy) > 0
+        for _ in range(maxIter):
+            if not active.any():
+                break
+            l, ax, ay = lam[active], 1 - lam[active]*px[active], 1 - lam[active]*py[active]
+            f = l*(a[active] + cx[active]/ax + cy[active]/ay) - 1
+            df = a[active] + cx[active]/ax**2 + cy[active]/ay**2
+            lNew = np.minimum(l - f/df, lam_max[active]*(1 - 1e-9)) # alpha_n > 0: sin 0/0 si Cm*b = 0
+            lam[active] = lNew
+            active[active] = np.abs(lNew - l) > tol*lNew
+        lam_1 = np.where((a + cx + cy) > 0, lam, np.inf)
+
+        return np.where(lam_3 <= lam_s, lam_3, np.maximum(np.minimum(lam_1, lam_2), lam_s))
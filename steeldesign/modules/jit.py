@@ -0,0 +1,33 @@
+'''Compilacion opcional con numba.
+
+    Si numba esta instalado, njit compila la funcion (y la guarda en cache) la primera vez que se usa; si no,
+    devuelve la misma funcion en Python puro. Con la variable de entorno STEELDESIGN_JIT=0 se fuerza Python puro.
+
+    Variables
+    ---------
+        JIT : bool
+            True si las funciones decoradas con njit se compilan con numba.
+
+    Tests
+    -----
+        >>> @njit
+        ... def square(x):
+        ...     return x*x
+        >>> square(3.0)
+        9.0
+'''
+
+import os
+
+try:
+    if os.environ.get('STEELDESIGN_JIT', '1') == '0':
+        raise ImportError
+    from numba import njit
+    JIT = True
+except ImportError:
+    JIT = False
+    def njit(*args, **kwargs):
+        '''Decorador nulo: devuelve la funcion sin compilar.'''
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
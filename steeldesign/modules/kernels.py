@@ -0,0 +1,66 @@
+'''Kernels escalares de calculo intensivo.
+
+    Contiene la iteracion de eta_iter (Newton-Rapson sobre s - FF*eta(s) = 0), que es la operacion en
+    punto flotante que se repite millones de veces en estudios parametricos. Si numba esta instalado el
+    kernel se compila (njit, ver jit) y se guarda en cache la primera vez que se usa; si no, se ejecuta la
+    misma funcion en Python puro. Las ecuaciones B_1, B_2 y eta son las de appendix_B, compiladas alli.
+
+    functions.eta_iter delega en el kernel eta_iter, por lo que su API no cambia. Ver
+    benchmarks/bench_kernels.py para comparar ambos backends.
+
+    Variables
+    ---------
+        JIT : bool
+            True si los kernels estan compilados con numba (ver jit).
+        EQ_CODES : dict
+            Codigo entero de cada ecuacion del factor de plasticidad (ver appendix_B)
+
+    Tests
+    -----
+        >>> F, converged = eta_iter(300.0, 344.8, 186200.0, 0.002, 4.58, 0.0, 5)
+        >>> round(F, 2), converged
+        (189.63, True)
+'''
+
+from .jit import JIT, njit
+from .appendix_B import EQ_CODES, eta
+
+
+@njit(cache=True)
+def eta_iter(FF, FY, E0, offset, n, s, eq):
+    '''Newton-Rapson sobre f(s) = s - FF*eta(s) = 0. Mismo esquema que functions.eta_iter.
+
+    Returns
+    -------
+        F : float
+            Tension FF*eta(s) en la ultima iteracion
+        converged : bool
+            False si se excedieron las 100 iteraciones
+    '''
+    if not s:
+        s = FY*0.75
+    ds = FY/5000
+    err = 0.1
+    iterr = 0
+    F = FF*eta(FY, E0, offset, n, s, eq)
+    fn = s - F
+    while abs((F-s)/s*100) > err and iterr < 100:
+        F_2 = FF*eta(FY, E0, offset, n, s+ds, eq)
+        fn_2 = s+ds - F_2
+        dfn = (fn_2 - fn)/ds
+        s = s - fn/dfn
+        F = FF*eta(FY, E0, offset, n, s, eq)
+        fn = s - F
+        iterr += 1
+    return F, abs((F-s)/s*100) <= err
+
+def py_func(kernel):
+    '''Version en Python puro de un kernel (la misma funcion si no hay JIT).
+
+    Tests
+    -----
+        >>> F, converged = py_func(eta_iter)(300.0, 344.8, 186200.0, 0.002, 4.58, 0.0, 5)
+        >>> round(F, 2), converged
+        (189.63, True)
+    '''
+    return getattr(kernel, 'py_func', kernel)
@@ -0,0 +1,328 @@
+'''Tablas de carga: resistencias de diseno fiPn(L) y fiMn(L) precalculadas por perfil, acero, K y Cb.
+
+    Cada tabla evalua la resistencia axial (s3_4) y a flexion (s3_3_1) con las versiones vectorizadas de
+    ASCE_8_02 sobre una grilla de longitudes, que se refina hasta que la interpolacion cumple la tolerancia.
+    Las consultas interpolan con un polinomio de Hermite monotono (PCHIP, Fritsch-Carlson) en log(L): como
+    la resistencia es monotona decreciente con L, el interpolante tambien lo es y no agrega oscilaciones.
+    Las tablas se guardan en disco con pickle y se consultan sin crear miembros ni analisis.
+
+    Classes and functions
+    ---------------------
+        loadTable : class
+            Tabla de un perfil y acero para un juego de K y Cb.
+        loadTableDB : class
+            Coleccion de tablas indexada por (perfil, acero, K, Cb), con persistencia.
+        load : function
+            Carga una tabla o coleccion guardada con save().
+
+    Tests
+    -----
+        >>> x = np.log([1.0, 2.0, 4.0, 8.0])
+        >>> y = np.array([10.0, 6.0, 5.0, 5.0])
+        >>> yq = _pchip(x, y, _pchipSlopes(x, y), np.log([1.5, 3.0, 6.0]))
+        >>> [round(float(v), 4) for v in yq]
+        [7.1682, 5.2126, 5.0]
+        >>> bool(np.all(np.diff(_pchip(x, y, _pchipSlopes(x, y), np.linspace(x[0], x[-1], 200))) <= 1e-12))
+        True
+'''
+
+import os
+import pickle
+import numpy as np
+from .design import ASCE_8_02, member, designParameters
+from .cache import sectionKey
+
+
+def _pchipSlopes(x, y):
+    '''Derivadas en los nodos del interpolante de Hermite monotono (Fritsch-Carlson, extremos a tres puntos).'''
+    h = np.diff(x)
+    delta = np.diff(y)/h
+    d = np.zeros_like(y)
+    if y.size == 2:
+        d[:] = delta[0]
+        return d
+    # nodos interiores: media armonica ponderada, nula si cambia la pendiente
+    w1 = 2*h[1:] + h[:-1]
+    w2 = h[1:] + 2*h[:-1]
+    same = delta[:-1]*delta[1:] > 0
+    with np.errstate(divide= 'ignore', invalid= 'ignore'):
+        d[1:-1] = np.where(same, (w1 + w2)/(w1/delta[:-1] + w2/delta[1:]), 0.0)
+    # extremos
+    for i, h0, h1, m0, m1 in [(0, h[0], h[1], delta[0], delta[1]), (-1, h[-1], h[-2], delta[-1], delta[-2])]:
+        di = ((2*h0 + h1)*m0 - h0*m1)/(h0 + h1)
+        if np.sign(di) != np.sign(m0):
+            di = 0.0
+        elif np.sign(m0) != np.sign(m1) and abs(di) > abs(3*m0):
+            di = 3*m0
+        d[i] = di
+    return d
+
+def _envelope(x, y):
+    '''Envolvente no creciente de y(x) (minimo acumulado en x creciente), en el orden de entrada.'''
+    order = np.argsort(x, kind= 'stable')
+    env = np.empty_like(y)
+    env[order] = np.minimum.accumulate(y[order])
+    return env
+
+def _spread(values, exact, interp):
+    '''Cota del error de cada subintervalo entre nodos y puntos de control (4 por intervalo): max - min de los
+    valores exactos e interpolados en sus extremos.'''
+    f = np.column_stack((values[:-1], exact.reshape(-1, 3), values[1:]))
+    p = np.column_stack((values[:-1], interp.reshape(-1, 3), values[1:]))
+    hi = np.maximum(np.maximum(f[:, :-1], p[:, :-1]), np.maximum(f[:, 1:], p[:, 1:]))
+    lo = np.minimum(np.minimum(f[:, :-1], p[:, :-1]), np.minimum(f[:, 1:], p[:, 1:]))
+    return hi - lo
+
+def _pchip(x, y, d, xq):
+    '''Evalua el interpolante de Hermite de nodos (x, y) y derivadas d en xq.'''
+    i = np.clip(np.searchsorted(x, xq) - 1, 0, x.size - 2)
+    h = x[i+1] - x[i]
+    t = (xq - x[i])/h
+    return (1 + 2*t)*(1 - t)**2*y[i] + t*(1 - t)**2*h*d[i] + t**2*(3 - 2*t)*y[i+1] + t**2*(t - 1)*h*d[i+1]
+
+
+class loadTable():
+    '''Tabla de resistencias de diseno en funcion de la longitud del miembro para un perfil y un acero.
+
+    Las longitudes de pandeo son Lx = Ly = Lz = L. La grilla inicial tiene nPoints longitudes equiespaciadas en
+    log(L) entre Lmin y Lmax; en cada pasada se evalua la resistencia exacta a 1/4, 1/2 y 3/4 de todos los
+    intervalos y los intervalos donde la cota del error (ver abajo) supera tol*max(resistencia) se dividen en
+    cuatro con esos puntos. Los intervalos de ancho menor a 1e-6 en log(L) (saltos) no se refinan.
+
+    La resistencia es no creciente con L, pero los valores calculados tienen pequenos saltos hacia arriba (del orden
+    de la tolerancia de s3_Se_effective, e.g. al pasar Sc de s3_Se_curve al calculo exacto en f = FY). Se tabula la
+    envolvente no creciente de los valores calculados (minimo acumulado en L), que es conservadora y monotona.
+
+    Como el interpolante y la envolvente son monotonos, en cada subintervalo [u, v] entre puntos evaluados de la
+    ultima pasada el error no supera max - min de sus valores exactos e interpolados en u y v. Esa cota es el
+    criterio de refinamiento y errorBound es su maximo sobre la tabla (cota rigurosa respecto de la envolvente,
+    menor que tol*max salvo en saltos o si se alcanza maxPoints); errorEstimate es el doble del maximo error
+    medido en los puntos de control.
+
+    Parameters
+    ----------
+        profile : class profile
+            Perfil del miembro
+        steel : class steel
+            Acero del miembro
+        Lmin, Lmax : float
+            Rango de longitudes de la tabla
+        Kx, Ky, Kz : float
+            Factores de longitud efectiva
+        Cb : float
+            Coeficiente de flexion
+        modes : list of string
+            Resistencias a tabular: 'fiPn' (s3_4) y/o 'fiMn' (s3_3_1)
+        nPoints : int
+            Cantidad de puntos de la grilla inicial
+        tol : float
+            Tolerancia del error de interpolacion relativa a la resistencia maxima de la tabla
+        maxPoints : int
+            Cantidad maxima de puntos de la grilla
+
+    Attributes
+    ----------
+        L : array
+            Longitudes de la grilla
+        values : dict
+            Resistencia en cada longitud de la grilla {mode: array}
+        errorBound : dict
+            Cota del error absoluto de la interpolacion respecto de la envolvente tabulada {mode: float}
+        errorEstimate : dict
+            Doble del maximo error medido en los puntos de control de la ultima pasada {mode: float}
+        nEval : int
+            Cantidad de longitudes evaluadas con el analisis completo
+
+    Methods
+    -------
+        fiPn(L), fiMn(L) :
+            Resistencia interpolada para L (float o array)
+        save(fileName) :
+            Guarda la tabla con pickle
+
+    Tests
+    -----
+        >>> from steeldesign import c_w_lps_profile, steel
+        >>> p = c_w_lps_profile(H= 100, B= 50, D= 12, t= 1.5, r_out= 3.75)
+        >>> p.calculate()
+        >>> s = steel(FY= 337, E0= 180510.0, nu= 0.3, n= 13.5, offset= 0.002, name= 'SA304_1_4Hard')
+        >>> T = loadTable(p, s, 100, 8000, Kx= 0.7, Ky= 0.7, Kz= 0.7)
+        >>> for L in [150.0, 1234.5, 5000.0]:
+        ...     dp = designParameters(Kx= 0.7, Ky= 0.7, Kz= 0.7)
+        ...     a = ASCE_8_02(member(L= L, profile= p, steel= s, designParameters= dp))
+        ...     print(abs(T.fiPn(L) - a.s3_4()[0]) <= T.tol*T.values['fiPn'].max(), abs(T.fiMn(L) - a.s3_3_1()[0]) <= T.tol*T.values['fiMn'].max())
+        True True
+        True True
+        True True
+        >>> [bool(T.errorBound[mode] <= T.tol*T.values[mode].max()) for mode in ['fiPn', 'fiMn']]
+        [True, True]
+        >>> bool(np.all(np.diff(T.fiPn(np.linspace(100, 8000, 500))) < 1e-6))
+        True
+        >>> import tempfile
+        >>> fileName = os.path.join(tempfile.mkdtemp(), 'table.lt')
+        >>> T.save(fileName)
+        >>> T2 = load(fileName)
+        >>> bool(np.all(T2.fiPn(T.L) == T.fiPn(T.L))), T2.errorBound == T.errorBound
+        (True, True)
+    '''
+    def __init__(self, profile, steel, Lmin, Lmax, Kx = 1.0, Ky = 1.0, Kz = 1.0, Cb = 1.0, modes = ('fiPn', 'fiMn'),
+                 nPoints = 33, tol = 1e-3, maxPoints = 2049):
+        self.name = profile.name
+        self.steelName = steel.name
+        self.key = (sectionKey(profile), steel.key, Kx, Ky, Kz, Cb)
+        self.Lmin, self.Lmax = Lmin, Lmax
+        self.tol = tol
+
+        dP = designParameters(Kx= Kx, Ky= Ky, Kz= Kz, Cb= Cb)
+        analysis = ASCE_8_02(member(L= Lmax, profile= profile, steel= steel, designParameters= dP), trace= False)
+        capacity = {'fiPn': lambda L: analysis.s3_4(L= L)[0], 'fiMn': lambda L: analysis.s3_3_1(L= L)[0]}
+        for mode in modes:
+            if mode not in capacity:
+                print('Resistencia', mode, 'no reconocida. Valores admitidos:', list(capacity))
+                raise Exception('>> Analisis abortado <<')
+
+        x = np.linspace(np.log(Lmin), np.log(Lmax), nPoints)
+        values = {mode: capacity[mode](np.exp(x)) for mode in modes}
+        self.nEval = x.size
+        while True:
+            # puntos de control a 1/4, 1/2 y 3/4 de cada intervalo
+            xCheck = (x[:-1, None] + np.diff(x)[:, None]*np.array([0.25, 0.5, 0.75])).ravel()
+            exact = {mode: capacity[mode](np.exp(xCheck)) for mode in modes}
+            self.nEval += xCheck.size
+            # envolvente no creciente de todos los puntos evaluados
+            for mode in modes:
+                env = _envelope(np.concatenate((x, xCheck)), np.concatenate((values[mode], exact[mode])))
+                values[mode], exact[mode] = env[:x.size], env[x.size:]
+            interp = {mode: _pchip(x, values[mode], _pchipSlopes(x, values[mode]), xCheck) for mode in modes}
+            error = {mode: np.abs(interp[mode] - exact[mode]) for mode in modes}
+            bound = {mode: _spread(values[mode], exact[mode], interp[mode]) for mode in modes}
+            refine = np.zeros(x.size - 1, dtype= bool)
+            for mode in modes:
+                refine |= (bound[mode] > tol*np.abs(values[mode]).max()).any(axis= 1)
+            refine &= np.diff(x) > 1e-6 # discontinuidades (e.g. tolerancia de s3_Se_effective): no se refinan
+            if not refine.any() or x.size + 3*refine.sum() > maxPoints:
+                break
+            # los intervalos que no cumplen se dividen en cuatro con los puntos ya evaluados
+            new = np.repeat(refine, 3)
+            index = np.searchsorted(x, xCheck[new])
+            x = np.insert(x, index, xCheck[new])
+            values = {mode: np.insert(values[mode], index, exact[mode][new]) for mode in modes}
+
+        self.x = x
+        self.L = np.exp(x)
+        self.values = values
+        self.slopes = {mode: _pchipSlopes(x, values[mode]) for mode in modes}
+        self.errorEstimate = {mode: 2*float(error[mode].max()) for mode in modes}
+        self.errorBound = {mode: float(bound[mode].max()) for mode in modes}
+        for mode in modes:
+            if self.errorBound[mode] > tol*np.abs(values[mode]).max():
+                print('Advertencia: loadTable', self.name, 'errorBound[', mode, '] =', self.errorBound[mode], '> tol*max =', tol*np.abs(values[mode]).max())
+
+    def query(self, mode, L):
+        '''Resistencia mode interpolada para L (float o array) en [Lmin, Lmax].'''
+        if mode not in self.values:
+            print('La tabla', self.name, 'no incluye', mode)
+            raise Exception('>> Analisis abortado <<')
+        x = np.log(L)
+        if np.any(x < self.x[0] - 1e-12) or np.any(x > self.x[-1] + 1e-12):
+            print('Longitud fuera del rango de la tabla', self.name, ': [', self.Lmin, ',', self.Lmax, ']')
+            raise Exception('>> Analisis abortado <<')
+        return _pchip(self.x, self.values[mode], self.slopes[mode], x)
+
+    def fiPn(self, L):
+        '''Resistencia axial de diseno interpolada para L.'''
+        return self.query('fiPn', L)
+
+    def fiMn(self, L):
+        '''Resistencia a flexion de diseno interpolada para L.'''
+        return self.query('fiMn', L)
+
+    def save(self, fileName = None):
+        '''Guarda la tabla con pickle. Por defecto en loadTablesDB/<name>.lt del directorio de trabajo.'''
+        if fileName is None:
+            path = os.path.join(os.getcwd(), 'loadTablesDB')
+            if not os.path.isdir(path):
+                os.makedirs(path)
+            fileName = os.path.join(path, self.name + '.lt')
+        with open(fileName, 'wb') as output:
+            pickle.dump(self, output, pickle.HIGHEST_PROTOCOL)
+
+
+class loadTableDB():
+    '''Coleccion de tablas de carga indexada por (perfil, acero, Kx, Ky, Kz, Cb).
+
+    Las tablas se calculan la primera vez que se consultan. Una tabla existente se reutiliza si su rango
+    de longitudes contiene el pedido; si no, se recalcula sobre el rango ampliado.
+
+    Parameters
+    ----------
+        Lmin, Lmax : float
+            Rango de longitudes por defecto de las tablas
+        tol : float
+            Tolerancia de interpolacion de las tablas (ver loadTable)
+
+    Methods
+    -------
+        get(profile, steel, Kx, Ky, Kz, Cb, Lmin, Lmax) :
+            Tabla para la combinacion indicada
+        fiPn(profile, steel, L, ...), fiMn(profile, steel, L, ...) :
+            Resistencias interpoladas
+        save(fileName) :
+            Guarda la coleccion con pickle
+
+    Tests
+    -----
+        >>> from steeldesign import c_w_lps_profile, steel
+        >>> p = c_w_lps_profile(H= 100, B= 50, D= 12, t= 1.5, r_out= 3.75)
+        >>> p.calculate()
+        >>> s = steel(FY= 337, E0= 180510.0, nu= 0.3, n= 13.5, offset= 0.002, name= 'SA304_1_4Hard')
+        >>> db = loadTableDB(100, 3000)
+        >>> fiPn = db.fiPn(p, s, np.array([500.0, 4000.0]))
+        >>> len(db.tables), float(db.get(p, s).Lmin), float(db.get(p, s).Lmax)
+        (1, 100.0, 4000.0)
+        >>> fiMn = db.fiMn(p, s, 1000.0)
+        >>> fiPn = db.fiPn(p, s, 1000.0, Kx= 0.5)
+        >>> len(db.tables)
+        2
+        >>> import tempfile
+        >>> fileName = os.path.join(tempfile.mkdtemp(), 'tables.ltdb')
+        >>> db.save(fileName)
+        >>> db2 = load(fileName)
+        >>> sorted(db2.tables) == sorted(db.tables), bool(db2.fiMn(p, s, 1000.0) == fiMn)
+        (True, True)
+    '''
+    def __init__(self, Lmin, Lmax, tol = 1e-3):
+        self.Lmin, self.Lmax = Lmin, Lmax
+        self.tol = tol
+        self.tables = {}
+
+    def get(self, profile, steel, Kx = 1.0, Ky = 1.0, Kz = 1.0, Cb = 1.0, Lmin = None, Lmax = None):
+        '''Tabla para (profile, steel, Kx, Ky, Kz, Cb) que cubre [Lmin, Lmax]. Se calcula si no existe.'''
+        Lmin = self.Lmin if Lmin is None else min(Lmin, self.Lmin)
+        Lmax = self.Lmax if Lmax is None else max(Lmax, self.Lmax)
+        key = (sectionKey(profile), steel.key, Kx, Ky, Kz, Cb)
+        table = self.tables.get(key)
+        if table is None or table.Lmin > Lmin or table.Lmax < Lmax:
+            if table is not None:
+                Lmin, Lmax = min(Lmin, table.Lmin), max(Lmax, table.Lmax)
+            table = self.tables[key] = loadTable(profile, steel, Lmin, Lmax, Kx= Kx, Ky= Ky, Kz= Kz, Cb= Cb, tol= self.tol)
+        return table
+
+    def fiPn(self, profile, steel, L, Kx = 1.0, Ky = 1.0, Kz = 1.0):
+        '''Resistencia axial de diseno interpolada para L (float o array).'''
+        return self.get(profile, steel, Kx= Kx, Ky= Ky, Kz= Kz, Lmin= np.min(L), Lmax= np.max(L)).fiPn(L)
+
+    def fiMn(self, profile, steel, L, Ky = 1.0, Kz = 1.0, Cb = 1.0):
+        '''Resistencia a flexion de diseno interpolada para L (float o array).'''
+        return self.get(profile, steel, Ky= Ky, Kz= Kz, Cb= Cb, Lmin= np.min(L), Lmax= np.max(L)).fiMn(L)
+
+    def save(self, fileName):
+        '''Guarda la coleccion con pickle.'''
+        with open(fileName, 'wb') as output:
+            pickle.dump(self, output, pickle.HIGHEST_PROTOCOL)
+
+
+def load(fileName):
+    '''Carga una tabla (loadTable) o coleccion (loadTableDB) guardada con save().'''
+    with open(fileName, 'rb') as input:
+        return pickle.load(input)
@@ -0,0 +1,71 @@
+'''Coeficiente de flexion Cb a partir de diagramas de momento.
+
+    Cb = 12.5 Mmax/(2.5 Mmax + 3 MA + 4 MB + 3 MC)
+
+    con Mmax el maximo valor absoluto del momento en el tramo sin arriostrar y MA, MB, MC los valores
+    absolutos en el cuarto, el medio y los tres cuartos del tramo. Los diagramas se dan muestreados a lo largo
+    de cada tramo (ultimo eje del array) y se evaluan todos a la vez: los ejes anteriores pueden ser miembros,
+    combinaciones de carga, etc. El resultado se pasa directamente a ASCE_8_02.s3_3_1(Cb= ...), que evalua el
+    pandeo lateral de todas las combinaciones en una sola llamada. En voladizos sin arriostrar el extremo
+    libre corresponde Cb = 1.
+
+    Functions
+    ---------
+        Cb_quarterPoints(Mmax, MA, MB, MC) :
+            Cb a partir de los momentos caracteristicos del tramo.
+        Cb_diagram(M, x) :
+            Cb de diagramas muestreados.
+
+    Tests
+    -----
+        Tramo con momento uniforme, carga uniforme simplemente apoyada y arriostrada en el centro
+        >>> x = np.linspace(0.0, 1.0, 9)
+        >>> M = np.array([np.ones(9), 4*(x/2)*(1 - x/2)])
+        >>> [round(float(c), 3) for c in Cb_diagram(M)]
+        [1.0, 1.299]
+        >>> round(float(Cb_quarterPoints(Mmax= 1.0, MA= 0.5, MB= 0.0, MC= 0.5)), 3)
+        2.273
+'''
+
+import numpy as np
+
+
+def Cb_quarterPoints(Mmax, MA, MB, MC):
+    '''Cb a partir del momento maximo y de los momentos en el cuarto, medio y tres cuartos del tramo (se usan los
+    valores absolutos). Si el tramo no tiene momento se toma Cb = 1.'''
+    Mmax, MA, MB, MC = [np.abs(np.asarray(M, dtype= float)) for M in (Mmax, MA, MB, MC)]
+    den = 2.5*Mmax + 3*MA + 4*MB + 3*MC
+    with np.errstate(divide= 'ignore', invalid= 'ignore'):
+        return np.where(den > 0, 12.5*Mmax/den, 1.0)
+
+def Cb_diagram(M, x = None):
+    '''Cb de diagramas de momento muestreados a lo largo del tramo sin arriostrar.
+
+    Parameters
+    ----------
+        M : array (..., n)
+            Momento en n puntos de cada tramo (ultimo eje). Los ejes anteriores se evaluan en forma vectorizada
+        x : array (n,)
+            Posicion de las muestras, creciente, comun a todos los diagramas. Por defecto equiespaciadas.
+            Los extremos del tramo son x[0] y x[-1]
+
+    Returns
+    -------
+        Cb : array (...)
+            Coeficiente de flexion de cada tramo
+    '''
+    M = np.asarray(M, dtype= float)
+    n = M.shape[-1]
+    x = np.linspace(0.0, 1.0, n) if x is None else np.asarray(x, dtype= float)
+    if x.shape != (n,) or n < 2:
+        print('Cb_diagram: se requieren al menos 2 muestras y x de igual longitud que el ultimo eje de M.')
+        raise Exception('>> Analisis abortado <<')
+
+    # interpolacion lineal en los cuartos del tramo, con los mismos indices para todos los diagramas
+    xq = x[0] + np.array([0.25, 0.5, 0.75])*(x[-1] - x[0])
+    i = np.clip(np.searchsorted(x, xq) - 1, 0, n - 2)
+    w = (xq - x[i])/(x[i + 1] - x[i])
+    Mq = M[..., i]*(1 - w) + M[..., i + 1]*w
+
+    Mmax = np.abs(M).max(axis= -1)
+    return Cb_quarterPoints(Mmax, Mq[..., 0], Mq[..., 1], Mq[..., 2])
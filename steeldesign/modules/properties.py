@@ -10,6 +10,9 @@
 
         steel : class
             Acero con un modelo de Ramberg-Osgood.
+
+        getSteel : function
+            Devuelve un acero unico (interno) para cada combinacion de parametros.
         
         Tests
         -----
@@ -24,8 +27,9 @@ import sys
 import sectionproperties.pre.pre as pre
 import sectionproperties.post.post as post
 import matplotlib.pyplot as plt
-from .appendix_B import B_1, B_2
-from copy import deepcopy
+import numpy as np
+from .functions import eta_iter_vec
+from copy import copy, deepcopy
 
 class commonMethods():
     '''Metodos save() y load() para hacer un mixin en las clases de perfiles.
@@ -124,6 +128,10 @@ class steel():
             Mismos que los parametros y se agregan:
         G0  : float
             Modulo de corte inicial
+        key : tuple
+            (FY, E0, nu, n, offset). Identifica al material en los caches.
+        cs, ct : float
+            Constantes de Eq B-1 y B-2: Es = E0/(1 + cs*s**(n-1)) | Et = E0/(1 + ct*(s/FY)**(n-1))
         
     Methods
     -------
@@ -133,6 +141,16 @@ class steel():
             Módulo elastico secante a la tensión s
         eta(s) : float
             Factor de plasticidad a la tensión s
+        etaTable(eq) : tuple of array
+            Tabla (s, eta) entre 0 y FY
+        solveEta(FF, eq) : float or array
+            Solucion aproximada de s - FF*eta(s) = 0 a partir de una tabla inversa
+
+    Notes
+    -----
+        G0, key, cs, ct y las tablas de plasticidad se calculan una sola vez, por lo que el acero no debe
+        modificarse luego de creado. Para compartir un mismo acero entre
+        muchos miembros usar getSteel().
 
     Tests
     ------
@@ -158,6 +176,12 @@ class steel():
         self.E0 = E0
         self.name = name
         self.G0 = E0 / 2 / (1 + nu)
+        self.key = (FY, E0, nu, n, offset)
+        self.cs = offset*E0/FY**n
+        self.ct = offset*n*E0/FY
+
+        # tablas de plasticidad y mapas inversos, se generan a demanda
+        self._tables = {}
 
     def Et(self, s):
         ''' Modulo elastico tangente a la tension s. Eq B-2
@@ -180,7 +204,7 @@ class steel():
         -----
             En definicion de la clase        
         '''
-        Et = B_2(self.FY, self.E0, self.offset, self.n, s)
+        Et = self.E0/(1 + self.ct*(s/self.FY)**(self.n-1))
         return Et
     
     def Es(self, s):
@@ -204,7 +228,7 @@ class steel():
         -----
             En definicion de la clase 
         '''
-        Es = B_1(self.FY, self.E0, self.offset, self.n, s)
+        Es = self.E0/(1 + self.cs*s**(self.n-1))
         return Es
 
     def eta(self, s, eq = 'B-5'):
@@ -243,6 +267,123 @@ class steel():
             print('No se reconoce la ecuacion', eq )
             raise Exception('>> Analisis abortado <<')
 
+    def etaTable(self, eq = 'B-5', nPoints = 1001):
+        ''' Tabla del factor de plasticidad entre s = 0 y s = FY. Se calcula una sola vez por material.
+
+        Parameters
+        ----------
+            eq : string
+                Ecuacion a usar en el calculo (ver eta)
+            nPoints : int
+                Cantidad de puntos de la tabla
+
+        Returns
+        -------
+            s : array
+                Tensiones de la tabla
+            eta : array
+                Factor de plasticidad para cada tension
+
+        Tests
+        -----
+            >>> mat = steel(344.8,186200.0, 0.3, 4.58, 0.002)
+            >>> s, eta = mat.etaTable()
+            >>> round(float(eta[0]), 4), round(float(eta[-1]), 4)
+            (1.0, 0.1682)
+            >>> mat.etaTable()[1] is eta
+            True
+        '''
+        key = ('eta', eq, nPoints)
+        if key not in self._tables:
+            s = np.linspace(0.0, self.FY, nPoints)
+            self._tables[key] = (s, self.eta(s, eq= eq))
+        return self._tables[key]
+
+    def solveEta(self, FF, eq = 'B-5', nPoints = 2001):
+        ''' Solucion aproximada de la ecuacion s - FF*eta(s) = 0 interpolando en el mapa inverso FF(s) = s/eta(s).
+
+            El mapa se tabula una sola vez por material entre s = 0 y s = 1.5*FY. Como s/eta(s) es monotona
+            creciente, la interpolacion lineal es unica; el resultado es el valor inicial de eta_iter y eta_iter_vec.
+            Para FF por encima de la tabla se itera con eta_iter_vec desde s = 1.5*FY.
+
+        Parameters
+        ----------
+            FF : float or array
+                Valor de la tension critica para eta = 1
+            eq : string
+                Ecuacion a usar en el calculo (ver eta)
+            nPoints : int
+                Cantidad de puntos de la tabla
+
+        Returns
+        -------
+            s : float or array
+                Tension que satisface s = FF*eta(s)
+
+        Tests
+        -----
+            >>> mat = steel(344.8,186200.0, 0.3, 4.58, 0.002)
+            >>> s = mat.solveEta(300.0)
+            >>> round(float(s), 1), round(float(300.0*mat.eta(s)), 1)
+            (189.6, 189.6)
+            >>> s = mat.solveEta([300.0, 1e6])
+            >>> bool(s[1] > 1.5*mat.FY), round(float(s[1]/(1e6*mat.eta(s[1]))), 3)
+            (True, 1.0)
+        '''
+        key = ('inverse', eq, nPoints)
+        if key not in self._tables:
+            s = np.linspace(0.0, 1.5*self.FY, nPoints)
+            self._tables[key] = (s/self.eta(s, eq= eq), s)
+        FFs, s = self._tables[key]
+        FF = np.asarray(FF, dtype= float)
+        s = np.interp(FF, FFs, s)
+        out = FF > FFs[-1]
+        if np.any(out):
+            s = np.where(out, eta_iter_vec(np.where(out, FF, FFs[-1]), self, s= 1.5*self.FY, eq= eq), s)
+        return s if s.ndim else float(s)
+
+steelDB = {}
+def getSteel(FY, E0, nu = 0.3, n = 1.0, offset = 0.0, name = ''):
+    '''Devuelve el acero registrado con estos parametros, creandolo solo la primera vez.
+
+        Todos los miembros que usan un mismo acero comparten la instancia y por lo tanto
+        sus tablas de plasticidad y mapas inversos. Un acero igual (steel.key) con otro nombre es una copia
+        con ese nombre que comparte las tablas del primero.
+
+    Parameters
+    ----------
+        FY, E0, nu, n, offset, name :
+            Ver clase steel
+
+    Returns
+    -------
+        mat : class steel
+            Acero registrado en steelDB
+
+    Tests
+    -----
+        >>> s1 = getSteel(FY= 30, E0= 27000, nu= 0.3, n= 9.7, offset= 0.002, name= 'SA409_long')
+        >>> s2 = getSteel(FY= 30, E0= 27000, nu= 0.3, n= 9.7, offset= 0.002, name= 'SA409_long')
+        >>> s1 is s2
+        True
+        >>> s3 = getSteel(FY= 30, E0= 27000, nu= 0.3, n= 9.7, offset= 0.002, name= 'otro')
+        >>> s3 is s1, s3.name, s3.key == s1.key, s3._tables is s1._tables
+        (False, 'otro', True, True)
+        >>> getSteel(FY= 30, E0= 27000, nu= 0.3, n= 9.7, offset= 0.002, name= 'otro') is s3
+        True
+    '''
+    key = (FY, E0, nu, n, offset)
+    mat = steelDB.get((key, name))
+    if mat is None:
+        shared = next((m for (k, _), m in steelDB.items() if k == key), None)
+        if shared is None:
+            mat = steel(FY, E0, nu, n, offset, name)
+        else:
+            mat = copy(shared)
+            mat.name = name
+        mat = steelDB.setdefault((key, name), mat)
+    return mat
+
 class c_w_lps_profile():
     '''Perfil C con labios de refuerzos.
 
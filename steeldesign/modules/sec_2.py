@@ -737,3 +737,165 @@ def E_2_4_2_CASES(E0, f, t, w, theta, D, ds_prima, stiff, Is, As_prima, n, Ia, k
 #########################################################################################
 #########################################################################################
 
+
+# VERSIONES VECTORIZADAS
+# Mismas ecuaciones que las funciones escalares, evaluadas sobre arrays de numpy. Los argumentos se
+# combinan con las reglas de broadcasting de numpy; los casos se resuelven con mascaras y los calculos
+# intermedios se devuelven como arrays. En CASE I de 2.4.2 esbeltez y rho son NaN (N/A en la version escalar).
+
+def sec2_2_1_vec(w, t, f, E, k = 4):
+    '''Version vectorizada de sec2_2_1.
+    Parameters
+    ----------
+        w, t, f, E, k: float or array,
+            ver sec2_2_1.
+    Returns
+    -------
+        b_eff: array,
+            ancho efectivo del elemento rigidizado bajo compresion uniforme.
+        midC: diccionario,
+            calculos intermedios {esbeltez, rho} como arrays.
+    Test
+    ----
+        >>> b, midC = sec2_2_1_vec(w= 50, t= 1, f= np.array([20, 200]), E = 200e3)
+        >>> print(np.round(b, 2), np.round(midC['rho'], 2))
+        [50.   44.22] [1.   0.88]
+    '''
+    esbeltez = (1.052/np.sqrt(k))*(np.divide(w, t))*np.sqrt(np.divide(f, E))
+    e = np.maximum(esbeltez, 0.673)     # evita divisiones por cero en la rama rho = 1
+    rho = np.where(esbeltez <= 0.673, 1.0, (1-0.22/e)/e)
+
+    b_eff = w*rho
+
+    midC = {'esbeltez': esbeltez, 'rho': rho}
+    return b_eff, midC
+
+def sec2_2_2_vec(w, t, f1, f2, E0, k = 4):
+    '''Version vectorizada de sec2_2_2.
+    Parameters
+    ----------
+        w, t, f1, f2, E0: float or array,
+            ver sec2_2_2. k se recalcula con psi = f2/f1.
+    Returns
+    -------
+        b_eff_1, b_eff_2 : array
+            longitudes de los segmentos efectivos (ver figura 2 - ASCE 8)
+        midC: dict
+            calculos intermedios {b_e, k, psi} como arrays.
+    Test
+    ----
+        Example 2.1 - C-section
+        >>> b1, b2, midC = sec2_2_2_vec(w=5.692, t=0.060, f1=np.array([47.48, 47.48]), f2=np.array([-45.77, 20.0]), E0=27000)
+        >>> print(np.round(b1, 3), np.round(b2, 3), np.round(midC['k'], 3))
+        [1.232 1.088] [2.442 1.718] [23.079  5.545]
+    '''
+    psi = np.divide(f2, f1)
+    k = 4 + 2*(1-psi)**3 + 2*(1-psi)
+    b_e, _ = sec2_2_1_vec(w=w, t=t, f=f1, E=E0, k=k)
+
+    b_eff_1 = b_e/(3-psi)
+    b_eff_2 = np.where(psi <= -0.236, b_e/2, b_e - b_eff_1)
+
+    midC = {'b_e': b_e, 'k': k, 'psi': psi}
+    return b_eff_1, b_eff_2, midC
+
+def sec2_3_1_vec(w, t, f, E, k = 0.5):
+    '''Version vectorizada de sec2_3_1.
+    Test
+    ----
+        >>> b, midC = sec2_3_1_vec(w= 50, t= 1 , f= np.array([5, 200]), E = 200e3)
+        >>> print(np.round(b, 2), np.round(midC['esbeltez'], 2))
+        [50.   19.27] [0.37 2.35]
+    '''
+    return sec2_2_1_vec(w= w, t= t, f= f, E= E, k= k)
+
+def sec2_3_2_vec(w, t, f3, E, k = 0.5):
+    '''Version vectorizada de sec2_3_2.
+    Test
+    ----
+        >>> b, midC = sec2_3_2_vec(w= 50, t= 1 , f3= np.array([5, 200]), E = 200e3)
+        >>> print(np.round(b, 2))
+        [50.   19.27]
+    '''
+    return sec2_2_1_vec(w= w, t= t, f= f3, E= E, k= k)
+
+def sec2_4_2_vec(E0, f, w, t, d, r_out, theta = 90, stiff = 'SL'):
+    '''Version vectorizada de sec2_4_2. Los tres casos se evaluan con mascaras.
+    Parameters
+    ----------
+        E0, f, w, t, d, r_out, theta: float or array,
+            ver sec2_4_2.
+        stiff: string,
+            clase de rigidizador (labio simple u otro), comun a todos los elementos.
+    Returns
+    -------
+        b: array,
+            ancho efectivo del elemento.
+        midC: diccionario,
+            calculos intermedios como arrays {S, Is, Ia, As, As_prima, ds, ds_prima, k, esbeltez, rho, CASE}.
+            CASE vale 1, 2 o 3.
+    Raises
+    ------
+        Exception : D/w > 0.8 o angulo del labio fuera de [40, 140] en algun elemento (CASE II o III)
+    Tests
+    -----
+        Ejemplos 18.1, 16.1 y CASE III de sec2_4_2 en una sola llamada
+        >>> b, midC = sec2_4_2_vec(E0=27000, f=np.array([23.52, 19.92, 150.0]), w=np.array([1.855, 2.914, 3.0]), t=np.array([0.135, 0.105, 0.135]), d=np.array([0.498, 0.607, 0.498]), r_out=3/16+np.array([0.135, 0.105, 0.135]))
+        >>> print(np.round(b, 5), midC['CASE'])
+        [1.855   2.914   1.76703] [1 2 3]
+        >>> print(np.round(midC['Ia'], 6), np.round(midC['k'], 5))
+        [0.       0.000863 0.051089] [0.5     3.70659 1.46826]
+    '''
+    E0, f, w, t, d, r_out, theta = np.broadcast_arrays(*[np.asarray(x, dtype= float) for x in (E0, f, w, t, d, r_out, theta)])
+
+    with np.errstate(divide= 'ignore'):
+        S = 1.28*np.sqrt(E0/f)      # Ec 2.4-1 (f = 0 -> S = inf -> CASE I)
+    theta_r = theta*pi/180
+    Is = d**3*t*np.sin(theta_r)/12  # Ec 2.4-2
+    ds_prima, _ = sec2_3_1_vec(w= d, t= t, f= f, E= E0)
+    As_prima = ds_prima*t           # Ec 2.4-3
+
+    D = d + r_out*(1 - np.cos(theta_r))/np.sin(theta_r)
+    if np.any(D/w > 0.8):
+        print('No se cumple la condicion D/w < 0.8')
+        raise Exception('>> Analisis abortado <<')
+
+    wt = w/t
+    caseI = wt <= S/3       # Ec 2.4.2-1
+    caseIII = wt >= S
+    caseII = ~caseI & ~caseIII
+    CASE = np.where(caseI, 1, np.where(caseII, 2, 3))
+
+    # CASE II: Ec 2.4.2-6 | CASE III: Ec 2.4.2-13
+    k_u = 0.43
+    n = np.where(caseII, 0.5, 1/3)
+    Ia = np.where(caseII, t**4*399*(wt/S - (k_u/4)**0.5)**3, t**4*(115*wt/S + 5))
+    Ia = np.where(caseI, 0.0, Ia)
+
+    C2 = np.minimum(Is/np.where(caseI, 1.0, Ia), 1.0)  # Ec 2.4.2-7
+    if stiff == 'SL':
+        if np.any(~caseI & ((theta > 140) | (theta < 40))):
+            print('Rigidizador de labio simple no cumple las condiciones para aplicar Ec 2.4.2-10 y Ec 2.4.2-11')
+            raise Exception('>> Analisis abortado <<')
+        k_a = np.minimum(5.25 - 5.0*(D/w), 4.0)    # Ec 2.4.2-10
+        ds = C2*ds_prima
+        As = ds*t
+    else:
+        k_a = np.full_like(w, 4.0)
+        As = C2*As_prima
+        ds = As/t
+
+    k = C2**n*(k_a - k_u) + k_u     # Ec 2.4.2-9
+    k = np.where(caseI, 0.5, k)
+    b, midC = sec2_2_1_vec(w= w, t= t, f= f, E= E0, k= k)
+
+    # CASE I: elemento totalmente efectivo
+    b = np.where(caseI, w, b)
+    ds = np.where(caseI, ds_prima, ds)
+    As = np.where(caseI, As_prima, As)
+    esbeltez = np.where(caseI, np.nan, midC['esbeltez'])
+    rho = np.where(caseI, np.nan, midC['rho'])
+
+    midC = {'S': S, 'Is': Is, 'Ia': Ia, 'As': As, 'As_prima': As_prima, 'ds': ds, 'ds_prima': ds_prima,
+            'k': k, 'esbeltez': esbeltez, 'rho': rho, 'CASE': CASE}
+    return b, midC
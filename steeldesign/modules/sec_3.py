@@ -34,7 +34,7 @@ def sec3_2(An, FY):
 
 ## 3.3 Flexural Memebers
 ## 3.3.1 Strength for Bending Only
-def sec3_3_1_1(FY, Se, procedure = 'PI', comp_flange = 'UNSTIFF', localDistorsion= False):
+def sec3_3_1_1(FY, Se, procedure = 'PI', comp_flange = 'UNSTIFF', localDistorsion= False, Mcu = None):
     '''Strength for Bending Only. Nominal Section Strength.
     Parameters
     ----------
@@ -46,6 +46,8 @@ def sec3_3_1_1(FY, Se, procedure = 'PI', comp_flange = 'UNSTIFF', localDistorsio
             especifica el procedimiento a implementar (Opciones: PI - PII - LD).
         comp_flange: string;
             determina si las alas en compresion estan rigidizadas o no.
+        Mcu: float,
+            momento que produce la deformacion maxima de compresion Cy*ey (Procedimiento II, ver fiber.fiberSection).
     Returns
     -------
         Mn: float,
@@ -61,6 +63,9 @@ def sec3_3_1_1(FY, Se, procedure = 'PI', comp_flange = 'UNSTIFF', localDistorsio
         >>> fiMn, _ = sec3_3_1_1(FY=50, Se=1.422, procedure = 'PI', comp_flange = 'UNSTIFF')
         >>> round(fiMn, 2)
         60.43
+        >>> fiMn, _ = sec3_3_1_1(FY=50, Se=1.422, procedure = 'PII', comp_flange = 'UNSTIFF', Mcu= 80.0)
+        >>> round(fiMn, 2)
+        68.0
     '''
     midC={}
     if comp_flange == 'UNSTIFF':    # Unstiffened compresion flanges
@@ -70,9 +75,11 @@ def sec3_3_1_1(FY, Se, procedure = 'PI', comp_flange = 'UNSTIFF', localDistorsio
 
     if procedure == 'PI':    # Procedimiento I - basado en fluencia
         Mn = E_3_3_1_1_e1(Se=Se, FY=FY)
-    elif procedure == 'PII':    # Procedimiento II - basado en endurecimiento 
-        print('Seccion 3.3.1.1 - Procedimiento II No implementada.')
-        raise NotImplementedError
+    elif procedure == 'PII':    # Procedimiento II - basado en la reserva inelastica
+        if Mcu is None:
+            print('Seccion 3.3.1.1 - Procedimiento II: se requiere el momento Mcu de la deformacion maxima de compresion.')
+            raise Exception('>> Analisis abortado <<')
+        Mn = E_3_3_1_1_e2(Se=Se, FY=FY, Mcu=Mcu)
 
     if localDistorsion:     # Local Distorsion Considerations
         Mld, midC = LocalDistorsion()
@@ -298,6 +305,69 @@ def E_3_3_1_1_e1(Se, FY):
     Mn = Se*FY
     return Mn
 
+def E_3_3_1_1_e2(Se, FY, Mcu):
+    '''Nominal Section Strength. Procedure II. Based on Inelastic Reserve Capacity.
+    Parameters
+    ----------
+        Se: float,
+            modulo de seccion elastico efectivo segun el Procedimiento I.
+        FY: float,
+            tension de fluencia segun Tabla A1 - ASCE 8.
+        Mcu: float,
+            momento que produce la deformacion maxima de compresion Cy*ey.
+    Returns
+    -------
+        Mn: float,
+            resistencia nominal a la flexion, Mcu <= 1.25*Se*FY.
+    Raises
+    ------
+        none
+    Tests
+    -----
+        >>> round(E_3_3_1_1_e2(Se=2.239, FY=50, Mcu= 150.0), 2)
+        139.94
+    '''
+    Mn = min(Mcu, 1.25*Se*FY)
+    return Mn
+
+def E_3_3_1_1_Cy(w, t, FY, E0, element = 'STIFF'):
+    '''Factor de deformacion de compresion Cy del Procedimiento II.
+    Parameters
+    ----------
+        w: float,
+            ancho plano del elemento a compresion.
+        t: float,
+            espesor del elemento.
+        FY: float,
+            tension de fluencia.
+        E0: float,
+            modulo de elasticidad inicial.
+        element: string,
+            'STIFF': rigidizado sin rigidizadores intermedios | 'UNSTIFF': no rigidizado |
+            'EDGE': con rigidizador de borde o con rigidizadores intermedios
+    Returns
+    -------
+        Cy: float,
+            factor de la deformacion maxima de compresion Cy*ey.
+        midC: diccionario,
+            lambda_1, lambda_2 (limites de esbeltez w/t).
+    Raises
+    ------
+        none
+    Tests
+    -----
+        >>> Cy, midC = E_3_3_1_1_Cy(w= 27.0, t= 1.0, FY= 50.0, E0= 27000.0)
+        >>> round(Cy, 3), round(midC['lambda_1'], 2), round(midC['lambda_2'], 2)
+        (2.389, 25.79, 29.74)
+    '''
+    lambda_1 = 1.11/(FY/E0)**0.5
+    lambda_2 = 1.28/(FY/E0)**0.5
+    if element == 'STIFF':
+        Cy = min(max(3 - 2*(w/t - lambda_1)/(lambda_2 - lambda_1), 1.0), 3.0)
+    else:
+        Cy = 1.0
+    return Cy, {'lambda_1': lambda_1, 'lambda_2': lambda_2}
+
 
 def E_3_3_1_2_e1(Sc, Mc, Sf):
     '''Lateral Buckling Strength. Strength of laterally unbraced segments.
@@ -603,76 +673,103 @@ def E_3_3_3_e2(fiMn, fiVn, Mu, Vu):
     ratio = comb/limit
     return ratio
 
-""" 
 ## 3.3.4 Web Crippling Strength
-def sec3_3_4(member):
-    '''Web Crippling Strength.
+def sec3_3_4(FY, t, h, R, N, reaction = 'end', opposing = False, webs = 'single', flange = 'STIFF', theta = 90, units = 'SI'):
+    '''Web Crippling Strength. Tabla 3.3.4-1.
+
+        Las ecuaciones se evaluan elemento a elemento: N, reaction y opposing pueden ser arrays (uno por apoyo
+        o carga concentrada) y se resuelven todos en una sola llamada.
+
     Parameters
     ----------
-        
+        FY: float,
+            tension de fluencia.
+        t: float,
+            espesor del alma.
+        h: float,
+            altura plana del alma.
+        R: float,
+            radio interior de plegado.
+        N: float or array,
+            longitud de apoyo.
+        reaction: string or array of string,
+            'end' reaccion extrema o 'interior' reaccion/carga interior.
+        opposing: bool or array of bool,
+            True si hay cargas opuestas separadas menos de 1.5h (Ec 3.3.4-6 a 3.3.4-9).
+        webs: string,
+            'single' perfiles de alma simple (fi = 0.70) o 'I' secciones I o similares (fi = 0.80).
+        flange: string,
+            'STIFF' alas rigidizadas o parcialmente rigidizadas, 'UNSTIFF' alas no rigidizadas (alma simple).
+        theta: float,
+            angulo entre el plano del alma y la superficie de apoyo, en grados.
+        units: string,
+            'SI' (N, mm, MPa) o 'US' (kips, in, ksi).
     Returns
     -------
-        
+        fiPn: float or array,
+            resistencia de diseno a la abolladura del alma.
+        midC: diccionario,
+            Pn: resistencia nominal, fi: factor de resistencia, C1..C8, C_theta, k y m: coeficientes.
+            inRange: True si N/t <= 210 y N/h <= 3.5.
     Raises
     ------
         none
     Tests
     -----
-        >>> 
+        >>> fiPn, midC = sec3_3_4(FY= 30.0, t= 0.135, h= 7.415, R= 0.1875, N= [3.5, 3.5], reaction= ['end', 'interior'], units= 'US')
+        >>> [round(float(P), 2) for P in fiPn], midC['fi']
+        ([4.21, 6.79], 0.7)
     '''
-    steel = member.steel
-    profile = member.profile
-
-    # Parametros
+    N = np.asarray(N, dtype= float)
+    interior = np.asarray(reaction) == 'interior'
+    opposing = np.asarray(opposing, dtype= bool)
 
-    fi = 0.70
-
-    FY = steel.FY
-    h = profile.H - 2*profile.r_out
-    t = profile.t
-
-    ct = Ct(units='US')
-    k = FY/33/ct
-    m = E_3_3_4_e22(t= t, units='US')
-
-    # N = 
-    R = profile.r_out - t
-    # theta = 
+    ct = Ct(units= units)
+    k = E_3_3_4_e21(FY= FY, Ct= ct)
+    m = E_3_3_4_e22(t= t, units= units)
 
     # Calculo de coeficientes
-    C1 = E_3_3_4_e10(FY=FY, Ct=Ct, k=k)
-    C2 = E_3_3_4_e11(R=R, t=t)
-    C3 = E_3_3_4_e12(FY=FY, Ct=Ct, k=k)
-    C4 = E_3_3_4_e13(R=R, t=t)
-    C5 = E_3_3_4_e14(k=k)
-    C6 = E_3_3_4_e15(h=h, t=t)
-    C7 = E_3_3_4_e17(h=h, t=t, k=k)
-    C8 = E_3_3_4_e19(h=h, t=t, k=k)
-    C_theta = E_3_3_4_e20(theta=theta)
-
-    ## Shapes Having Single Webs
-        # Stiffened or Partially Stiffened Flenges
-            # End Reaction
-    E_3_3_4_e1(t, C3, C4, Ctheta, h, N, Ct)
-            # Interior Reaction
-    E_3_3_4_e4(t, C1, C2, Ctheta, h, N, Ct)
-
-       # Unstiffened Flanges
-            # End Reaction
-    E_3_3_4_e2(t, C3, C4, Ctheta, h, N, Ct)
-            # Interior Reaction
-    E_3_3_4_e4(t, C1, C2, Ctheta, h, N, Ct)
-
-    ## I-sections or Similar Sections
-        # Stiffened, Partially Stiffened and Unstiffened Flanges
-            # End Reaction
-    E_3_3_4_e3(N, t, FY, C6)
-            # Interior Reaction
-    E_3_3_4_e5(N, t, FY, C5, m)
+    C1 = E_3_3_4_e10(FY= FY, Ct= ct, k= k)
+    C2 = E_3_3_4_e11(R= R, t= t)
+    C3 = E_3_3_4_e12(FY= FY, Ct= ct, k= k)
+    C4 = E_3_3_4_e13(R= R, t= t)
+    C5 = E_3_3_4_e14(k= k)
+    C6 = E_3_3_4_e15(h= h, t= t)
+    C7 = E_3_3_4_e17(h= h, t= t, k= k)
+    C8 = E_3_3_4_e19(h= h, t= t, k= k)
+    C_theta = E_3_3_4_e20(theta= theta)
+
+    if webs == 'single':
+        ## Shapes Having Single Webs
+        fi = 0.70
+        if flange == 'STIFF':   # Stiffened or Partially Stiffened Flanges
+            end = E_3_3_4_e1(t= t, C3= C3, C4= C4, Ctheta= C_theta, h= h, N= N, Ct= ct)
+        else:                   # Unstiffened Flanges
+            end = E_3_3_4_e2(t= t, C3= C3, C4= C4, Ctheta= C_theta, h= h, N= N, Ct= ct)
+        inter = E_3_3_4_e4(t= t, C1= C1, C2= C2, Ctheta= C_theta, h= h, N= N, Ct= ct)
+        end_op = E_3_3_4_e6(t= t, C3= C3, C4= C4, Ctheta= C_theta, h= h, N= N, Ct= ct)
+        inter_op = E_3_3_4_e8(t= t, C1= C1, C2= C2, Ctheta= C_theta, h= h, N= N, Ct= ct)
+    elif webs == 'I':
+        ## I-sections or Similar Sections
+        fi = 0.80
+        end = E_3_3_4_e3(N= N, t= t, FY= FY, C6= C6)
+        inter = E_3_3_4_e5(N= N, t= t, FY= FY, C5= C5, m= m)
+        end_op = E_3_3_4_e7(N= N, t= t, FY= FY, C8= C8, m= m)
+        inter_op = E_3_3_4_e9(N= N, t= t, FY= FY, C7= C7, m= m)
+    else:
+        print('Seccion 3.3.4 - tipo de alma', webs, 'no reconocido (single o I).')
+        raise Exception('>> Analisis abortado <<')
+
+    Pn = np.where(opposing, np.where(interior, inter_op, end_op), np.where(interior, inter, end))
+    if Pn.ndim == 0: Pn = float(Pn)
+    fiPn = fi*Pn
 
+    midC = {'Pn': Pn, 'fi': fi, 'C1': C1, 'C2': C2, 'C3': C3, 'C4': C4, 'C5': C5, 'C6': C6, 'C7': C7, 'C8': C8,
+            'C_theta': C_theta, 'k': k, 'm': m, 'inRange': (N/t <= 210) & (N/h <= 3.5)}
+    return fiPn, midC
 
 def E_3_3_4_e1(t, C3, C4, Ctheta, h, N, Ct):
-    '''Ecuacion 3.3.4-1.
+    '''Ecuacion 3.3.4-1. Alma simple, alas rigidizadas, reaccion extrema.
     Parameters
     ----------
         
@@ -690,7 +787,7 @@ def E_3_3_4_e1(t, C3, C4, Ctheta, h, N, Ct):
     return f1*f2*f3*Ct
 
 def E_3_3_4_e2(t, C3, C4, Ctheta, h, N, Ct):
-    '''Ecuacion 3.3.4-2.
+    '''Ecuacion 3.3.4-2. Alma simple, alas no rigidizadas, reaccion extrema.
     Parameters
     ----------
         
@@ -708,7 +805,7 @@ def E_3_3_4_e2(t, C3, C4, Ctheta, h, N, Ct):
     return f1*f2*f3*Ct
 
 def E_3_3_4_e3(N, t, FY, C6):
-    '''Ecuacion 3.3.4-3.
+    '''Ecuacion 3.3.4-3. Seccion I, reaccion extrema.
     Parameters
     ----------
         
@@ -726,7 +823,7 @@ def E_3_3_4_e3(N, t, FY, C6):
     return f1*f2*f3
 
 def E_3_3_4_e4(t, C1, C2, Ctheta, h, N, Ct):
-    '''Ecuacion 3.3.4-4.
+    '''Ecuacion 3.3.4-4. Alma simple, reaccion interior.
     Parameters
     ----------
         
@@ -744,7 +841,7 @@ def E_3_3_4_e4(t, C1, C2, Ctheta, h, N, Ct):
     return f1*f2*f3*Ct
 
 def E_3_3_4_e5(N, t, FY, C5, m):
-    '''Ecuacion 3.3.4-5.
+    '''Ecuacion 3.3.4-5. Seccion I, reaccion interior.
     Parameters
     ----------
         
@@ -763,7 +860,7 @@ def E_3_3_4_e5(N, t, FY, C5, m):
     return f1*f2*f3*f4
 
 def E_3_3_4_e6(t, C3, C4, Ctheta, h, N, Ct):
-    '''Ecuacion 3.3.4-6.
+    '''Ecuacion 3.3.4-6. Alma simple, reaccion extrema con cargas opuestas a menos de 1.5h.
     Parameters
     ----------
         
@@ -780,8 +877,8 @@ def E_3_3_4_e6(t, C3, C4, Ctheta, h, N, Ct):
 
     return f1*f2*f3*Ct
 
-def E_3_3_4_e7(t, C3, C4, Ctheta, h, N, Ct):
-    '''Ecuacion 3.3.4-7.
+def E_3_3_4_e7(N, t, FY, C8, m):
+    '''Ecuacion 3.3.4-7. Seccion I, reaccion extrema con cargas opuestas a menos de 1.5h.
     Parameters
     ----------
         
@@ -799,7 +896,7 @@ def E_3_3_4_e7(t, C3, C4, Ctheta, h, N, Ct):
     return f1*f2*f3
 
 def E_3_3_4_e8(t, C1, C2, Ctheta, h, N, Ct):
-    '''Ecuacion 3.3.4-8.
+    '''Ecuacion 3.3.4-8. Alma simple, reaccion interior con cargas opuestas a menos de 1.5h.
     Parameters
     ----------
         
@@ -816,8 +913,8 @@ def E_3_3_4_e8(t, C1, C2, Ctheta, h, N, Ct):
 
     return f1*f2*f3*Ct
 
-def E_3_3_4_e9(t, C3, C4, Ctheta, h, N, Ct):
-    '''Ecuacion 3.3.4-9.
+def E_3_3_4_e9(N, t, FY, C7, m):
+    '''Ecuacion 3.3.4-9. Seccion I, reaccion interior con cargas opuestas a menos de 1.5h.
     Parameters
     ----------
         
@@ -832,7 +929,7 @@ def E_3_3_4_e9(t, C3, C4, Ctheta, h, N, Ct):
     f2 = 0.82 - 0.15*m
     f3 = 15 + 3.25*(N/t)**0.5
 
-    return f1*f2*f3 """
+    return f1*f2*f3
 
 def Ct(units = 'SI'):
     '''Ct.
@@ -916,6 +1013,7 @@ def E_3_3_4_e13(R, t):
         none        
     '''
     C4 = (1.15 - 0.15*R/t)
+    if C4 > 1: C4 = 1.0
     if C4 < 0.5: C4 = 0.5
     return C4
 
@@ -1316,7 +1414,7 @@ def E_3_5_e3(Pu, fiPn, Mu_x, Mu_y, fiMn_x, fiMn_y):
     return Pu/fiPn + Mu_x/fiMn_x + Mu_y/fiMn_y
 
 def E_3_5_e4(Pu, Pe):
-    '''Magnification factor.
+    '''Magnification factor. Ecuacion 3.5-4: alpha_n = 1 - Pu/Pe. El momento amplificado es Mu/alpha_n.
     Parameters
     ---------- 
         Pu: float,
@@ -1326,13 +1424,13 @@ def E_3_5_e4(Pu, Pe):
     Returns
     -------
         alpha_n: float,
-            factor de amplificacion.
+            factor de amplificacion (divide al momento requerido en Ec 3.5-1).
     Tests
     -----
-        >>> round(E_3_5_e4(Pu=15, Pe=20), 1)
-        4.0
+        >>> round(E_3_5_e4(Pu=15, Pe=20), 2)
+        0.25
     '''
-    return 1/(1 - Pu/Pe)
+    return 1 - Pu/Pe
 
 def E_3_5_e5(E0, Kb, Lb, Ib):
     '''Elastic Buckling Strength.
@@ -0,0 +1,155 @@
+'''Deformaciones de miembros a flexion para cargas de servicio.
+
+    Los anchos efectivos para el calculo de deformaciones (secciones 2.2 a 2.4, deflection determination) se
+    obtienen con las mismas ecuaciones que para la resistencia, con la tension de servicio fd en lugar de f. La
+    inercia efectiva Ie depende de fd y fd = Ms/Se(fd) depende de Ie, por lo que fd se obtiene iterando para cada
+    nivel de carga. Luego la flecha se calcula con el modulo secante Es (Eq B-1), promedio de los de las alas
+    comprimida y traccionada:
+
+        delta = K*Ms*L**2/(Es*Ie)
+
+    con Ms el momento maximo de servicio y K el coeficiente del esquema de carga (DEFLECTION_COEFF).
+
+    Functions
+    ---------
+        serviceStress(Ms, curve, FY) :
+            Tension de servicio fd en el ala comprimida para cada momento Ms.
+        deflection(analysis, Ms, L, load) :
+            Flecha del miembro para cada momento de servicio Ms.
+
+    Tests
+    -----
+        >>> class c:
+        ...     f = np.linspace(0.0, 100.0, 11)
+        ...     def __call__(self, f): return 10.0 - 0.01*np.asarray(f)
+        >>> fd, midC = serviceStress([0.0, 475.0, 736.0], c(), FY= 100.0)
+        >>> np.round(fd, 6).tolist(), midC['converged'].tolist()
+        ([0.0, 50.0, 80.0], [True, True, True])
+'''
+
+import numpy as np
+
+# coeficiente K de delta = K*Ms*L**2/(E*I) segun el esquema de carga
+DEFLECTION_COEFF = {'uniform': 5/48,            # simplemente apoyada, carga uniforme
+                    'point': 1/12,              # simplemente apoyada, carga puntual en el centro
+                    'moment': 1/8,              # simplemente apoyada, momento uniforme
+                    'cantilever_uniform': 1/4,  # voladizo, carga uniforme
+                    'cantilever_point': 1/3}    # voladizo, carga puntual en el extremo
+
+
+def serviceStress(Ms, curve, FY, f0 = None, tol = 1e-6, maxIter = 50):
+    '''Tension de servicio fd en el ala comprimida: fd*Se(fd) - |Ms| = 0 en [0, FY] para cada momento, con secante
+    y biseccion de resguardo sobre todos los niveles de carga a la vez.
+
+    Por defecto cada nivel parte (arranque en caliente) de la inversa de M(f) = f*Se(f) tabulada en los nodos de la
+    curva, por lo que en general converge en una o dos iteraciones.
+
+    Parameters
+    ----------
+        Ms : float or array
+            Momentos de servicio
+        curve : class SeCurve
+            Curva Se(f) del perfil (ASCE_8_02.s3_Se_curve)
+        FY : float
+            Tension de fluencia, cota superior de fd
+        f0 : float or array
+            Tensiones iniciales (e.g. solucion de una historia de carga anterior)
+        tol : float
+            Tolerancia relativa en el residuo de momento
+        maxIter : int
+            Numero maximo de iteraciones
+    Returns
+    -------
+        fd : array
+            Tension de servicio en el ala comprimida (FY si Ms supera el momento de primera fluencia)
+        midC : dict
+            {'nIter', 'converged', 'yielded'} como arrays
+    '''
+    Ms = np.abs(np.asarray(Ms, dtype= float))
+    fGrid = curve.f[curve.f <= FY]
+    MGrid = fGrid*curve(fGrid)
+    My = FY*curve(FY)
+    if f0 is None:
+        f0 = np.interp(Ms, MGrid, fGrid, right= FY)
+    x = np.clip(np.broadcast_to(np.asarray(f0, dtype= float), Ms.shape), 0.0, FY)
+
+    yielded = Ms >= My
+    lo = np.zeros(Ms.shape)
+    hi = np.full(Ms.shape, float(FY))
+    xPrev = np.full(Ms.shape, np.nan)
+    rPrev = np.full(Ms.shape, np.nan)
+    nIter = np.zeros(Ms.shape, dtype= int)
+    active = ~yielded & (Ms > 0)
+    converged = ~active
+    x = np.where(yielded, FY, np.where(Ms > 0, x, 0.0))
+    while active.any() and nIter.max() < maxIter:
+        r = x*curve(x) - Ms
+        nIter = nIter + active
+        lo = np.where(active & (r < 0), x, lo)
+        hi = np.where(active & (r >= 0), x, hi)
+        done = np.abs(r) <= tol*Ms
+        converged = converged | (active & done)
+        active = active & ~done
+
+        secant = ~np.isnan(xPrev) & (r != rPrev)
+        with np.errstate(divide= 'ignore', invalid= 'ignore'):
+            xNew = np.where(secant, x - r*(x - xPrev)/(r - rPrev), x - r/curve(x))
+        xNew = np.where((lo < xNew) & (xNew < hi), xNew, 0.5*(lo + hi))
+        xPrev, rPrev = np.where(active, x, xPrev), np.where(active, r, rPrev)
+        x = np.where(active, xNew, x)
+    if active.any():
+        print('serviceStress: se alcanzo el numero maximo de iteraciones en', int(active.sum()), 'niveles de carga')
+    if yielded.any():
+        print('Advertencia: en', int(yielded.sum()), 'niveles de carga Ms supera el momento de primera fluencia FY*Se =', My)
+    return x, {'nIter': nIter, 'converged': converged, 'yielded': yielded}
+
+def deflection(analysis, Ms, L, load = 'uniform', f0 = None, tol = 1e-6, maxIter = 50, nPoints = 51):
+    '''Flecha de un miembro a flexion respecto de x para cada momento de servicio Ms.
+
+    Parameters
+    ----------
+        analysis : class ASCE_8_02
+            Analisis del miembro, se usa su curva s3_Se_curve
+        Ms : float or array
+            Momentos maximos de servicio
+        L : float
+            Luz del miembro
+        load : string or float
+            Esquema de carga (clave de DEFLECTION_COEFF) o coeficiente K
+        f0, tol, maxIter :
+            ver serviceStress
+        nPoints : int
+            Puntos de la curva Se(f)
+    Returns
+    -------
+        delta : array
+            Flecha de cada nivel de carga
+        midC : dict
+            {'K', 'fd', 'ft', 'Ie', 'Es', 'nIter', 'converged', 'yielded'}
+    Raises
+    ------
+        Exception : si no se reconoce el esquema de carga
+    '''
+    if isinstance(load, str):
+        if load not in DEFLECTION_COEFF:
+            print('Esquema de carga', load, 'no reconocido. Valores admitidos:', list(DEFLECTION_COEFF), 'o un coeficiente K')
+            raise Exception('>> Analisis abortado <<')
+        K = DEFLECTION_COEFF[load]
+    else:
+        K = float(load)
+    profile = analysis.member.profile
+    steel = analysis.member.steel
+
+    curve = analysis.s3_Se_curve(nPoints= nPoints)
+    Ms = np.abs(np.asarray(Ms, dtype= float))
+    fd, midC = serviceStress(Ms, curve, steel.FY, f0= f0, tol= tol, maxIter= maxIter)
+
+    # fibras extremas desde el eje neutro efectivo: yMAX (comprimida) y H - yMAX (traccionada)
+    yMAX = profile.H/2 + curve.y(fd)
+    Ie = curve.Ix(fd)
+    ft = fd*(profile.H - yMAX)/yMAX
+    Es = 0.5*(steel.Es(fd) + steel.Es(ft))
+
+    delta = K*Ms*L**2/(Es*Ie)
+    midC.update({'K': K, 'fd': fd, 'ft': ft, 'Ie': Ie, 'Es': Es})
+    return delta, midC